@@ -0,0 +1,42 @@
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import user_cache
+from .models import USER_CLAIMS, ClaimsUser
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWT authentication without a user query per request.
+
+    Access tokens issued at login carry the username and ``is_active``
+    as of login, and ``request.user`` is a ``ClaimsUser`` built from them.
+    A deactivated user keeps access until the token expires, like any
+    stateless token. Tokens issued without these claims fall back to the
+    per-process user cache.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        if all(name in validated_token for name in USER_CLAIMS):
+            user = ClaimsUser.from_claims(user_id, validated_token)
+        else:
+            user = user_cache.get(user_id)
+            if user is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    target_class = "apps.authentication.authentication.ClaimsJWTAuthentication"
@@ -0,0 +1,46 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+from django.db.models.functions import Lower
+
+
+def normalize_email(email):
+    """Emails are stored and compared lower-cased"""
+    return email.strip().lower()
+
+
+def find_user_by_email(email):
+    """The user with this email in any case, or None.
+
+    Filters on ``LOWER(email)`` and non-blank emails to match the unique
+    partial index ``auth_user_email_ci_uniq`` exactly, so the lookup is a
+    single index probe.
+    """
+    email = normalize_email(email)
+    if not email:
+        return None
+    return (
+        User.objects.annotate(email_lower=Lower("email"))
+        .filter(email_lower=email, email__gt="")
+        .first()
+    )
+
+
+class EmailBackend(ModelBackend):
+    """Authenticate with an email address and password.
+
+    Unknown emails still run the password hasher once, so they cost as
+    much as a wrong password and response times do not reveal which
+    emails are registered. Hashes made with an outdated work factor are
+    upgraded by ``check_password`` on a successful login.
+    """
+
+    def authenticate(self, request, email=None, password=None, **kwargs):
+        if email is None or password is None:
+            return None
+        user = find_user_by_email(email)
+        if user is None:
+            User().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
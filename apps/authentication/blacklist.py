@@ -0,0 +1,100 @@
+"""Revoked refresh tokens
+
+Only the JTI and expiry of logged out refresh tokens are stored, in
+``RevokedToken``; tokens that were never revoked leave no row behind.
+Rows are useless once the token has expired, and ``purge_revoked_tokens``
+deletes them in batches.
+
+Revocation is permanent, so every JTI seen revoked is remembered in
+process memory until the token expires and replays of a revoked token
+skip the database. Tokens not known to be revoked are always checked
+against the table, so a token revoked by another worker is refused
+immediately.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.utils import timezone as django_timezone
+
+from .models import RevokedToken
+
+PURGE_BATCH_SIZE = 1000
+REVOKED_CACHE_MAX_SIZE = 100000
+
+
+class RevokedTokenCache:
+    """JTIs known to be revoked, with their expiry as a UNIX timestamp"""
+
+    def __init__(self, max_size=REVOKED_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def __contains__(self, jti):
+        expires = self.entries.get(jti)
+        return expires is not None and expires > time.time()
+
+    def add(self, jti, expires):
+        with self.lock:
+            if len(self.entries) >= self.max_size:
+                now = time.time()
+                self.entries = {
+                    key: value for key, value in self.entries.items() if value > now
+                }
+                while len(self.entries) >= self.max_size:
+                    del self.entries[next(iter(self.entries))]
+            self.entries[jti] = expires
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+
+
+revoked_cache = RevokedTokenCache()
+
+
+def is_revoked(jti, expires):
+    """Whether the token with this JTI and ``exp`` claim was revoked"""
+    if jti in revoked_cache:
+        return True
+    if RevokedToken.objects.filter(jti=jti).exists():
+        revoked_cache.add(jti, expires)
+        return True
+    return False
+
+
+def revoke(jti, expires):
+    """Revoke the token with this JTI until its ``exp`` claim"""
+    if expires <= time.time():
+        return
+    RevokedToken.objects.bulk_create(
+        [
+            RevokedToken(
+                jti=jti, expires_at=datetime.fromtimestamp(expires, tz=timezone.utc)
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    revoked_cache.add(jti, expires)
+
+
+def purge_expired(batch_size=PURGE_BATCH_SIZE, now=None):
+    """Delete expired revocations in batches, returning how many were deleted.
+
+    Each batch is a separate short DELETE by primary key, so the purge
+    never holds locks on a large part of the table.
+    """
+    now = now or django_timezone.now()
+    deleted = 0
+    while True:
+        batch = list(
+            RevokedToken.objects.filter(expires_at__lte=now).values_list(
+                "jti", flat=True
+            )[:batch_size]
+        )
+        if batch:
+            deleted += RevokedToken.objects.filter(jti__in=batch).delete()[0]
+        if len(batch) < batch_size:
+            return deleted
@@ -0,0 +1,66 @@
+"""Short-lived per-process cache of user rows
+
+Authenticated requests are served from the access token claims, so the
+full ``User`` row is only needed by the few views that read more than its
+id. Those lookups are cached for ``USER_CACHE_TIMEOUT`` seconds in each
+worker process. Saving or deleting a user drops the local entry; other
+processes see the change once their entry expires.
+"""
+
+import copy
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+
+USER_CACHE_TIMEOUT = 60
+USER_CACHE_MAX_SIZE = 10000
+
+
+class UserCache:
+    def __init__(self, max_size=USER_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    @property
+    def timeout(self):
+        return getattr(settings, "USER_CACHE_TIMEOUT", USER_CACHE_TIMEOUT)
+
+    def get(self, user_id):
+        """A private copy of the user with this id, or None if it does not exist"""
+        # Token claims carry the id as a string
+        user_id = User._meta.pk.to_python(user_id)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            return copy.copy(entry[1])
+
+        user = User.objects.filter(pk=user_id).first()
+        if user is not None and self.timeout > 0:
+            with self.lock:
+                if len(self.entries) >= self.max_size:
+                    self.evict(now)
+                self.entries[user_id] = (now + self.timeout, copy.copy(user))
+        return user
+
+    def evict(self, now):
+        # Expired entries first, then the oldest insertions
+        self.entries = {
+            key: entry for key, entry in self.entries.items() if entry[0] > now
+        }
+        while len(self.entries) >= self.max_size:
+            del self.entries[next(iter(self.entries))]
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+
+
+user_cache = UserCache()
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with its work factor taken from settings.
+
+    Keeps the ``pbkdf2_sha256`` algorithm name so existing hashes verify
+    unchanged. ``must_update`` compares the stored iteration count with
+    ``PASSWORD_HASHER_ITERATIONS``, so a changed work factor is applied to
+    each password on its next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return (
+            getattr(settings, "PASSWORD_HASHER_ITERATIONS", None)
+            or PBKDF2PasswordHasher.iterations
+        )
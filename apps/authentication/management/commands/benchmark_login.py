@@ -0,0 +1,83 @@
+import time
+
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import get_hasher
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+BENCHMARK_EMAIL = "benchmark-login@example.com"
+BENCHMARK_PASSWORD = "BenchmarkLogin123!"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure logins per second of one core for known and unknown emails "
+        "with the configured password hasher"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=20,
+            help="Measured logins per case",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            help="Hasher work factor to benchmark instead of "
+            "PASSWORD_HASHER_ITERATIONS",
+        )
+
+    def handle(self, *args, **options):
+        if options["count"] < 1:
+            raise CommandError("--count must be at least 1")
+        overrides = {}
+        if options["iterations"] is not None:
+            if options["iterations"] < 1:
+                raise CommandError("--iterations must be at least 1")
+            overrides["PASSWORD_HASHER_ITERATIONS"] = options["iterations"]
+
+        with override_settings(**overrides):
+            hasher = get_hasher()
+            with transaction.atomic():
+                results = self.measure(options["count"])
+                transaction.set_rollback(True)
+
+        for case, seconds in results.items():
+            self.stdout.write(
+                f"{case:<16} {options['count'] / seconds:8.1f} logins/s "
+                f"{seconds / options['count'] * 1000:8.2f} ms/login"
+            )
+        ratio = results["unknown email"] / results["known email"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{hasher.algorithm} with {hasher.iterations} iterations, "
+                f"unknown/known time ratio {ratio:.2f}"
+            )
+        )
+
+    def measure(self, count):
+        """Seconds taken by ``count`` logins per case, in a single thread"""
+        User.objects.create_user(
+            username="benchmark-login",
+            email=BENCHMARK_EMAIL,
+            password=BENCHMARK_PASSWORD,
+        )
+        cases = {
+            "known email": BENCHMARK_EMAIL,
+            "unknown email": "benchmark-missing@example.com",
+        }
+        # Warm up the connection and hasher before timing
+        for email in cases.values():
+            authenticate(None, email=email, password=BENCHMARK_PASSWORD)
+
+        results = {}
+        for case, email in cases.items():
+            started = time.perf_counter()
+            for _ in range(count):
+                authenticate(None, email=email, password=BENCHMARK_PASSWORD)
+            results[case] = time.perf_counter() - started
+        return results
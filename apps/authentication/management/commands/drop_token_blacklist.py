@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.migrations.recorder import MigrationRecorder
+from django.utils import timezone
+
+OUTSTANDING_TABLE = "token_blacklist_outstandingtoken"
+BLACKLISTED_TABLE = "token_blacklist_blacklistedtoken"
+
+
+class Command(BaseCommand):
+    help = (
+        "Drop the tables of simplejwt's token_blacklist app after copying "
+        "its unexpired revoked tokens"
+    )
+
+    def handle(self, *args, **options):
+        tables = connection.introspection.table_names()
+        if OUTSTANDING_TABLE not in tables or BLACKLISTED_TABLE not in tables:
+            self.stdout.write("The token_blacklist tables do not exist.")
+            return
+
+        quote = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Migration 0003 copied them already; catch tokens revoked since
+            cursor.execute(
+                f"INSERT INTO {quote('authentication_revokedtoken')} "
+                "(jti, expires_at) "
+                f"SELECT o.jti, o.expires_at FROM {quote(OUTSTANDING_TABLE)} o "
+                f"JOIN {quote(BLACKLISTED_TABLE)} b ON b.token_id = o.id "
+                "WHERE o.expires_at > %s AND o.jti NOT IN "
+                f"(SELECT jti FROM {quote('authentication_revokedtoken')})",
+                [timezone.now()],
+            )
+            copied = cursor.rowcount
+            cursor.execute(f"DROP TABLE {quote(BLACKLISTED_TABLE)}")
+            cursor.execute(f"DROP TABLE {quote(OUTSTANDING_TABLE)}")
+            # Lets the app be installed and migrated again from scratch
+            MigrationRecorder(connection).migration_qs.filter(
+                app="token_blacklist"
+            ).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Copied {copied} revoked tokens and dropped the token_blacklist tables"
+            )
+        )
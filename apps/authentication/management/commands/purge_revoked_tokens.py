@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.authentication.blacklist import PURGE_BATCH_SIZE, purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete revoked refresh tokens that have expired"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PURGE_BATCH_SIZE,
+            help="Number of rows deleted per statement",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        count = purge_expired(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Purged {count} expired revoked tokens"))
@@ -0,0 +1,36 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_duplicate_emails(apps, schema_editor):
+    User = apps.get_model("auth", "User")
+    duplicates = list(
+        User.objects.exclude(email="")
+        .values(email_lower=Lower("email"))
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values_list("email_lower", flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Resolve users sharing an email before migrating: " + ", ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        # Case-insensitive unique email, blank emails excluded; backs the
+        # login lookup in apps.authentication.backends.find_user_by_email
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX auth_user_email_ci_uniq "
+            "ON auth_user (LOWER(email)) WHERE email > ''",
+            "DROP INDEX auth_user_email_ci_uniq",
+        ),
+    ]
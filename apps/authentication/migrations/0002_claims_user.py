@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:25
+
+import django.contrib.auth.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0001_unique_user_email"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClaimsUser",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("auth.user",),
+            managers=[
+                ("objects", django.contrib.auth.models.UserManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.6 on 2026-10-18 01:27
+
+from django.db import migrations, models
+from django.utils import timezone
+
+OUTSTANDING_TABLE = "token_blacklist_outstandingtoken"
+BLACKLISTED_TABLE = "token_blacklist_blacklistedtoken"
+
+
+def copy_blacklist(apps, schema_editor):
+    """Keep the unexpired JTIs blacklisted by simplejwt's token_blacklist app.
+
+    Its tables are left alone and are dropped explicitly with the
+    ``drop_token_blacklist`` command, see "Upgrading" in the README.
+    """
+    connection = schema_editor.connection
+    tables = connection.introspection.table_names()
+    if OUTSTANDING_TABLE not in tables or BLACKLISTED_TABLE not in tables:
+        return
+    quote = schema_editor.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote('authentication_revokedtoken')} (jti, expires_at) "
+            f"SELECT o.jti, o.expires_at FROM {quote(OUTSTANDING_TABLE)} o "
+            f"JOIN {quote(BLACKLISTED_TABLE)} b ON b.token_id = o.id "
+            "WHERE o.expires_at > %s",
+            [timezone.now()],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0002_claims_user"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevokedToken",
+            fields=[
+                (
+                    "jti",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.RunPython(copy_blacklist, migrations.RunPython.noop),
+    ]
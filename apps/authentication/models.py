@@ -1,3 +1,50 @@
-from django.db import models
+from django.contrib.auth.models import User
+from django.db import DEFAULT_DB_ALIAS, models
 
-# Create your models here.
+from .cache import user_cache
+
+# User fields carried in access tokens, besides the id
+USER_CLAIMS = ("username", "is_active")
+
+
+class ClaimsUser(User):
+    """User built from access token claims without a query.
+
+    Only ``id`` and the fields in ``USER_CLAIMS`` are loaded, everything
+    else is deferred. Reading a deferred field loads the whole row at
+    once through the user cache. Being a ``User``, it can be used in
+    filters and assigned to foreign keys like a user loaded from the
+    database.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, claims):
+        return cls.from_db(
+            DEFAULT_DB_ALIAS,
+            ["id", *USER_CLAIMS],
+            [cls._meta.pk.to_python(user_id), *(claims[name] for name in USER_CLAIMS)],
+        )
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is None or from_queryset is not None or not deferred >= set(fields):
+            return super().refresh_from_db(using, fields, from_queryset)
+
+        user = user_cache.get(self.pk)
+        if user is None:
+            raise self.DoesNotExist("User no longer exists.")
+        for name in deferred:
+            setattr(self, name, getattr(user, name))
+
+
+class RevokedToken(models.Model):
+    """A refresh token that was logged out, kept only until it expires"""
+
+    jti = models.CharField(max_length=64, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.jti
@@ -1,8 +1,12 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenBlacklistSerializer
 from rest_framework.validators import UniqueValidator
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.models import User
+from django.db import IntegrityError
+from .backends import find_user_by_email, normalize_email
+from .tokens import ClaimsRefreshToken
 
 
 class RegisterSerializer(serializers.Serializer):
@@ -14,14 +18,15 @@ class RegisterSerializer(serializers.Serializer):
             )
         ],
     )
-    email = serializers.EmailField(
-        validators=[
-            UniqueValidator(queryset=User.objects.all(), message="Email already exists")
-        ],
-    )
+    email = serializers.EmailField()
     password = serializers.CharField(write_only=True, max_length=255)
     confirm_password = serializers.CharField(write_only=True, max_length=255)
 
+    def validate_email(self, value):
+        if find_user_by_email(value) is not None:
+            raise serializers.ValidationError("Email already exists")
+        return normalize_email(value)
+
     def validate_password(self, value):
         validate_password(value)
         return value
@@ -36,9 +41,11 @@ class RegisterSerializer(serializers.Serializer):
         email = validated_data.get("email")
         password = validated_data.get("password")
 
-        user = User.objects.create_user(username=username, email=email)
-        user.set_password(password)
-        user.save()
+        try:
+            User.objects.create_user(username=username, email=email, password=password)
+        except IntegrityError:
+            # Lost a race with a concurrent registration of the same email
+            raise serializers.ValidationError({"email": ["Email already exists"]})
         return {"message": "User registered successfully."}
 
 
@@ -50,17 +57,17 @@ class LoginSerializer(serializers.Serializer):
         email = data.get("email")
         password = data.get("password")
 
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
-            raise serializers.ValidationError({"detail": "Invalid email or password."})
-
-        if not user.check_password(password):
+        user = authenticate(self.context.get("request"), email=email, password=password)
+        if user is None:
             raise serializers.ValidationError({"detail": "Invalid email or password."})
         data["user"] = user
         return data
 
     def create(self, validated_data):
         user = validated_data["user"]
-        token = RefreshToken.for_user(user)
+        token = ClaimsRefreshToken.for_user(user)
         return {"access": str(token.access_token), "refresh": str(token)}
+
+
+class LogoutSerializer(TokenBlacklistSerializer):
+    token_class = ClaimsRefreshToken
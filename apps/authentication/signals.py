@@ -0,0 +1,14 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import user_cache
+from .models import ClaimsUser
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=ClaimsUser)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=ClaimsUser)
+def user_changed(sender, instance, **kwargs):
+    user_cache.invalidate(instance.pk)
@@ -0,0 +1,31 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .blacklist import is_revoked, revoke
+from .models import USER_CLAIMS
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """Refresh token carrying the user claims, copied into its access tokens.
+
+    Revocation is tracked in ``RevokedToken`` instead of simplejwt's
+    outstanding and blacklisted token tables, so issuing a token writes
+    nothing.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for name in USER_CLAIMS:
+            token[name] = getattr(user, name)
+        return token
+
+    def verify(self, *args, **kwargs):
+        super().verify(*args, **kwargs)
+        if is_revoked(self.payload[api_settings.JTI_CLAIM], self.payload["exp"]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        revoke(self.payload[api_settings.JTI_CLAIM], self.payload["exp"])
@@ -6,6 +6,8 @@ from .serializers import *
 
 
 class RegisterView(APIView):
+    throttle_scope = "auth"
+
     @extend_schema(
         request=RegisterSerializer, responses={201: None, 400: RegisterSerializer}
     )
@@ -21,9 +23,11 @@ class RegisterView(APIView):
 
 
 class LoginView(APIView):
+    throttle_scope = "auth"
+
     @extend_schema(request=LoginSerializer, responses={200: None, 400: LoginSerializer})
     def post(self, request):
-        serializer = LoginSerializer(data=request.data)
+        serializer = LoginSerializer(data=request.data, context={"request": request})
         if serializer.is_valid():
             response_data = serializer.save()
             return Response(response_data, status=status.HTTP_200_OK)
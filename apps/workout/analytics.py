@@ -0,0 +1,395 @@
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DateField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Max,
+    Min,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.contrib.auth import get_user_model
+from django.db.models.functions import Coalesce, Greatest, Least, TruncDay, TruncWeek
+from django.utils import timezone
+
+from .models import (
+    ExerciseRecord,
+    ExerciseWeeklyStats,
+    SetLog,
+    TrainingAggregate,
+    WorkoutSession,
+)
+
+# Counters added to on every completed set
+SUM_FIELDS = ["sets", "repetitions", "volume_kg"]
+
+# Bests that only ever move up
+MAX_FIELDS = [
+    "max_weight_kg",
+    "max_repetitions",
+    "best_set_volume_kg",
+    "estimated_one_rep_max_kg",
+]
+
+# Training aggregate counters fed by completed sets
+TRAINING_SET_FIELDS = [
+    "sets",
+    "repetitions",
+    "volume_kg",
+    "duration_seconds",
+    "distance_meters",
+]
+
+
+def estimate_one_rep_max(weight_kg, repetitions):
+    """Epley estimate of the one-rep max for a set, 0 for unloaded sets"""
+    if not weight_kg or not repetitions:
+        return 0.0
+    if repetitions == 1:
+        return float(weight_kg)
+    return weight_kg * (1 + repetitions / 30)
+
+
+# Training aggregate periods, with the SQL truncation matching period_starts
+PERIOD_TRUNCATIONS = {"day": TruncDay, "week": TruncWeek}
+
+PERIOD_LENGTHS = {"day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+
+def period_starts(moment):
+    """First day of each aggregate period a timestamp falls in"""
+    day = timezone.localdate(moment)
+    return {"day": day, "week": day - timedelta(days=day.weekday())}
+
+
+def week_start(moment):
+    """Monday of the week a timestamp falls in, in the current timezone"""
+    return period_starts(moment)["week"]
+
+
+def set_stats(set_log):
+    """The contribution of one completed set to the summary tables"""
+    repetitions = set_log.repetitions or 0
+    weight_kg = set_log.weight_kg or 0.0
+    volume_kg = repetitions * weight_kg
+    return {
+        "sets": 1,
+        "repetitions": repetitions,
+        "volume_kg": volume_kg,
+        "max_weight_kg": weight_kg,
+        "max_repetitions": repetitions,
+        "best_set_volume_kg": volume_kg,
+        "estimated_one_rep_max_kg": estimate_one_rep_max(weight_kg, repetitions),
+    }
+
+
+def record_completed_sets(entries):
+    """Fold completed sets into the exercise records and training aggregates.
+
+    ``entries`` yields ``(user_id, exercise_id, set_log)`` tuples. Sets are
+    merged in memory first, so each touched record, week and period costs a
+    single UPDATE with the increments and running maxima computed in SQL;
+    rows are only inserted the first time they are needed.
+    """
+    records = {}
+    weeks = {}
+    periods = {}
+    for user_id, exercise_id, set_log in entries:
+        stats = set_stats(set_log)
+        performed_at = set_log.completed_at or timezone.now()
+        starts = period_starts(performed_at)
+
+        for period, start in starts.items():
+            totals = periods.setdefault(
+                (user_id, period, start), dict.fromkeys(TRAINING_SET_FIELDS, 0)
+            )
+            totals["sets"] += 1
+            totals["repetitions"] += stats["repetitions"]
+            totals["volume_kg"] += stats["volume_kg"]
+            totals["duration_seconds"] += set_log.duration_seconds or 0
+            totals["distance_meters"] += set_log.distance_meters or 0
+
+        record = records.get((user_id, exercise_id))
+        if record is None:
+            record = records[(user_id, exercise_id)] = _empty_stats()
+            record["first_performed_at"] = record["last_performed_at"] = performed_at
+        _merge_stats(record, stats)
+        record["first_performed_at"] = min(record["first_performed_at"], performed_at)
+        record["last_performed_at"] = max(record["last_performed_at"], performed_at)
+
+        key = (user_id, exercise_id, starts["week"])
+        _merge_stats(weeks.setdefault(key, _empty_stats()), stats)
+
+    for (user_id, exercise_id), stats in records.items():
+        first_performed_at = stats.pop("first_performed_at")
+        last_performed_at = stats.pop("last_performed_at")
+        _upsert(
+            ExerciseRecord,
+            {"user_id": user_id, "exercise_id": exercise_id},
+            *_split_stats(stats),
+            first_performed_at=Least("first_performed_at", Value(first_performed_at)),
+            last_performed_at=Greatest("last_performed_at", Value(last_performed_at)),
+            defaults={
+                "first_performed_at": first_performed_at,
+                "last_performed_at": last_performed_at,
+            },
+        )
+
+    for (user_id, exercise_id, start), stats in weeks.items():
+        _upsert(
+            ExerciseWeeklyStats,
+            {"user_id": user_id, "exercise_id": exercise_id, "week_start": start},
+            *_split_stats(stats),
+        )
+
+    for (user_id, period, start), totals in periods.items():
+        _upsert(
+            TrainingAggregate,
+            {"user_id": user_id, "period": period, "period_start": start},
+            totals,
+        )
+
+
+def record_finished_session(session):
+    """Count a completed or cancelled session in its day and week aggregates"""
+    if session.status == "completed":
+        totals = {
+            "sessions_completed": 1,
+            "minutes": session.total_duration_minutes or 0,
+        }
+    else:
+        totals = {"sessions_cancelled": 1}
+
+    for period, start in period_starts(session.completed_at).items():
+        _upsert(
+            TrainingAggregate,
+            {"user_id": session.user_id, "period": period, "period_start": start},
+            totals,
+        )
+
+
+def rebuild_exercise_records(users=None, batch_size=1000):
+    """Recompute records and weekly stats from the full set history.
+
+    Used to backfill the summary tables or repair them after history was
+    edited outside the API. Aggregation happens in SQL and results are
+    streamed into bulk inserts of ``batch_size`` rows. Returns the number
+    of records and weeks written.
+    """
+    set_logs = SetLog.objects.filter(completed=True, completed_at__isnull=False)
+    records = ExerciseRecord.objects.all()
+    weeks = ExerciseWeeklyStats.objects.all()
+    if users is not None:
+        set_logs = set_logs.filter(session_exercise__session__user__in=users)
+        records = records.filter(user__in=users)
+        weeks = weeks.filter(user__in=users)
+
+    set_logs = set_logs.annotate(
+        stats_user=F("session_exercise__session__user"),
+        stats_exercise=F("session_exercise__workout_exercise__exercise"),
+    ).order_by()
+
+    with transaction.atomic():
+        records.delete()
+        weeks.delete()
+
+        record_count = _bulk_insert(
+            ExerciseRecord,
+            set_logs.values("stats_user", "stats_exercise").annotate(
+                first_performed_at=Min("completed_at"),
+                last_performed_at=Max("completed_at"),
+                **_aggregate_stats(),
+            ),
+            batch_size,
+        )
+        week_count = _bulk_insert(
+            ExerciseWeeklyStats,
+            set_logs.annotate(
+                week_start=TruncWeek("completed_at", output_field=DateField())
+            )
+            .values("stats_user", "stats_exercise", "week_start")
+            .annotate(**_aggregate_stats()),
+            batch_size,
+        )
+
+    return record_count, week_count
+
+
+def rebuild_training_aggregates(users=None, batch_size=500):
+    """Recompute the day and week training aggregates from scratch.
+
+    Users are walked in primary key order, ``batch_size`` at a time; each
+    batch is aggregated in SQL and written with one bulk insert, so memory
+    stays bounded by the batch however long the history is. Returns the
+    number of aggregate rows written.
+    """
+    user_ids = get_user_model().objects.order_by("pk").values_list("pk", flat=True)
+    aggregates = TrainingAggregate.objects.all()
+    if users is not None:
+        user_ids = user_ids.filter(pk__in=users)
+        aggregates = aggregates.filter(user__in=users)
+
+    count = 0
+    last_pk = 0
+    with transaction.atomic():
+        aggregates.delete()
+        while True:
+            batch = list(user_ids.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1]
+            rows = _aggregate_training(batch)
+            TrainingAggregate.objects.bulk_create(rows, batch_size=batch_size)
+            count += len(rows)
+
+    return count
+
+
+def _aggregate_training(user_ids):
+    rows = {}
+
+    def row(user_id, period, start):
+        if (user_id, period, start) not in rows:
+            rows[(user_id, period, start)] = TrainingAggregate(
+                user_id=user_id, period=period, period_start=start
+            )
+        return rows[(user_id, period, start)]
+
+    sessions = WorkoutSession.objects.filter(
+        user__in=user_ids,
+        status__in=["completed", "cancelled"],
+        completed_at__isnull=False,
+    )
+    set_logs = SetLog.objects.filter(
+        session_exercise__session__user__in=user_ids,
+        completed=True,
+        completed_at__isnull=False,
+    ).annotate(stats_user=F("session_exercise__session__user"))
+    volume = ExpressionWrapper(
+        F("repetitions") * F("weight_kg"), output_field=FloatField()
+    )
+
+    for period, trunc in PERIOD_TRUNCATIONS.items():
+        period_start = trunc("completed_at", output_field=DateField())
+        session_totals = (
+            sessions.annotate(period_start=period_start)
+            .values("user", "period_start")
+            .annotate(
+                sessions_completed=Count("id", filter=Q(status="completed")),
+                sessions_cancelled=Count("id", filter=Q(status="cancelled")),
+                minutes=Coalesce(Sum("total_duration_minutes"), 0),
+            )
+            .order_by()
+        )
+        for totals in session_totals:
+            aggregate = row(totals.pop("user"), period, totals.pop("period_start"))
+            for field, value in totals.items():
+                setattr(aggregate, field, value)
+
+        set_totals = (
+            set_logs.annotate(period_start=period_start)
+            .values("stats_user", "period_start")
+            .annotate(
+                sets=Count("id"),
+                volume_kg=Coalesce(Sum(volume), 0.0),
+                duration_seconds=Coalesce(Sum("duration_seconds"), 0),
+                distance_meters=Coalesce(Sum("distance_meters"), 0),
+                repetitions=Coalesce(Sum("repetitions"), 0),
+            )
+            .order_by()
+        )
+        for totals in set_totals:
+            aggregate = row(
+                totals.pop("stats_user"), period, totals.pop("period_start")
+            )
+            for field, value in totals.items():
+                setattr(aggregate, field, value)
+
+    return list(rows.values())
+
+
+def _empty_stats():
+    return dict.fromkeys(SUM_FIELDS + MAX_FIELDS, 0)
+
+
+def _merge_stats(totals, stats):
+    for field in SUM_FIELDS:
+        totals[field] += stats[field]
+    for field in MAX_FIELDS:
+        totals[field] = max(totals[field], stats[field])
+
+
+def _split_stats(stats):
+    sums = {field: stats[field] for field in SUM_FIELDS}
+    maxima = {field: stats[field] for field in MAX_FIELDS}
+    return sums, maxima
+
+
+def _upsert(model, lookup, sums, maxima=None, defaults=None, **expressions):
+    """Add to and raise the counters of the row matching ``lookup``, or create it"""
+    maxima = maxima or {}
+    updates = {field: F(field) + value for field, value in sums.items()}
+    updates.update(
+        {field: Greatest(field, Value(value)) for field, value in maxima.items()}
+    )
+    updates.update(expressions)
+
+    rows = model.objects.filter(**lookup)
+    if rows.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **sums, **maxima, **(defaults or {}))
+    except IntegrityError:
+        # Another request created the row first, add to it instead
+        rows.update(**updates)
+
+
+def _aggregate_stats():
+    volume = ExpressionWrapper(
+        F("repetitions") * F("weight_kg"), output_field=FloatField()
+    )
+    one_rep_max = Case(
+        When(repetitions=1, then=F("weight_kg")),
+        When(
+            repetitions__gt=1,
+            then=ExpressionWrapper(
+                F("weight_kg") * (Value(1.0) + F("repetitions") / Value(30.0)),
+                output_field=FloatField(),
+            ),
+        ),
+        output_field=FloatField(),
+    )
+    # Annotations are applied in order and "repetitions" shadows the column
+    # of the same name, so it has to come after everything that reads it
+    return {
+        "sets": Count("id"),
+        "volume_kg": Coalesce(Sum(volume), 0.0),
+        "max_weight_kg": Coalesce(Max("weight_kg"), 0.0),
+        "max_repetitions": Coalesce(Max("repetitions"), 0),
+        "best_set_volume_kg": Coalesce(Max(volume), 0.0),
+        "estimated_one_rep_max_kg": Coalesce(Max(one_rep_max), 0.0),
+        "repetitions": Coalesce(Sum("repetitions"), 0),
+    }
+
+
+def _bulk_insert(model, rows, batch_size):
+    count = 0
+    batch = []
+    for row in rows.iterator(chunk_size=batch_size):
+        row["user_id"] = row.pop("stats_user")
+        row["exercise_id"] = row.pop("stats_exercise")
+        batch.append(model(**row))
+        if len(batch) >= batch_size:
+            model.objects.bulk_create(batch)
+            count += len(batch)
+            batch = []
+    model.objects.bulk_create(batch)
+    return count + len(batch)
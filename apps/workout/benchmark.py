@@ -0,0 +1,426 @@
+import statistics
+import subprocess
+import time
+from itertools import count
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.authentication.tokens import ClaimsRefreshToken
+
+from .loadgen import LOAD_USER_PASSWORD
+from .models import (
+    ExerciseRecord,
+    SessionExercise,
+    SetLog,
+    WeightLog,
+    WorkoutPlan,
+    WorkoutSession,
+)
+from .services import start_workout_session
+
+REPORT_VERSION = 1
+
+
+class BenchmarkClient:
+    """An authenticated in-process API client plus the fixtures scenarios need.
+
+    Scenarios prepare their state through these helpers before the measured
+    request, so preparation is never part of the timing.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.client = APIClient()
+        token = ClaimsRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.sequence = count()
+        self.plan = WorkoutPlan.objects.filter(user=user, exercises__isnull=False)[0]
+        self.completed_session = (
+            WorkoutSession.objects.filter(user=user, status="completed")
+            .order_by("-started_at")
+            .first()
+        )
+        self.record = ExerciseRecord.objects.filter(user=user).first()
+
+    def request(self, method, path, data=None, format="json", authenticated=True):
+        """Perform one request, reading streamed bodies to the end"""
+        client = self.client if authenticated else APIClient()
+        response = getattr(client, method)(path, data, format=format)
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        return response
+
+    def active_session(self):
+        """The user's in-progress session, started when there is none"""
+        session = WorkoutSession.objects.active().filter(user=self.user).first()
+        if session is None:
+            session = start_workout_session(self.user, self.plan)
+        return session
+
+    def fresh_session(self):
+        """A newly started session, cancelling the current one"""
+        self.end_session()
+        return start_workout_session(self.user, self.plan)
+
+    def end_session(self):
+        WorkoutSession.objects.active().filter(user=self.user).update(
+            status="cancelled", completed_at=timezone.now()
+        )
+
+    def incomplete_sets(self, size):
+        """Ids of ``size`` incomplete sets of the active session"""
+        sets = list(self.pending_sets(self.active_session(), size))
+        if len(sets) < size:
+            sets = list(self.pending_sets(self.fresh_session(), size))
+        return sets
+
+    def pending_sets(self, session, size):
+        return SetLog.objects.filter(
+            session_exercise__session=session, completed=False
+        ).values_list("pk", flat=True)[:size]
+
+    def unique(self, prefix):
+        return f"{prefix}-{next(self.sequence)}-{time.monotonic_ns()}"
+
+
+def _list(name, **params):
+    return lambda bench: ("get", reverse(name), params)
+
+
+def _sessions_retrieve(bench):
+    return (
+        "get",
+        reverse("workoutsession-detail", args=[bench.completed_session.pk]),
+        None,
+    )
+
+
+def _sessions_active(bench):
+    bench.active_session()
+    return "get", reverse("workoutsession-active-session"), None
+
+
+def _sessions_next_exercise(bench):
+    session = bench.active_session()
+    return "get", reverse("workoutsession-next-exercise", args=[session.pk]), None
+
+
+def _sessions_start(bench):
+    bench.end_session()
+    return (
+        "post",
+        reverse("workoutsession-start-session"),
+        {"workout_plan_id": bench.plan.pk},
+    )
+
+
+def _sessions_complete(bench):
+    session = bench.fresh_session()
+    return (
+        "post",
+        reverse("workoutsession-complete-session", args=[session.pk]),
+        {"notes": "Benchmark"},
+    )
+
+
+def _sessions_cancel(bench):
+    session = bench.fresh_session()
+    return "post", reverse("workoutsession-cancel-session", args=[session.pk]), None
+
+
+def _sessions_sync(bench):
+    sets = bench.incomplete_sets(3)
+    return (
+        "post",
+        reverse("workoutsession-sync", args=[bench.active_session().pk]),
+        {"sets": [{"id": pk, "repetitions": 10, "weight_kg": 50} for pk in sets]},
+    )
+
+
+def _session_exercise(bench):
+    return SessionExercise.objects.filter(session=bench.active_session()).first()
+
+
+def _session_exercises_retrieve(bench):
+    return (
+        "get",
+        reverse("sessionexercise-detail", args=[_session_exercise(bench).pk]),
+        None,
+    )
+
+
+def _session_exercises_next_set(bench):
+    return (
+        "get",
+        reverse("sessionexercise-next-set", args=[_session_exercise(bench).pk]),
+        None,
+    )
+
+
+def _session_exercises_update_status(bench):
+    return (
+        "patch",
+        reverse("sessionexercise-update-status", args=[_session_exercise(bench).pk]),
+        {"status": "in_progress"},
+    )
+
+
+def _set_logs_complete(bench):
+    (pk,) = bench.incomplete_sets(1)
+    return (
+        "post",
+        reverse("setlog-complete-set", args=[pk]),
+        {"repetitions": 10, "weight_kg": 60},
+    )
+
+
+def _exercises_retrieve(bench):
+    return "get", reverse("exercise-detail", args=[bench.record.exercise_id]), None
+
+
+def _plans_retrieve(bench):
+    return "get", reverse("workoutplan-detail", args=[bench.plan.pk]), None
+
+
+def _plans_create(bench):
+    return "post", reverse("workoutplan-list"), {"title": "Benchmark plan"}
+
+
+def _weight_logs_create(bench):
+    return "post", reverse("weightlog-list"), {"weight": 80.5}
+
+
+def _goals_create(bench):
+    return (
+        "post",
+        reverse("fitnessgoal-list"),
+        {"goal_type": "weight", "target_value": 70, "description": "Benchmark"},
+    )
+
+
+def _records_retrieve(bench):
+    return (
+        "get",
+        reverse("exerciserecord-detail", args=[bench.record.exercise_id]),
+        None,
+    )
+
+
+def _records_weekly(bench):
+    return (
+        "get",
+        reverse("exerciserecord-weekly", args=[bench.record.exercise_id]),
+        None,
+    )
+
+
+def _import(bench):
+    exercise = bench.record.exercise.name
+    started_at = timezone.now().replace(microsecond=0).isoformat()
+    rows = "".join(f"{started_at},{exercise},10,{50 + index}\n" for index in range(20))
+    upload = SimpleUploadedFile(
+        "history.csv",
+        f"started_at,exercise,repetitions,weight_kg\n{rows}".encode(),
+    )
+    return "post", reverse("import-list"), {"file": upload}, "multipart"
+
+
+def _register(bench):
+    username = bench.unique("benchmark")
+    return (
+        "post",
+        reverse("register"),
+        {
+            "username": username,
+            "email": f"{username}@benchmark.example.com",
+            "password": LOAD_USER_PASSWORD,
+            "confirm_password": LOAD_USER_PASSWORD,
+        },
+    )
+
+
+def _login(bench):
+    return (
+        "post",
+        reverse("login"),
+        {"email": bench.user.email, "password": LOAD_USER_PASSWORD},
+    )
+
+
+def _logout(bench):
+    return (
+        "post",
+        reverse("logout"),
+        {"refresh": str(ClaimsRefreshToken.for_user(bench.user))},
+    )
+
+
+# Scenario name -> callable preparing the state and returning
+# (method, path, data[, format]) for the measured request
+SCENARIOS = {
+    "profiles.list": _list("profile-list"),
+    "exercises.list": _list("exercise-list"),
+    "exercises.retrieve": _exercises_retrieve,
+    "exercises.search": _list("exercise-search", q="press"),
+    "workout_plans.list": _list("workoutplan-list"),
+    "workout_plans.retrieve": _plans_retrieve,
+    "workout_plans.create": _plans_create,
+    "workout_exercises.list": _list("workoutexercise-list"),
+    "weight_logs.list": _list("weightlog-list"),
+    "weight_logs.series": _list("weightlog-series"),
+    "weight_logs.create": _weight_logs_create,
+    "fitness_goals.list": _list("fitnessgoal-list"),
+    "fitness_goals.create": _goals_create,
+    "workout_sessions.list": _list("workoutsession-list"),
+    "workout_sessions.list_summary": _list("workoutsession-list", view="summary"),
+    "workout_sessions.retrieve": _sessions_retrieve,
+    "workout_sessions.start": _sessions_start,
+    "workout_sessions.active": _sessions_active,
+    "workout_sessions.next_exercise": _sessions_next_exercise,
+    "workout_sessions.sync": _sessions_sync,
+    "workout_sessions.complete": _sessions_complete,
+    "workout_sessions.cancel": _sessions_cancel,
+    "session_exercises.list": _list("sessionexercise-list"),
+    "session_exercises.retrieve": _session_exercises_retrieve,
+    "session_exercises.next_set": _session_exercises_next_set,
+    "session_exercises.update_status": _session_exercises_update_status,
+    "set_logs.list": _list("setlog-list"),
+    "set_logs.complete": _set_logs_complete,
+    "analytics.records.list": _list("exerciserecord-list"),
+    "analytics.records.retrieve": _records_retrieve,
+    "analytics.records.weekly": _records_weekly,
+    "analytics.training.list": _list("trainingaggregate-list"),
+    "export.ndjson": _list("export-ndjson"),
+    "export.csv": _list("export-csv", table="set_logs"),
+    "import.create": _import,
+    "auth.register": _register,
+    "auth.login": _login,
+    "auth.logout": _logout,
+}
+
+# Scenarios sent without the access token
+ANONYMOUS_SCENARIOS = {"auth.register", "auth.login", "auth.logout"}
+
+
+def run_benchmarks(user, names=None, iterations=20, warmup=2, throttle=False):
+    """Time each scenario against the current database and count its queries.
+
+    Runs inside a transaction that is rolled back, so the dataset is the
+    same for every run and reports stay comparable between commits.
+    Throttling is switched off unless ``throttle`` is set, so repeated
+    requests measure the endpoint rather than its 429 response.
+    """
+    results = {}
+    with override_settings(ALLOWED_HOSTS=["*"], THROTTLE_ENABLED=throttle):
+        with transaction.atomic():
+            bench = BenchmarkClient(user)
+            for name in names or SCENARIOS:
+                results[name] = _measure(bench, name, iterations, warmup)
+            transaction.set_rollback(True)
+    return results
+
+
+def _measure(bench, name, iterations, warmup):
+    timings = []
+    queries = []
+    statuses = set()
+    errors = 0
+    for iteration in range(warmup + iterations):
+        method, path, data, *format = SCENARIOS[name](bench)
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = bench.request(
+                method,
+                path,
+                data,
+                *format,
+                authenticated=name not in ANONYMOUS_SCENARIOS,
+            )
+            elapsed = time.perf_counter() - started
+        if iteration < warmup:
+            continue
+        timings.append(elapsed * 1000)
+        queries.append(len(captured))
+        statuses.add(response.status_code)
+        errors += response.status_code >= 400
+
+    timings.sort()
+    return {
+        "method": method.upper(),
+        "path": path,
+        "iterations": iterations,
+        "statuses": sorted(statuses),
+        "errors": errors,
+        "latency_ms": {
+            "min": round(timings[0], 3),
+            "median": round(statistics.median(timings), 3),
+            "p95": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+            "mean": round(statistics.fmean(timings), 3),
+            "max": round(timings[-1], 3),
+        },
+        "queries": {"min": min(queries), "max": max(queries)},
+    }
+
+
+def build_report(results, dataset, iterations, warmup):
+    """JSON-serialisable report of one benchmark run"""
+    return {
+        "version": REPORT_VERSION,
+        "created_at": timezone.now().isoformat(),
+        "commit": _git_commit(),
+        "database": connection.vendor,
+        "dataset": dataset,
+        "iterations": iterations,
+        "warmup": warmup,
+        "results": results,
+    }
+
+
+def dataset_size(user):
+    """Row counts describing the data the benchmark ran against"""
+    return {
+        "sessions": WorkoutSession.objects.count(),
+        "set_logs": SetLog.objects.count(),
+        "weight_logs": WeightLog.objects.count(),
+        "user_sessions": WorkoutSession.objects.filter(user=user).count(),
+    }
+
+
+def compare_reports(baseline, current):
+    """Median latency and query count changes per scenario in both reports"""
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        before_ms = before["latency_ms"]["median"]
+        after_ms = result["latency_ms"]["median"]
+        rows.append(
+            {
+                "name": name,
+                "baseline_ms": before_ms,
+                "current_ms": after_ms,
+                "change": (after_ms - before_ms) / before_ms if before_ms else 0.0,
+                "baseline_queries": before["queries"]["max"],
+                "current_queries": result["queries"]["max"],
+            }
+        )
+    return rows
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
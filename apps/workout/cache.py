@@ -0,0 +1,79 @@
+"""Versioned cache keys for the exercise catalog and per-user data
+
+The catalog changes rarely, so its serialized payloads are cached under a
+catalog version that is replaced whenever an exercise is saved or deleted.
+Stale payloads are never invalidated one by one, they simply stop being
+read and expire. Per-user data works the same way with one version per
+user, replaced by ``invalidate_user_cache``.
+
+Versions are read from and written to the shared cache tier only, so a
+new version is seen by every worker at once even while older payloads
+are still held in their in-process tiers.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.utils import timezone
+
+CATALOG_STATE_KEY = "exercise-catalog:state"
+CATALOG_PAYLOAD_TIMEOUT = 60 * 60 * 24
+USER_VERSION_KEY = "user-cache:{}:version"
+
+
+def shared_cache():
+    """The cache all workers see, skipping the in-process tier"""
+    return getattr(cache, "shared", cache)
+
+
+def _get_or_add(key, new_value):
+    shared = shared_cache()
+    value = shared.get(key)
+    if value is None:
+        value = new_value()
+        # Another worker may have initialised the value in the meantime
+        if not shared.add(key, value, None):
+            value = shared.get(key, value)
+    return value
+
+
+def _new_catalog_state():
+    return {
+        "version": str(time.time_ns()),
+        # HTTP dates have one second resolution
+        "last_modified": int(timezone.now().timestamp()),
+    }
+
+
+def get_catalog_state():
+    """Current version and last-modified timestamp of the catalog"""
+    return _get_or_add(CATALOG_STATE_KEY, _new_catalog_state)
+
+
+def invalidate_catalog():
+    """Start a new catalog version after exercises changed"""
+    shared_cache().set(CATALOG_STATE_KEY, _new_catalog_state(), None)
+
+
+def get_catalog_payload(version, key):
+    return cache.get(f"exercise-catalog:{version}:{key}")
+
+
+def set_catalog_payload(version, key, payload):
+    cache.set(f"exercise-catalog:{version}:{key}", payload, CATALOG_PAYLOAD_TIMEOUT)
+
+
+def _new_version():
+    # Never reuses a version, even if the stored one was evicted
+    return str(time.time_ns())
+
+
+def user_cache_key(user_id, name):
+    """Key for the user's cached ``name``, changed by ``invalidate_user_cache``"""
+    version = _get_or_add(USER_VERSION_KEY.format(user_id), _new_version)
+    return f"user-cache:{user_id}:{version}:{name}"
+
+
+def invalidate_user_cache(user_id):
+    """Stop reading every payload cached under the user's keys"""
+    shared_cache().set(USER_VERSION_KEY.format(user_id), _new_version(), None)
@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+import yaml
+from django.db import transaction
+
+from .cache import invalidate_catalog
+from .models import Exercise
+from .search import index_exercises
+
+DEFAULT_CATALOG = Path(__file__).resolve().parent / "data" / "exercises.json"
+
+# Rows upserted per INSERT ... ON CONFLICT statement
+SEED_BATCH_SIZE = 1000
+
+CATALOG_FIELDS = ["name", "description", "instructions", "target_muscles", "equipment"]
+REQUIRED_FIELDS = ["name", "description", "instructions", "target_muscles"]
+
+
+class CatalogError(Exception):
+    """A catalog file is unreadable or contains an invalid entry"""
+
+
+def load_catalog(path):
+    """Exercise entries from a JSON or YAML catalog file.
+
+    The file holds either a list of exercises or a mapping with an
+    ``exercises`` list. The format is chosen by the file extension.
+    """
+    path = Path(path)
+    try:
+        with path.open(encoding="utf-8") as catalog:
+            if path.suffix.lower() in (".yaml", ".yml"):
+                data = yaml.safe_load(catalog)
+            else:
+                data = json.load(catalog)
+    except (OSError, ValueError, yaml.YAMLError) as error:
+        raise CatalogError(f"{path}: {error}")
+
+    if isinstance(data, dict):
+        data = data.get("exercises")
+    if not isinstance(data, list):
+        raise CatalogError(f"{path}: expected a list of exercises")
+    return [clean_entry(entry, f"{path}[{index}]") for index, entry in enumerate(data)]
+
+
+def clean_entry(entry, label):
+    """Exercise field values of one catalog entry, stripped of extra keys"""
+    if not isinstance(entry, dict):
+        raise CatalogError(f"{label}: expected a mapping")
+    values = {}
+    for field in CATALOG_FIELDS:
+        value = entry.get(field)
+        value = str(value).strip() if value is not None else ""
+        if not value and field in REQUIRED_FIELDS:
+            raise CatalogError(f"{label}: missing {field}")
+        values[field] = value or None
+    return values
+
+
+def seed_exercises(entries, batch_size=SEED_BATCH_SIZE):
+    """Insert or update catalog exercises by name, return counts by outcome.
+
+    Existing rows are read in one query and compared in memory, so only
+    new or changed entries are written, with one upsert per batch. Entries
+    repeating a name override earlier ones. Search terms are rebuilt for
+    the written exercises and the catalog cache is invalidated once.
+    """
+    catalog = {entry["name"]: entry for entry in entries}
+    existing = {
+        values[0]: values
+        for values in Exercise.objects.values_list(*CATALOG_FIELDS).iterator()
+    }
+
+    counts = {"created": 0, "updated": 0, "unchanged": 0}
+    changed = []
+    for name, entry in catalog.items():
+        values = tuple(entry[field] for field in CATALOG_FIELDS)
+        if name not in existing:
+            counts["created"] += 1
+        elif existing[name] != values:
+            counts["updated"] += 1
+        else:
+            counts["unchanged"] += 1
+            continue
+        changed.append(Exercise(**entry))
+
+    if not changed:
+        return counts
+
+    with transaction.atomic():
+        for start in range(0, len(changed), batch_size):
+            batch = Exercise.objects.bulk_create(
+                changed[start : start + batch_size],
+                update_conflicts=True,
+                unique_fields=["name"],
+                update_fields=CATALOG_FIELDS[1:],
+            )
+            index_exercises(batch)
+    invalidate_catalog()
+    return counts
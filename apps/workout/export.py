@@ -0,0 +1,125 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+
+from .models import FitnessGoal, SessionExercise, SetLog, WeightLog, WorkoutSession
+
+# Rows fetched per round trip; with server-side cursors only this many rows
+# are held in memory however long the history is
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _sessions(user):
+    return WorkoutSession.objects.filter(user=user).annotate(
+        workout_plan_title=F("workout_plan__title")
+    ), [
+        "id",
+        "workout_plan_id",
+        "workout_plan_title",
+        "status",
+        "started_at",
+        "completed_at",
+        "total_duration_minutes",
+        "notes",
+    ]
+
+
+def _session_exercises(user):
+    return SessionExercise.objects.filter(session__user=user).annotate(
+        exercise_id=F("workout_exercise__exercise_id"),
+        exercise_name=F("workout_exercise__exercise__name"),
+    ), [
+        "id",
+        "session_id",
+        "order",
+        "exercise_id",
+        "exercise_name",
+        "status",
+        "planned_sets",
+        "planned_repetitions",
+        "planned_duration_seconds",
+        "planned_distance_meters",
+        "completed_sets",
+        "started_at",
+        "completed_at",
+        "notes",
+    ]
+
+
+def _set_logs(user):
+    return SetLog.objects.filter(session_exercise__session__user=user), [
+        "id",
+        "session_exercise_id",
+        "set_number",
+        "repetitions",
+        "weight_kg",
+        "duration_seconds",
+        "distance_meters",
+        "completed",
+        "rest_seconds",
+        "completed_at",
+        "notes",
+    ]
+
+
+def _weight_logs(user):
+    return WeightLog.objects.filter(user=user), ["id", "date", "weight"]
+
+
+def _fitness_goals(user):
+    return FitnessGoal.objects.filter(user=user), [
+        "id",
+        "goal_type",
+        "target_value",
+        "description",
+        "exercise_id",
+        "metric",
+        "baseline_value",
+        "achieved",
+        "achieved_at",
+        "created_at",
+    ]
+
+
+# Exported tables in dependency order, each returning (queryset, columns)
+EXPORT_TABLES = {
+    "sessions": _sessions,
+    "session_exercises": _session_exercises,
+    "set_logs": _set_logs,
+    "weight_logs": _weight_logs,
+    "fitness_goals": _fitness_goals,
+}
+
+
+def export_rows(user, table):
+    """Column names and a lazy iterator of value tuples for one table"""
+    queryset, columns = EXPORT_TABLES[table](user)
+    rows = queryset.order_by("id").values_list(*columns)
+    return columns, rows.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def export_ndjson(user, tables=None):
+    """Yield one JSON line per row, tagged with its table"""
+    for table in tables or EXPORT_TABLES:
+        columns, rows = export_rows(user, table)
+        for row in rows:
+            record = {"table": table, **dict(zip(columns, row))}
+            yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+class _Echo:
+    """File-like object handing each CSV line back instead of storing it"""
+
+    def write(self, value):
+        return value
+
+
+def export_csv(user, table):
+    """Yield the CSV lines of one table, header first"""
+    writer = csv.writer(_Echo())
+    columns, rows = export_rows(user, table)
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row)
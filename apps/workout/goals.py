@@ -0,0 +1,114 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .models import ExerciseRecord, FitnessGoal, Profile, WeightLog
+
+
+def latest_weight_subquery():
+    """The most recent logged body weight of the goal's user"""
+    return Subquery(
+        WeightLog.objects.filter(user=OuterRef("user"))
+        .order_by("-date", "-id")
+        .values("weight")[:1]
+    )
+
+
+def reached_condition():
+    """Q matching goals whose target is met by the user's current data.
+
+    Weight goals compare the latest weight log in the direction implied by
+    the baseline; exercise goals compare the chosen metric of the user's
+    ExerciseRecord. Both sides are single-row index lookups correlated to
+    the goal, so evaluating a goal never scans history.
+    """
+    latest_weight = latest_weight_subquery()
+    condition = Q(
+        goal_type="weight",
+        baseline_value__gte=F("target_value"),
+        target_value__gte=latest_weight,
+    ) | Q(
+        goal_type="weight",
+        baseline_value__lt=F("target_value"),
+        target_value__lte=latest_weight,
+    )
+    for metric, _ in FitnessGoal.METRIC_CHOICES:
+        record_value = Subquery(
+            ExerciseRecord.objects.filter(
+                user=OuterRef("user"), exercise=OuterRef("exercise")
+            ).values(metric)[:1]
+        )
+        condition |= Q(
+            goal_type="exercise", metric=metric, target_value__lte=record_value
+        )
+    return condition
+
+
+def mark_reached_goals(goals):
+    """Flag every open goal in ``goals`` whose target is met, in one UPDATE"""
+    return (
+        goals.filter(achieved=False)
+        .filter(reached_condition())
+        .update(achieved=True, achieved_at=timezone.now())
+    )
+
+
+def evaluate_weight_goals(weight_log):
+    """Check the open weight goals of a user after a new weight log"""
+    goals = FitnessGoal.objects.filter(user=weight_log.user_id, goal_type="weight")
+    mark_reached_goals(goals)
+    # Goals set before the first weigh-in start from this one
+    goals.filter(achieved=False, baseline_value__isnull=True).update(
+        baseline_value=weight_log.weight
+    )
+
+
+def evaluate_exercise_goals(user_id, exercise_ids):
+    """Check the open goals on exercises whose records just changed"""
+    return mark_reached_goals(
+        FitnessGoal.objects.filter(
+            user=user_id, goal_type="exercise", exercise__in=exercise_ids
+        )
+    )
+
+
+def current_weight(user):
+    """Latest logged weight, falling back to the profile weight"""
+    weight = (
+        WeightLog.objects.filter(user=user)
+        .order_by("-date", "-id")
+        .values_list("weight", flat=True)
+        .first()
+    )
+    if weight is None:
+        weight = (
+            Profile.objects.filter(user=user).values_list("weight", flat=True).first()
+        )
+    return weight
+
+
+def reevaluate_goals(users=None, batch_size=1000):
+    """Re-check all open goals, ``batch_size`` users per UPDATE.
+
+    Missing weight baselines are filled from the latest weight first. Used
+    after importing history or changing the evaluation rules. Returns the
+    number of goals newly marked achieved.
+    """
+    user_ids = get_user_model().objects.order_by("pk").values_list("pk", flat=True)
+    if users is not None:
+        user_ids = user_ids.filter(pk__in=users)
+
+    achieved = 0
+    last_pk = 0
+    while True:
+        batch = list(user_ids.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        last_pk = batch[-1]
+        goals = FitnessGoal.objects.filter(user__in=batch)
+        goals.filter(
+            goal_type="weight", achieved=False, baseline_value__isnull=True
+        ).update(baseline_value=latest_weight_subquery())
+        achieved += mark_reached_goals(goals)
+
+    return achieved
@@ -0,0 +1,335 @@
+import csv
+import json
+import math
+from datetime import datetime, time
+
+from django.db import connection, transaction
+from django.db.backends.base.operations import BaseDatabaseOperations
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .analytics import rebuild_exercise_records, rebuild_training_aggregates
+from .goals import reevaluate_goals
+from .models import (
+    Exercise,
+    SessionExercise,
+    SetLog,
+    WorkoutExercise,
+    WorkoutPlan,
+    WorkoutSession,
+)
+
+# Set rows written per transaction
+IMPORT_CHUNK_SIZE = 5000
+
+# Errors kept for the report; the total is always counted
+MAX_REPORTED_ERRORS = 100
+
+DEFAULT_PLAN_TITLE = "Imported workouts"
+
+SET_INTEGER_FIELDS = ["repetitions", "duration_seconds", "distance_meters"]
+
+
+class ImportAborted(Exception):
+    """The file cannot be imported at all, e.g. it has no usable header"""
+
+
+def read_csv(lines):
+    """Rows of a CSV file as dicts keyed by the header"""
+    reader = csv.DictReader(lines)
+    if not reader.fieldnames or "exercise" not in reader.fieldnames:
+        raise ImportAborted("CSV header must include an exercise column.")
+    yield from reader
+
+
+def read_ndjson(lines):
+    """Rows of a newline-delimited JSON file, one object per line"""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        # Bad lines are passed on so they are reported with their row number
+        yield row if isinstance(row, dict) else {}
+
+
+READERS = {"csv": read_csv, "ndjson": read_ndjson}
+
+
+class HistoryImporter:
+    """Load historical workouts for one user from flat set rows.
+
+    Each row is one set: ``exercise`` plus optional ``repetitions``,
+    ``weight_kg``, ``duration_seconds``, ``distance_meters``,
+    ``rest_seconds`` and ``notes``, and the session it belongs to as
+    ``started_at``, optional ``completed_at``, ``plan`` title and a
+    ``session`` key (``started_at`` when missing). Rows of a session must
+    be contiguous and sets are numbered in row order.
+
+    Rows are streamed and buffered until ``chunk_size`` sets are pending at
+    a session boundary. Each chunk is written with one bulk insert per
+    table in its own transaction. Exercise names, plans and plan exercises
+    are resolved with in-memory lookups, so no query is made per row.
+    """
+
+    def __init__(self, user, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+        if not connection.features.can_return_rows_from_bulk_insert:
+            raise ImportAborted("The database cannot return ids from bulk inserts.")
+        self.user = user
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.exercises = {
+            name.casefold(): pk
+            for pk, name in Exercise.objects.values_list("pk", "name")
+        }
+        self.plans = {
+            plan.title: plan for plan in WorkoutPlan.objects.filter(user=user)
+        }
+        self.workout_exercises = {
+            (item.workout_plan_id, item.exercise_id): item
+            for item in WorkoutExercise.objects.filter(workout_plan__user=user)
+        }
+        self.rows = 0
+        self.sessions = 0
+        self.sets = 0
+        self.error_count = 0
+        self.errors = []
+
+    def run(self, rows):
+        """Import all rows and refresh the user's summaries, return a report"""
+        pending = []
+        pending_sets = 0
+        current = None
+        seen_keys = set()
+
+        for number, row in enumerate(rows, start=1):
+            self.rows = number
+            try:
+                key, session_values, exercise_id, set_values = self.parse(row)
+            except ValueError as error:
+                self.add_error(number, str(error))
+                continue
+
+            if current is None or key != current["key"]:
+                if key in seen_keys:
+                    self.add_error(number, f"Rows of session {key} are not contiguous.")
+                    continue
+                if pending_sets >= self.chunk_size:
+                    self.flush(pending)
+                    pending, pending_sets = [], 0
+                seen_keys.add(key)
+                current = {"key": key, "exercises": {}, **session_values}
+                pending.append(current)
+
+            current["exercises"].setdefault(exercise_id, []).append(set_values)
+            pending_sets += 1
+
+        self.flush(pending)
+
+        if self.sets:
+            users = [self.user.pk]
+            rebuild_exercise_records(users=users)
+            rebuild_training_aggregates(users=users)
+            reevaluate_goals(users=users)
+
+        return {
+            "rows": self.rows,
+            "sessions": self.sessions,
+            "sets": self.sets,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+    def parse(self, row):
+        exercise = parse_text(row.get("exercise"), "exercise")
+        if not exercise:
+            raise ValueError("Missing exercise.")
+        exercise_id = self.exercises.get(exercise.casefold())
+        if exercise_id is None:
+            raise ValueError(f"Unknown exercise: {exercise}")
+
+        started_at = parse_timestamp(row.get("started_at"), "started_at")
+        if started_at is None:
+            raise ValueError("Missing started_at.")
+        completed_at = parse_timestamp(row.get("completed_at"), "completed_at")
+        plan = parse_text(row.get("plan"), "plan") or DEFAULT_PLAN_TITLE
+        if len(plan) > WorkoutPlan._meta.get_field("title").max_length:
+            raise ValueError("Invalid plan: title is too long.")
+        session_values = {
+            "plan": plan,
+            "started_at": started_at,
+            "completed_at": max(completed_at or started_at, started_at),
+        }
+
+        set_values = {
+            field: parse_number(row.get(field), field, int)
+            for field in SET_INTEGER_FIELDS
+        }
+        set_values["weight_kg"] = parse_number(row.get("weight_kg"), "weight_kg", float)
+        rest_seconds = parse_number(row.get("rest_seconds"), "rest_seconds", int)
+        if rest_seconds is not None:
+            set_values["rest_seconds"] = rest_seconds
+        set_values["notes"] = parse_text(row.get("notes"), "notes") or None
+
+        key = str(row.get("session") or started_at.isoformat())
+        return key, session_values, exercise_id, set_values
+
+    def add_error(self, row, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": message})
+
+    def flush(self, pending):
+        """Write buffered sessions with one bulk insert per table"""
+        if not pending:
+            return
+
+        with transaction.atomic():
+            self.resolve_plans(pending)
+            self.resolve_workout_exercises(pending)
+
+            sessions = WorkoutSession.objects.bulk_create(
+                [
+                    WorkoutSession(
+                        user=self.user,
+                        workout_plan=self.plans[values["plan"]],
+                        status="completed",
+                        started_at=values["started_at"],
+                        completed_at=values["completed_at"],
+                        total_duration_minutes=int(
+                            (
+                                values["completed_at"] - values["started_at"]
+                            ).total_seconds()
+                            // 60
+                        ),
+                    )
+                    for values in pending
+                ]
+            )
+
+            session_exercises = []
+            set_groups = []
+            for session, values in zip(sessions, pending):
+                plan_id = session.workout_plan_id
+                for order, (exercise_id, sets) in enumerate(
+                    values["exercises"].items()
+                ):
+                    session_exercises.append(
+                        SessionExercise(
+                            session=session,
+                            workout_exercise=self.workout_exercises[
+                                (plan_id, exercise_id)
+                            ],
+                            order=order,
+                            status="completed",
+                            planned_sets=len(sets),
+                            completed_sets=len(sets),
+                            started_at=values["started_at"],
+                            completed_at=values["completed_at"],
+                        )
+                    )
+                    set_groups.append((sets, values["completed_at"]))
+            session_exercises = SessionExercise.objects.bulk_create(session_exercises)
+
+            set_logs = [
+                SetLog(
+                    session_exercise=session_exercise,
+                    set_number=set_number,
+                    completed=True,
+                    completed_at=completed_at,
+                    **set_values,
+                )
+                for session_exercise, (sets, completed_at) in zip(
+                    session_exercises, set_groups
+                )
+                for set_number, set_values in enumerate(sets, start=1)
+            ]
+            SetLog.objects.bulk_create(set_logs, batch_size=self.chunk_size)
+
+        self.sessions += len(sessions)
+        self.sets += len(set_logs)
+        if self.progress:
+            self.progress(self.rows, self.sessions, self.sets)
+
+    def resolve_plans(self, pending):
+        titles = {values["plan"] for values in pending} - self.plans.keys()
+        if titles:
+            created = WorkoutPlan.objects.bulk_create(
+                [WorkoutPlan(user=self.user, title=title) for title in sorted(titles)]
+            )
+            self.plans.update((plan.title, plan) for plan in created)
+
+    def resolve_workout_exercises(self, pending):
+        missing = {}
+        for values in pending:
+            plan_id = self.plans[values["plan"]].pk
+            for exercise_id, sets in values["exercises"].items():
+                if (plan_id, exercise_id) not in self.workout_exercises:
+                    missing.setdefault((plan_id, exercise_id), len(sets))
+        if missing:
+            created = WorkoutExercise.objects.bulk_create(
+                [
+                    WorkoutExercise(
+                        workout_plan_id=plan_id, exercise_id=exercise_id, sets=sets
+                    )
+                    for (plan_id, exercise_id), sets in missing.items()
+                ]
+            )
+            self.workout_exercises.update(
+                ((item.workout_plan_id, item.exercise_id), item) for item in created
+            )
+
+
+def parse_timestamp(value, field):
+    """Aware datetime from an ISO timestamp or date, None when empty"""
+    if value in (None, ""):
+        return None
+    try:
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            moment = day and datetime.combine(day, time())
+    except (TypeError, ValueError):
+        moment = None
+    if moment is None:
+        raise ValueError(f"Invalid {field}: {value}")
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_text(value, field):
+    """Stripped text from a CSV cell or JSON string, "" when empty"""
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid {field}: {value!r}")
+    return value.strip()
+
+
+def parse_number(value, field, kind):
+    """Non-negative number from a CSV cell or JSON value, None when empty.
+
+    Integers are bounded by the portable range of their ``SetLog`` column,
+    so a row cannot overflow the database partway through an import.
+    """
+    if value in (None, ""):
+        return None
+    try:
+        if isinstance(value, bool):
+            raise TypeError
+        if kind is int and isinstance(value, float) and not value.is_integer():
+            raise ValueError
+        number = kind(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Invalid {field}: {value}")
+    if number < 0 or not math.isfinite(number):
+        raise ValueError(f"Invalid {field}: {value}")
+    if kind is int:
+        internal_type = SetLog._meta.get_field(field).get_internal_type()
+        _, maximum = BaseDatabaseOperations.integer_field_ranges[internal_type]
+        if number > maximum:
+            raise ValueError(f"Invalid {field}: {value} is too large")
+    return number
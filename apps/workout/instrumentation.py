@@ -0,0 +1,266 @@
+import logging
+import secrets
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.dispatch import Signal
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+
+logger = logging.getLogger(__name__)
+
+# Sent with the request and its RequestMetrics once a response is ready
+request_measured = Signal()
+
+DURATION_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+QUERY_BUCKETS = [0, 1, 2, 5, 10, 20, 50, 100, 200]
+SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+
+
+class RequestMetrics:
+    """Timings collected while one request is handled, in seconds"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.queries = 0
+        self.db = 0.0
+        self.render = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # Installed as a database execute wrapper
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+
+class Histogram:
+    """Cumulative Prometheus histogram with one series per label set"""
+
+    def __init__(self, name, help, buckets):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, labels, value):
+        counts, total = self.series.get(labels, ([0] * (len(self.buckets) + 1), 0))
+        counts[bisect_left(self.buckets, value)] += 1
+        self.series[labels] = (counts, total + value)
+
+    def exposition(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self.series.items()):
+            label_text = format_labels(labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + ["+Inf"], counts):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"{self.name}_sum{{{label_text}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Per-route request metrics of this process.
+
+    Each worker process keeps its own registry; Prometheus aggregates the
+    workers by scraping them as separate instances.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.collectors = []
+        self.reset()
+
+    def reset(self):
+        self.requests = {}
+        self.histograms = {
+            "duration": Histogram(
+                "http_request_duration_seconds",
+                "Time spent handling the request",
+                DURATION_BUCKETS,
+            ),
+            "db": Histogram(
+                "http_request_db_duration_seconds",
+                "Time spent in database queries",
+                DURATION_BUCKETS,
+            ),
+            "app": Histogram(
+                "http_request_app_duration_seconds",
+                "Time spent in view code outside the database, mostly serializers",
+                DURATION_BUCKETS,
+            ),
+            "render": Histogram(
+                "http_request_render_duration_seconds",
+                "Time spent rendering the response body",
+                DURATION_BUCKETS,
+            ),
+            "queries": Histogram(
+                "http_request_queries",
+                "Database queries made by the request",
+                QUERY_BUCKETS,
+            ),
+            "size": Histogram(
+                "http_response_size_bytes",
+                "Size of the response body",
+                SIZE_BUCKETS,
+            ),
+        }
+
+    def record(self, route, method, status, timings, queries, size):
+        labels = (("route", route), ("method", method))
+        with self.lock:
+            key = labels + (("status", str(status)),)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            for name, value in timings.items():
+                self.histograms[name].observe(labels, value)
+            self.histograms["queries"].observe(labels, queries)
+            if size is not None:
+                self.histograms["size"].observe(labels, size)
+
+    def register_collector(self, collector):
+        """Add a callable returning more exposition lines, e.g. cache stats"""
+        self.collectors.append(collector)
+
+    def exposition(self):
+        """All metrics in the Prometheus text format"""
+        with self.lock:
+            lines = [
+                "# HELP http_requests_total Requests handled",
+                "# TYPE http_requests_total counter",
+            ]
+            for labels, count in sorted(self.requests.items()):
+                lines.append(f"http_requests_total{{{format_labels(labels)}}} {count}")
+            for histogram in self.histograms.values():
+                lines.extend(histogram.exposition())
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def format_labels(labels):
+    return ",".join(
+        '{}="{}"'.format(
+            name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in labels
+    )
+
+
+class RequestMetricsMiddleware:
+    """Measure every request and expose the numbers.
+
+    Counts queries and database time through an execute wrapper on every
+    connection, splits the remaining time into view code and rendering,
+    and reports them in a ``Server-Timing`` header and the per-route
+    histograms served by ``metrics_view``. Requests making more queries than
+    ``REQUEST_QUERY_BUDGET`` are logged as warnings.
+
+    Streamed bodies are produced after the middleware returns, so their
+    queries and size are not included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = request.request_metrics = RequestMetrics()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(metrics))
+            response = self.get_response(request)
+        total = time.perf_counter() - metrics.started
+
+        view = 0.0
+        if metrics.view_started is not None:
+            view = max(0.0, total - (metrics.view_started - metrics.started))
+        app = max(0.0, view - metrics.db - metrics.render)
+        size = None if response.streaming else len(response.content)
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={metrics.db * 1000:.2f};desc="{metrics.queries} queries"',
+                f"app;dur={app * 1000:.2f}",
+                f"render;dur={metrics.render * 1000:.2f}",
+                f"total;dur={total * 1000:.2f}",
+            ]
+        )
+
+        match = request.resolver_match
+        route = match.view_name if match else "unmatched"
+        registry.record(
+            route,
+            request.method,
+            response.status_code,
+            {"duration": total, "db": metrics.db, "app": app, "render": metrics.render},
+            metrics.queries,
+            size,
+        )
+        request_measured.send(sender=type(self), request=request, metrics=metrics)
+
+        budget = getattr(settings, "REQUEST_QUERY_BUDGET", None)
+        if budget is not None and metrics.queries > budget:
+            logger.warning(
+                "%s %s made %d queries (budget %d) in %.1f ms, %.1f ms in the database",
+                request.method,
+                request.path,
+                metrics.queries,
+                budget,
+                total * 1000,
+                metrics.db * 1000,
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.request_metrics.view_started = time.perf_counter()
+
+
+class TimedRendererMixin:
+    """Add the time spent rendering DRF responses to the request metrics"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        started = time.perf_counter()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            request = (renderer_context or {}).get("request")
+            metrics = getattr(request, "request_metrics", None)
+            if metrics is not None:
+                metrics.render += time.perf_counter() - started
+
+
+class TimedJSONRenderer(TimedRendererMixin, JSONRenderer):
+    pass
+
+
+class TimedBrowsableAPIRenderer(TimedRendererMixin, BrowsableAPIRenderer):
+    pass
+
+
+def metrics_view(request):
+    """Prometheus text exposition of the request metrics.
+
+    Requires ``Authorization: Bearer <METRICS_TOKEN>`` when a token is
+    configured and is only served in DEBUG otherwise.
+    """
+    token = getattr(settings, "METRICS_TOKEN", None)
+    if token:
+        supplied = request.headers.get("Authorization", "")
+        if not secrets.compare_digest(supplied, f"Bearer {token}"):
+            return HttpResponseForbidden()
+    elif not settings.DEBUG:
+        raise Http404
+    return HttpResponse(registry.exposition(), content_type="text/plain; version=0.0.4")
@@ -0,0 +1,315 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .analytics import rebuild_exercise_records, rebuild_training_aggregates
+from .catalog import DEFAULT_CATALOG, load_catalog, seed_exercises
+from .goals import reevaluate_goals
+from .models import (
+    Exercise,
+    FitnessGoal,
+    Profile,
+    SessionExercise,
+    SetLog,
+    WeightLog,
+    WorkoutExercise,
+    WorkoutPlan,
+    WorkoutSession,
+)
+
+LOAD_USER_PREFIX = "loadtest-user-"
+LOAD_USER_PASSWORD = "LoadTest123!"
+
+# Users generated and written together, bounds memory for long histories
+USER_GROUP_SIZE = 25
+
+PLAN_TITLES = ["Push", "Pull", "Legs", "Upper Body", "Full Body", "Conditioning"]
+
+CANCELLED_SESSION_RATE = 0.05
+WEIGHT_LOG_INTERVAL_DAYS = 3
+
+
+def load_user_email(username):
+    return f"{username}@loadtest.example.com"
+
+
+class LoadDataGenerator:
+    """Bulk insert a synthetic but realistic training history.
+
+    Every user gets a profile, a few plans, sessions spread over the last
+    ``years`` at ``sessions_per_week``, a completed set log for every
+    planned set with slowly progressing weights, a weight log every few
+    days and a weight and an exercise goal. Rows are built in memory for
+    ``USER_GROUP_SIZE`` users at a time and written with bulk inserts, then
+    the summary tables are rebuilt once. The same seed yields the same
+    dataset.
+
+    All users share ``LOAD_USER_PASSWORD``, hashed once, so the dataset
+    can be used to benchmark logins.
+    """
+
+    def __init__(
+        self,
+        users=100,
+        years=1.0,
+        sessions_per_week=3,
+        plans_per_user=3,
+        exercises_per_plan=5,
+        sets_per_exercise=3,
+        seed=0,
+        batch_size=5000,
+        progress=None,
+    ):
+        self.user_count = users
+        self.years = years
+        self.sessions_per_week = sessions_per_week
+        self.plans_per_user = plans_per_user
+        self.exercises_per_plan = exercises_per_plan
+        self.sets_per_exercise = sets_per_exercise
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.progress = progress
+        self.counts = {"users": 0, "sessions": 0, "set_logs": 0, "weight_logs": 0}
+
+    def run(self):
+        """Generate the dataset and return the number of rows per kind"""
+        if not Exercise.objects.exists():
+            seed_exercises(load_catalog(DEFAULT_CATALOG))
+        self.exercises = list(Exercise.objects.order_by("id"))
+        self.password = make_password(LOAD_USER_PASSWORD)
+        self.end = timezone.now() - timedelta(days=1)
+        self.start = self.end - timedelta(days=365 * self.years)
+
+        offset = User.objects.filter(username__startswith=LOAD_USER_PREFIX).count()
+        user_ids = []
+        for first in range(offset, offset + self.user_count, USER_GROUP_SIZE):
+            last = min(first + USER_GROUP_SIZE, offset + self.user_count)
+            with transaction.atomic():
+                user_ids.extend(self.generate_group(range(first, last)))
+            if self.progress:
+                self.progress(self.counts)
+
+        if user_ids:
+            rebuild_exercise_records(users=user_ids)
+            rebuild_training_aggregates(users=user_ids)
+            reevaluate_goals(users=user_ids)
+        return self.counts
+
+    def generate_group(self, indexes):
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=f"{LOAD_USER_PREFIX}{index}",
+                    email=load_user_email(f"{LOAD_USER_PREFIX}{index}"),
+                    password=self.password,
+                )
+                for index in indexes
+            ]
+        )
+        body_weights = {user.pk: self.random.uniform(60, 100) for user in users}
+        Profile.objects.bulk_create(
+            [
+                Profile(
+                    user=user,
+                    weight=round(body_weights[user.pk], 1),
+                    height=round(self.random.uniform(155, 195)),
+                )
+                for user in users
+            ]
+        )
+
+        plans = WorkoutPlan.objects.bulk_create(
+            [
+                WorkoutPlan(
+                    user=user,
+                    title=title,
+                    frequency_per_week=self.sessions_per_week,
+                )
+                for user in users
+                for title in self.random.sample(PLAN_TITLES, self.plans_per_user)
+            ]
+        )
+        workout_exercises = WorkoutExercise.objects.bulk_create(
+            [
+                WorkoutExercise(
+                    workout_plan=plan,
+                    exercise=exercise,
+                    sets=self.sets_per_exercise,
+                    repetitions=self.random.choice([5, 8, 10, 12]),
+                )
+                for plan in plans
+                for exercise in self.random.sample(
+                    self.exercises, min(self.exercises_per_plan, len(self.exercises))
+                )
+            ]
+        )
+        plan_exercises = {}
+        for workout_exercise in workout_exercises:
+            plan_exercises.setdefault(workout_exercise.workout_plan_id, []).append(
+                workout_exercise
+            )
+        user_plans = {}
+        for plan in plans:
+            user_plans.setdefault(plan.user_id, []).append(plan)
+
+        self.generate_sessions(users, user_plans, plan_exercises)
+        self.generate_weight_logs(users, body_weights)
+        self.generate_goals(users, body_weights, user_plans, plan_exercises)
+
+        self.counts["users"] += len(users)
+        return [user.pk for user in users]
+
+    def generate_sessions(self, users, user_plans, plan_exercises):
+        span = (self.end - self.start).total_seconds()
+        session_count = int(self.years * 52 * self.sessions_per_week)
+
+        sessions = []
+        for user in users:
+            moments = sorted(
+                self.start + timedelta(seconds=self.random.uniform(0, span))
+                for _ in range(session_count)
+            )
+            for moment in moments:
+                minutes = self.random.randint(40, 90)
+                status = (
+                    "cancelled"
+                    if self.random.random() < CANCELLED_SESSION_RATE
+                    else "completed"
+                )
+                sessions.append(
+                    WorkoutSession(
+                        user=user,
+                        workout_plan=self.random.choice(user_plans[user.pk]),
+                        status=status,
+                        started_at=moment,
+                        completed_at=moment + timedelta(minutes=minutes),
+                        total_duration_minutes=(
+                            minutes if status == "completed" else None
+                        ),
+                    )
+                )
+        sessions = WorkoutSession.objects.bulk_create(
+            sessions, batch_size=self.batch_size
+        )
+
+        session_exercises = []
+        for session in sessions:
+            if session.status != "completed":
+                continue
+            for order, workout_exercise in enumerate(
+                plan_exercises[session.workout_plan_id]
+            ):
+                session_exercises.append(
+                    SessionExercise(
+                        session=session,
+                        workout_exercise=workout_exercise,
+                        order=order,
+                        status="completed",
+                        planned_sets=workout_exercise.sets,
+                        planned_repetitions=workout_exercise.repetitions,
+                        completed_sets=workout_exercise.sets,
+                        started_at=session.started_at,
+                        completed_at=session.completed_at,
+                    )
+                )
+        session_exercises = SessionExercise.objects.bulk_create(
+            session_exercises, batch_size=self.batch_size
+        )
+
+        # Working weights start per user and exercise and progress by up to
+        # 30% over the whole history
+        span = span or 1
+        base_weights = {}
+        set_logs = []
+        for session_exercise in session_exercises:
+            session = session_exercise.session
+            workout_exercise = session_exercise.workout_exercise
+            key = (session.user_id, workout_exercise.exercise_id)
+            if key not in base_weights:
+                base_weights[key] = self.random.uniform(20, 100)
+            elapsed = (session.started_at - self.start).total_seconds() / span
+            weight = base_weights[key] * (1 + 0.3 * elapsed)
+            for set_number in range(1, session_exercise.planned_sets + 1):
+                set_logs.append(
+                    SetLog(
+                        session_exercise=session_exercise,
+                        set_number=set_number,
+                        repetitions=max(
+                            1,
+                            workout_exercise.repetitions + self.random.randint(-2, 2),
+                        ),
+                        weight_kg=round(weight * self.random.uniform(0.9, 1.05) / 2.5)
+                        * 2.5,
+                        completed=True,
+                        rest_seconds=self.random.choice([60, 90, 120]),
+                        completed_at=session.started_at
+                        + timedelta(
+                            minutes=order_minutes(session_exercise, set_number)
+                        ),
+                    )
+                )
+            if len(set_logs) >= self.batch_size:
+                self.counts["set_logs"] += len(
+                    SetLog.objects.bulk_create(set_logs, batch_size=self.batch_size)
+                )
+                set_logs = []
+        SetLog.objects.bulk_create(set_logs, batch_size=self.batch_size)
+        self.counts["set_logs"] += len(set_logs)
+        self.counts["sessions"] += len(sessions)
+
+    def generate_weight_logs(self, users, body_weights):
+        days = int((self.end - self.start).days)
+        weight_logs = []
+        dates = []
+        for user in users:
+            weight = body_weights[user.pk]
+            for day in range(0, days + 1, WEIGHT_LOG_INTERVAL_DAYS):
+                weight += self.random.uniform(-0.4, 0.35)
+                weight_logs.append(WeightLog(user=user, weight=round(weight, 1)))
+                dates.append((self.start + timedelta(days=day)).date())
+        weight_logs = WeightLog.objects.bulk_create(
+            weight_logs, batch_size=self.batch_size
+        )
+        # date is auto_now_add, which a bulk insert cannot override, so the
+        # history is backdated with a bulk update
+        for weight_log, day in zip(weight_logs, dates):
+            weight_log.date = day
+        WeightLog.objects.bulk_update(weight_logs, ["date"], batch_size=500)
+        self.counts["weight_logs"] += len(weight_logs)
+
+    def generate_goals(self, users, body_weights, user_plans, plan_exercises):
+        goals = []
+        for user in users:
+            weight = body_weights[user.pk]
+            goals.append(
+                FitnessGoal(
+                    user=user,
+                    goal_type="weight",
+                    target_value=round(weight - 5, 1),
+                    baseline_value=round(weight, 1),
+                    description="Lose 5 kg",
+                )
+            )
+            first_plan = user_plans[user.pk][0]
+            for workout_exercise in plan_exercises.get(first_plan.pk, [])[:1]:
+                exercise = workout_exercise.exercise
+                goals.append(
+                    FitnessGoal(
+                        user=user,
+                        goal_type="exercise",
+                        exercise=exercise,
+                        metric="max_weight_kg",
+                        target_value=150,
+                        description=f"{exercise.name} 150 kg",
+                    )
+                )
+        FitnessGoal.objects.bulk_create(goals)
+
+
+def order_minutes(session_exercise, set_number):
+    """Minutes into the session at which a set was finished"""
+    return session_exercise.order * 12 + set_number * 3
@@ -0,0 +1,135 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.workout.benchmark import (
+    SCENARIOS,
+    build_report,
+    compare_reports,
+    dataset_size,
+    run_benchmarks,
+)
+from apps.workout.loadgen import LOAD_USER_PREFIX
+
+
+class Command(BaseCommand):
+    help = "Measure latency and query counts of every API endpoint, write a JSON report"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Username to benchmark as, the first generated load test user "
+            "by default; must use the load test password",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Measured requests per scenario",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="Unmeasured requests per scenario before timing",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            choices=list(SCENARIOS),
+            metavar="NAME",
+            help="Only run this scenario (can be given several times)",
+        )
+        parser.add_argument(
+            "--throttle",
+            action="store_true",
+            help="Keep request throttling on while benchmarking",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file")
+        parser.add_argument(
+            "--compare", help="Baseline JSON report to compare the results with"
+        )
+        parser.add_argument(
+            "--max-regression",
+            type=float,
+            help="Fail when a median latency grows by more than this many "
+            "percent or a scenario makes more queries than in the baseline",
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+        baseline = self.read_baseline(options["compare"])
+
+        results = run_benchmarks(
+            user,
+            names=options["scenarios"],
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            throttle=options["throttle"],
+        )
+        report = build_report(
+            results, dataset_size(user), options["iterations"], options["warmup"]
+        )
+
+        for name, result in results.items():
+            latency = result["latency_ms"]
+            line = (
+                f"{name:34} median {latency['median']:9.2f} ms  "
+                f"p95 {latency['p95']:9.2f} ms  queries {result['queries']['max']:3}"
+            )
+            if result["errors"]:
+                line = self.style.ERROR(f"{line}  errors {result['errors']}")
+            self.stdout.write(line)
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
+                output.write("\n")
+            self.stdout.write(f"Report written to {options['output']}")
+
+        if baseline is not None:
+            self.compare(baseline, report, options["max_regression"])
+
+    def compare(self, baseline, report, max_regression):
+        regressions = []
+        for row in compare_reports(baseline, report):
+            self.stdout.write(
+                f"{row['name']:34} {row['baseline_ms']:9.2f} -> "
+                f"{row['current_ms']:9.2f} ms ({row['change']:+.0%})  queries "
+                f"{row['baseline_queries']} -> {row['current_queries']}"
+            )
+            if max_regression is not None and (
+                row["change"] * 100 > max_regression
+                or row["current_queries"] > row["baseline_queries"]
+            ):
+                regressions.append(row["name"])
+        if regressions:
+            raise CommandError("Regressions in: " + ", ".join(regressions))
+
+    def read_baseline(self, path):
+        if path is None:
+            return None
+        try:
+            with open(path) as baseline:
+                return json.load(baseline)
+        except (OSError, ValueError) as error:
+            raise CommandError(f"Cannot read baseline report: {error}")
+
+    def get_user(self, username):
+        if username is not None:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f"User {username} does not exist")
+        user = (
+            User.objects.filter(username__startswith=LOAD_USER_PREFIX)
+            .order_by("pk")
+            .first()
+        )
+        if user is None:
+            raise CommandError("No load test users, run generate_load_data first")
+        return user
@@ -0,0 +1,209 @@
+import re
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.workout.models import (
+    Exercise,
+    FitnessGoal,
+    SessionExercise,
+    SetLog,
+    WeightLog,
+    WorkoutExercise,
+    WorkoutPlan,
+    WorkoutSession,
+)
+
+# SQLite reports "SCAN <table>" without an index for full table scans,
+# PostgreSQL reports "Seq Scan on <table>"
+SEQUENTIAL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (\w+)\b(?! USING)"),
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+}
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the hot API queries and fail if any degrades to a sequential scan"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed-users",
+            type=int,
+            default=0,
+            help="Seed a synthetic dataset for this many users before explaining",
+        )
+        parser.add_argument(
+            "--sessions-per-user",
+            type=int,
+            default=50,
+            help="Number of workout sessions seeded per user",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the seeded dataset instead of rolling it back",
+        )
+
+    def handle(self, *args, **options):
+        pattern = SEQUENTIAL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"Unsupported database backend: {connection.vendor}")
+
+        with transaction.atomic():
+            if options["seed_users"]:
+                self.seed(options["seed_users"], options["sessions_per_user"])
+            failures = self.check_plans(pattern, options["verbosity"])
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(
+                "Sequential scans in hot queries: " + ", ".join(sorted(failures))
+            )
+        self.stdout.write(self.style.SUCCESS("All hot queries use an index"))
+
+    def hot_queries(self):
+        """The per-user lookups issued by the workout API"""
+        session = WorkoutSession.objects.order_by("-id").first()
+        session_exercise = SessionExercise.objects.order_by("-id").first()
+        if session is None or session_exercise is None:
+            raise CommandError("No workout data to explain, use --seed-users")
+        user = session.user_id
+
+        return {
+            "session_history": WorkoutSession.objects.filter(user=user).order_by(
+                "-started_at", "-id"
+            )[:20],
+            "active_session": WorkoutSession.objects.active().filter(user=user)[:1],
+            "session_exercises": SessionExercise.objects.filter(
+                session=session
+            ).order_by("order"),
+            "next_exercise": SessionExercise.objects.filter(
+                session=session, status__in=["pending", "in_progress"]
+            ).order_by("order")[:1],
+            "next_set": SetLog.objects.filter(
+                session_exercise=session_exercise, completed=False
+            ).order_by("set_number")[:1],
+            "weight_history": WeightLog.objects.filter(user=user).order_by(
+                "-date", "-id"
+            )[:20],
+            "workout_plans": WorkoutPlan.objects.filter(user=user),
+            "plan_exercises": WorkoutExercise.objects.filter(
+                workout_plan=session.workout_plan_id
+            ).order_by("id"),
+            "fitness_goals": FitnessGoal.objects.filter(user=user),
+        }
+
+    def check_plans(self, pattern, verbosity=1):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        failures = []
+        for name, queryset in self.hot_queries().items():
+            plan = queryset.explain()
+            scanned = pattern.findall(plan)
+            if scanned:
+                failures.append(name)
+                self.stdout.write(
+                    self.style.ERROR(f"{name}: sequential scan on {', '.join(scanned)}")
+                )
+            else:
+                self.stdout.write(f"{name}: OK")
+            if verbosity > 1:
+                self.stdout.write(plan)
+        return failures
+
+    def seed(self, user_count, sessions_per_user):
+        """Bulk insert a synthetic dataset large enough for realistic plans"""
+        self.stdout.write(
+            f"Seeding {user_count} users with {sessions_per_user} sessions each..."
+        )
+        exercises = Exercise.objects.bulk_create(
+            [
+                Exercise(
+                    name=f"Query plan exercise {index}",
+                    description="Synthetic exercise",
+                    instructions="Synthetic exercise",
+                    target_muscles="full body",
+                )
+                for index in range(5)
+            ]
+        )
+        users = User.objects.bulk_create(
+            [
+                User(username=f"query-plan-user-{index}", password="!")
+                for index in range(user_count)
+            ]
+        )
+        plans = WorkoutPlan.objects.bulk_create(
+            [WorkoutPlan(user=user, title="Query plan check") for user in users]
+        )
+        workout_exercises = WorkoutExercise.objects.bulk_create(
+            [
+                WorkoutExercise(workout_plan=plan, exercise=exercise, sets=3)
+                for plan in plans
+                for exercise in exercises
+            ]
+        )
+        WeightLog.objects.bulk_create(
+            [WeightLog(user=user, weight=80) for user in users for _ in range(100)],
+            batch_size=5000,
+        )
+        FitnessGoal.objects.bulk_create(
+            [
+                FitnessGoal(
+                    user=user,
+                    goal_type="weight",
+                    target_value=75,
+                    description="Synthetic goal",
+                )
+                for user in users
+            ]
+        )
+
+        plan_exercises = {}
+        for workout_exercise in workout_exercises:
+            plan_exercises.setdefault(workout_exercise.workout_plan_id, []).append(
+                workout_exercise
+            )
+
+        for plan in plans:
+            sessions = WorkoutSession.objects.bulk_create(
+                [
+                    WorkoutSession(
+                        user_id=plan.user_id,
+                        workout_plan=plan,
+                        status="completed" if index else "in_progress",
+                    )
+                    for index in range(sessions_per_user)
+                ]
+            )
+            session_exercises = SessionExercise.objects.bulk_create(
+                [
+                    SessionExercise(
+                        session=session,
+                        workout_exercise=workout_exercise,
+                        order=order,
+                        planned_sets=workout_exercise.sets,
+                        completed_sets=workout_exercise.sets,
+                        status="completed",
+                    )
+                    for session in sessions
+                    for order, workout_exercise in enumerate(plan_exercises[plan.id])
+                ]
+            )
+            SetLog.objects.bulk_create(
+                [
+                    SetLog(
+                        session_exercise=session_exercise,
+                        set_number=set_number,
+                        repetitions=10,
+                        weight_kg=50,
+                        completed=True,
+                    )
+                    for session_exercise in session_exercises
+                    for set_number in range(1, session_exercise.planned_sets + 1)
+                ],
+                batch_size=5000,
+            )
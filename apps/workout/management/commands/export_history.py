@@ -0,0 +1,49 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.workout.export import EXPORT_TABLES, export_csv, export_ndjson
+
+
+class Command(BaseCommand):
+    help = "Stream a user's training history as NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("user", help="Username or id of the user to export")
+        parser.add_argument(
+            "--format", choices=["ndjson", "csv"], default="ndjson", dest="fmt"
+        )
+        parser.add_argument(
+            "--table",
+            action="append",
+            dest="tables",
+            choices=list(EXPORT_TABLES),
+            help="Table to export (can be given several times, one for CSV)",
+        )
+        parser.add_argument(
+            "--output", help="File to write to instead of standard output"
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+        tables = options["tables"]
+
+        if options["fmt"] == "csv":
+            if not tables or len(tables) != 1:
+                raise CommandError("CSV exports need exactly one --table")
+            lines = export_csv(user, tables[0])
+        else:
+            lines = export_ndjson(user, tables)
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
+
+    def get_user(self, value):
+        lookup = {"pk": value} if value.isdigit() else {"username": value}
+        try:
+            return User.objects.get(**lookup)
+        except User.DoesNotExist:
+            raise CommandError(f"User {value} does not exist")
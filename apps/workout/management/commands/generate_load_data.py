@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+
+from apps.workout.loadgen import LOAD_USER_PREFIX, LoadDataGenerator
+
+
+class Command(BaseCommand):
+    help = "Bulk insert synthetic users and years of training history for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=100, help="Number of users to create"
+        )
+        parser.add_argument(
+            "--years",
+            type=float,
+            default=1.0,
+            help="Length of each user's training history in years",
+        )
+        parser.add_argument(
+            "--sessions-per-week",
+            type=int,
+            default=3,
+            help="Workout sessions per user and week",
+        )
+        parser.add_argument(
+            "--plans-per-user", type=int, default=3, help="Workout plans per user"
+        )
+        parser.add_argument(
+            "--exercises-per-plan",
+            type=int,
+            default=5,
+            help="Exercises in every workout plan",
+        )
+        parser.add_argument(
+            "--sets-per-exercise",
+            type=int,
+            default=3,
+            help="Sets logged for every exercise of a session",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed, same seed same data"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows inserted per query",
+        )
+
+    def handle(self, *args, **options):
+        generator = LoadDataGenerator(
+            users=options["users"],
+            years=options["years"],
+            sessions_per_week=options["sessions_per_week"],
+            plans_per_user=options["plans_per_user"],
+            exercises_per_plan=options["exercises_per_plan"],
+            sets_per_exercise=options["sets_per_exercise"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            progress=self.report_progress,
+        )
+        counts = generator.run()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {counts['users']} users ({LOAD_USER_PREFIX}*) with "
+                f"{counts['sessions']} sessions, {counts['set_logs']} set logs and "
+                f"{counts['weight_logs']} weight logs"
+            )
+        )
+
+    def report_progress(self, counts):
+        self.stdout.write(
+            f"{counts['users']} users, {counts['sessions']} sessions, "
+            f"{counts['set_logs']} set logs"
+        )
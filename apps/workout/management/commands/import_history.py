@@ -0,0 +1,62 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.workout.importer import (
+    IMPORT_CHUNK_SIZE,
+    READERS,
+    HistoryImporter,
+    ImportAborted,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import historical workouts for a user from CSV or NDJSON set rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument("user", help="Username or id of the user to import for")
+        parser.add_argument("path", help="CSV or NDJSON file, one set per row")
+        parser.add_argument(
+            "--format",
+            choices=list(READERS),
+            dest="fmt",
+            help="File format, guessed from the extension by default",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Number of set rows written per transaction",
+        )
+
+    def handle(self, *args, **options):
+        user = self.get_user(options["user"])
+        path = options["path"]
+        fmt = options["fmt"] or ("csv" if path.lower().endswith(".csv") else "ndjson")
+
+        importer = HistoryImporter(
+            user, chunk_size=options["chunk_size"], progress=self.report_progress
+        )
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as lines:
+                report = importer.run(READERS[fmt](lines))
+        except (ImportAborted, OSError, UnicodeDecodeError) as error:
+            raise CommandError(str(error))
+
+        for error in report["errors"]:
+            self.stderr.write(f"Row {error['row']}: {error['error']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report['sets']} sets in {report['sessions']} sessions "
+                f"from {report['rows']} rows, skipped {report['error_count']}"
+            )
+        )
+
+    def report_progress(self, rows, sessions, sets):
+        self.stdout.write(f"{rows} rows read, {sessions} sessions, {sets} sets")
+
+    def get_user(self, value):
+        lookup = {"pk": value} if value.isdigit() else {"username": value}
+        try:
+            return User.objects.get(**lookup)
+        except User.DoesNotExist:
+            raise CommandError(f"User {value} does not exist")
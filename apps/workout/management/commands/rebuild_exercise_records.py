@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from apps.workout.analytics import rebuild_exercise_records
+
+
+class Command(BaseCommand):
+    help = "Recompute personal records and weekly exercise stats from set history"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only rebuild this user id (can be given several times)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of summary rows inserted per query",
+        )
+
+    def handle(self, *args, **options):
+        records, weeks = rebuild_exercise_records(
+            users=options["users"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {records} exercise records and {weeks} weeks")
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.workout.analytics import rebuild_training_aggregates
+
+
+class Command(BaseCommand):
+    help = "Recompute the daily and weekly training aggregates from history"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only rebuild this user id (can be given several times)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of users aggregated and written per batch",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_training_aggregates(
+            users=options["users"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} training aggregates"))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.workout.goals import reevaluate_goals
+
+
+class Command(BaseCommand):
+    help = "Re-check every open fitness goal against current weight and records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only re-evaluate this user id (can be given several times)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of users whose goals are evaluated per query",
+        )
+
+    def handle(self, *args, **options):
+        achieved = reevaluate_goals(
+            users=options["users"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Marked {achieved} goals achieved"))
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sessionexercise",
+            index=models.Index(
+                fields=["session", "order"], name="sessionex_session_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="setlog",
+            index=models.Index(
+                fields=["session_exercise", "completed", "set_number"],
+                name="setlog_next_set_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutsession",
+            index=models.Index(
+                condition=models.Q(("status", "in_progress")),
+                fields=["user"],
+                name="session_user_active_idx",
+            ),
+        ),
+    ]
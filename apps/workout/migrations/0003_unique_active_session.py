@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:21
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Now
+
+
+def cancel_duplicate_active_sessions(apps, schema_editor):
+    """Keep only the latest in-progress session of each user"""
+    WorkoutSession = apps.get_model("workout", "WorkoutSession")
+    latest = (
+        WorkoutSession.objects.filter(status="in_progress", user=OuterRef("user"))
+        .order_by("-started_at", "-id")
+        .values("id")[:1]
+    )
+    WorkoutSession.objects.filter(status="in_progress").exclude(
+        id=Subquery(latest)
+    ).update(status="cancelled", completed_at=Now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0002_query_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="workoutsession",
+            name="session_user_active_idx",
+        ),
+        migrations.RunPython(
+            cancel_duplicate_active_sessions, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="workoutsession",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "in_progress")),
+                fields=("user",),
+                name="unique_active_session_per_user",
+            ),
+        ),
+    ]
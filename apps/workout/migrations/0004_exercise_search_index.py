@@ -0,0 +1,145 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:29
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of the tokenizer in apps.workout.search as of this migration,
+# so later changes to it do not alter what the backfill writes
+
+FIELD_WEIGHTS = {"name": 4, "description": 2, "instructions": 1}
+
+STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "at",
+    "by",
+    "for",
+    "from",
+    "in",
+    "of",
+    "on",
+    "or",
+    "the",
+    "to",
+    "until",
+    "up",
+    "with",
+    "your",
+}
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+FACET_SEPARATOR_RE = re.compile(r",|\bor\b")
+
+
+def normalize_word(word):
+    word = word.lower()
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    return [
+        normalize_word(word)
+        for word in WORD_RE.findall((text or "").lower())
+        if word not in STOP_WORDS
+    ]
+
+
+def split_facet_values(value):
+    values = []
+    for part in FACET_SEPARATOR_RE.split((value or "").lower()):
+        part = " ".join(part.split())
+        if part and part not in values:
+            values.append(part[:100])
+    return values
+
+
+def build_terms(name, description, instructions, target_muscles, equipment):
+    weights = {}
+    fields = {"name": name, "description": description, "instructions": instructions}
+    for field, text in fields.items():
+        for word in set(tokenize(text)):
+            key = ("word", word[:100])
+            weights[key] = weights.get(key, 0) + FIELD_WEIGHTS[field]
+    for muscle in split_facet_values(target_muscles):
+        weights[("muscle", muscle)] = 1
+    for item in split_facet_values(equipment):
+        weights[("equipment", item)] = 1
+    return [(kind, term, weight) for (kind, term), weight in weights.items()]
+
+
+def index_existing_exercises(apps, schema_editor):
+    Exercise = apps.get_model("workout", "Exercise")
+    ExerciseTerm = apps.get_model("workout", "ExerciseTerm")
+    ExerciseTerm.objects.bulk_create(
+        [
+            ExerciseTerm(exercise=exercise, kind=kind, term=term, weight=weight)
+            for exercise in Exercise.objects.iterator()
+            for kind, term, weight in build_terms(
+                exercise.name,
+                exercise.description,
+                exercise.instructions,
+                exercise.target_muscles,
+                exercise.equipment,
+            )
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0003_unique_active_session"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("word", "Word"),
+                            ("muscle", "Target Muscle"),
+                            ("equipment", "Equipment"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("term", models.CharField(max_length=100)),
+                ("weight", models.PositiveIntegerField(default=1)),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="terms",
+                        to="workout.exercise",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "term"], name="exerciseterm_lookup_idx"
+                    )
+                ],
+                "unique_together": {("exercise", "kind", "term")},
+            },
+        ),
+        migrations.RunPython(index_existing_exercises, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0004_exercise_search_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sets", models.PositiveIntegerField(default=0)),
+                ("repetitions", models.PositiveIntegerField(default=0)),
+                ("volume_kg", models.FloatField(default=0)),
+                ("max_weight_kg", models.FloatField(default=0)),
+                ("max_repetitions", models.PositiveIntegerField(default=0)),
+                ("best_set_volume_kg", models.FloatField(default=0)),
+                ("estimated_one_rep_max_kg", models.FloatField(default=0)),
+                ("first_performed_at", models.DateTimeField()),
+                ("last_performed_at", models.DateTimeField()),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="records",
+                        to="workout.exercise",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_records",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "exercise")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ExerciseWeeklyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("week_start", models.DateField()),
+                ("sets", models.PositiveIntegerField(default=0)),
+                ("repetitions", models.PositiveIntegerField(default=0)),
+                ("volume_kg", models.FloatField(default=0)),
+                ("max_weight_kg", models.FloatField(default=0)),
+                ("max_repetitions", models.PositiveIntegerField(default=0)),
+                ("best_set_volume_kg", models.FloatField(default=0)),
+                ("estimated_one_rep_max_kg", models.FloatField(default=0)),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weekly_stats",
+                        to="workout.exercise",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_weekly_stats",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "exercise", "week_start")},
+            },
+        ),
+    ]
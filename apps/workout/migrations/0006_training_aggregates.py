@@ -0,0 +1,56 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0005_exercise_records"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrainingAggregate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("day", "Day"), ("week", "Week")], max_length=4
+                    ),
+                ),
+                ("period_start", models.DateField()),
+                ("sessions_completed", models.PositiveIntegerField(default=0)),
+                ("sessions_cancelled", models.PositiveIntegerField(default=0)),
+                ("minutes", models.PositiveIntegerField(default=0)),
+                ("sets", models.PositiveIntegerField(default=0)),
+                ("repetitions", models.PositiveIntegerField(default=0)),
+                ("volume_kg", models.FloatField(default=0)),
+                ("duration_seconds", models.PositiveIntegerField(default=0)),
+                ("distance_meters", models.PositiveIntegerField(default=0)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="training_aggregates",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "period", "period_start")},
+            },
+        ),
+    ]
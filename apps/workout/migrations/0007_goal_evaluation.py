@@ -0,0 +1,58 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0006_training_aggregates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fitnessgoal",
+            name="achieved_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="fitnessgoal",
+            name="baseline_value",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="fitnessgoal",
+            name="exercise",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="goals",
+                to="workout.exercise",
+            ),
+        ),
+        migrations.AddField(
+            model_name="fitnessgoal",
+            name="metric",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("max_weight_kg", "Max Weight"),
+                    ("max_repetitions", "Max Repetitions"),
+                    ("estimated_one_rep_max_kg", "Estimated One-Rep Max"),
+                    ("best_set_volume_kg", "Best Set Volume"),
+                ],
+                default="",
+                max_length=30,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="fitnessgoal",
+            index=models.Index(
+                fields=["user", "goal_type", "achieved"], name="goal_user_type_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-18 00:54
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0007_goal_evaluation"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="workoutsession",
+            name="started_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
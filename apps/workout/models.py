@@ -1,5 +1,13 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class WorkoutSessionQuerySet(models.QuerySet):
+    def active(self):
+        """Sessions still in progress, at most one per user"""
+        return self.filter(status="in_progress")
 
 
 class WorkoutSession(models.Model):
@@ -22,13 +30,30 @@ class WorkoutSession(models.Model):
     status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default="in_progress"
     )
-    started_at = models.DateTimeField(auto_now_add=True)
+    # A default rather than auto_now_add so imported history keeps its dates
+    started_at = models.DateTimeField(default=timezone.now)
     completed_at = models.DateTimeField(null=True, blank=True)
     notes = models.TextField(blank=True, null=True)
     total_duration_minutes = models.PositiveIntegerField(null=True, blank=True)
 
+    objects = WorkoutSessionQuerySet.as_manager()
+
     class Meta:
         ordering = ["-started_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-started_at", "-id"], name="session_user_started_idx"
+            ),
+        ]
+        constraints = [
+            # At most one in-progress session per user; also serves as the
+            # unique index behind the active-session lookup
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=Q(status="in_progress"),
+                name="unique_active_session_per_user",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.workout_plan.title} ({self.status})"
@@ -64,6 +89,11 @@ class SessionExercise(models.Model):
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["session", "order"], name="sessionex_session_order_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.workout_exercise.exercise.name} in {self.session}"
@@ -91,6 +121,12 @@ class SetLog(models.Model):
     class Meta:
         ordering = ["set_number"]
         unique_together = ["session_exercise", "set_number"]
+        indexes = [
+            models.Index(
+                fields=["session_exercise", "completed", "set_number"],
+                name="setlog_next_set_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Set {self.set_number} of {self.session_exercise}"
@@ -119,6 +155,32 @@ class Exercise(models.Model):
         return self.name
 
 
+class ExerciseTerm(models.Model):
+    """Inverted index entry used by exercise search and facets"""
+
+    KIND_CHOICES = [
+        ("word", "Word"),
+        ("muscle", "Target Muscle"),
+        ("equipment", "Equipment"),
+    ]
+
+    exercise = models.ForeignKey(
+        Exercise, on_delete=models.CASCADE, related_name="terms"
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    term = models.CharField(max_length=100)
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ["exercise", "kind", "term"]
+        indexes = [
+            models.Index(fields=["kind", "term"], name="exerciseterm_lookup_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.term} -> {self.exercise_id}"
+
+
 class WorkoutPlan(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="workout_plans"
@@ -155,11 +217,26 @@ class WeightLog(models.Model):
     weight = models.FloatField()
     date = models.DateField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "-date", "-id"], name="weightlog_user_date_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.username} - {self.weight}kg on {self.date}"
 
 
 class FitnessGoal(models.Model):
+    # Exercise goals are measured against these ExerciseRecord fields
+    METRIC_CHOICES = [
+        ("max_weight_kg", "Max Weight"),
+        ("max_repetitions", "Max Repetitions"),
+        ("estimated_one_rep_max_kg", "Estimated One-Rep Max"),
+        ("best_set_volume_kg", "Best Set Volume"),
+    ]
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="fitness_goals"
     )
@@ -175,5 +252,121 @@ class FitnessGoal(models.Model):
     achieved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    exercise = models.ForeignKey(
+        Exercise,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="goals",
+    )
+    metric = models.CharField(
+        max_length=30, choices=METRIC_CHOICES, blank=True, default=""
+    )
+    # Body weight when the goal was set, tells losing from gaining weight
+    baseline_value = models.FloatField(null=True, blank=True)
+    achieved_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "goal_type", "achieved"], name="goal_user_type_idx"
+            ),
+        ]
+
     def __str__(self):
         return f"Goal: {self.description} ({self.user.username})"
+
+
+class ExerciseRecord(models.Model):
+    """Personal records and lifetime totals of a user on one exercise
+
+    Maintained incrementally as sets are completed, see ``analytics``.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="exercise_records",
+    )
+    exercise = models.ForeignKey(
+        Exercise, on_delete=models.CASCADE, related_name="records"
+    )
+    sets = models.PositiveIntegerField(default=0)
+    repetitions = models.PositiveIntegerField(default=0)
+    volume_kg = models.FloatField(default=0)
+    max_weight_kg = models.FloatField(default=0)
+    max_repetitions = models.PositiveIntegerField(default=0)
+    best_set_volume_kg = models.FloatField(default=0)
+    estimated_one_rep_max_kg = models.FloatField(default=0)
+    first_performed_at = models.DateTimeField()
+    last_performed_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ["user", "exercise"]
+
+    def __str__(self):
+        return f"{self.user} records on {self.exercise}"
+
+
+class ExerciseWeeklyStats(models.Model):
+    """Training volume and bests of a user on one exercise for one week"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="exercise_weekly_stats",
+    )
+    exercise = models.ForeignKey(
+        Exercise, on_delete=models.CASCADE, related_name="weekly_stats"
+    )
+    week_start = models.DateField()
+    sets = models.PositiveIntegerField(default=0)
+    repetitions = models.PositiveIntegerField(default=0)
+    volume_kg = models.FloatField(default=0)
+    max_weight_kg = models.FloatField(default=0)
+    max_repetitions = models.PositiveIntegerField(default=0)
+    best_set_volume_kg = models.FloatField(default=0)
+    estimated_one_rep_max_kg = models.FloatField(default=0)
+
+    class Meta:
+        # Also the index behind the per-exercise week range lookup
+        unique_together = ["user", "exercise", "week_start"]
+
+    def __str__(self):
+        return f"{self.user} on {self.exercise}, week of {self.week_start}"
+
+
+class TrainingAggregate(models.Model):
+    """Training totals of a user for one day or one week
+
+    Maintained incrementally as sets and sessions are finished, so stats
+    screens read one row per period instead of the underlying sets.
+    """
+
+    PERIOD_CHOICES = [
+        ("day", "Day"),
+        ("week", "Week"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="training_aggregates",
+    )
+    period = models.CharField(max_length=4, choices=PERIOD_CHOICES)
+    period_start = models.DateField()
+    sessions_completed = models.PositiveIntegerField(default=0)
+    sessions_cancelled = models.PositiveIntegerField(default=0)
+    minutes = models.PositiveIntegerField(default=0)
+    sets = models.PositiveIntegerField(default=0)
+    repetitions = models.PositiveIntegerField(default=0)
+    volume_kg = models.FloatField(default=0)
+    duration_seconds = models.PositiveIntegerField(default=0)
+    distance_meters = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        # Also the index behind the per-user period range lookup
+        unique_together = ["user", "period", "period_start"]
+
+    def __str__(self):
+        return f"{self.user} training, {self.period} of {self.period_start}"
@@ -0,0 +1,130 @@
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.serializers import Serializer
+
+from . import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Identical SELECTs within one request before they count as an N+1
+DEFAULT_THRESHOLD = 5
+
+IN_LIST_RE = re.compile(r"IN \((?:%s, )*%s\)")
+WHITESPACE_RE = re.compile(r"\s+")
+
+PROJECT_ROOT = str(Path(settings.BASE_DIR).resolve())
+
+# Execute wrappers, never the code responsible for a query
+WRAPPER_FILES = {__file__, instrumentation.__file__}
+
+
+class NPlusOneError(Exception):
+    """The same query was repeated for every row of a result"""
+
+
+def query_shape(sql):
+    """SQL with placeholder lists collapsed, equal for every row of an N+1"""
+    return IN_LIST_RE.sub("IN (...)", WHITESPACE_RE.sub(" ", sql.strip()))
+
+
+def serializer_path(frame):
+    """Dotted serializer field path being rendered at ``frame``, if any.
+
+    DRF's ``Serializer.to_representation`` loops over its fields as
+    ``field``, so the path is rebuilt from the enclosing frames.
+    """
+    parts = []
+    while frame is not None:
+        serializer = frame.f_locals.get("self")
+        field = frame.f_locals.get("field")
+        if (
+            frame.f_code.co_name == "to_representation"
+            and isinstance(serializer, Serializer)
+            and field is not None
+        ):
+            parts.append((type(serializer).__name__, field.field_name))
+        frame = frame.f_back
+    if not parts:
+        return None
+    parts.reverse()
+    return ".".join([parts[0][0]] + [name for _, name in parts])
+
+
+def project_origin(frame):
+    """``file:line in function`` of the innermost project frame"""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(PROJECT_ROOT)
+            and "site-packages" not in filename
+            and filename not in WRAPPER_FILES
+        ):
+            return (
+                f"{Path(filename).relative_to(PROJECT_ROOT)}:{frame.f_lineno} "
+                f"in {frame.f_code.co_name}"
+            )
+        frame = frame.f_back
+    return None
+
+
+class QueryShapeTracker:
+    """Database execute wrapper spotting SELECTs repeated within a request"""
+
+    def __init__(self, threshold, action, label):
+        self.threshold = threshold
+        self.action = action
+        self.label = label
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper() == "SELECT":
+            shape = query_shape(sql)
+            self.shapes[shape] += 1
+            if self.shapes[shape] == self.threshold:
+                self.report(shape)
+        return execute(sql, params, many, context)
+
+    def report(self, shape):
+        frame = sys._getframe(1)
+        message = (
+            f"{self.label}: the same query ran {self.threshold} times, "
+            f"field {serializer_path(frame) or '-'}, "
+            f"from {project_origin(frame) or '-'}: {shape}"
+        )
+        if self.action == "raise":
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+
+class NPlusOneMiddleware:
+    """Warn about or reject N+1 query patterns in development and tests.
+
+    Enabled by ``N_PLUS_ONE_ACTION`` ("warn" or "raise"). A SELECT repeated
+    ``N_PLUS_ONE_THRESHOLD`` times within one request is reported with the
+    serializer field being rendered and the project code that issued it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        action = getattr(settings, "N_PLUS_ONE_ACTION", None)
+        if action not in ("warn", "raise"):
+            return self.get_response(request)
+
+        tracker = QueryShapeTracker(
+            getattr(settings, "N_PLUS_ONE_THRESHOLD", DEFAULT_THRESHOLD),
+            action,
+            f"{request.method} {request.path}",
+        )
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(tracker))
+            return self.get_response(request)
@@ -0,0 +1,21 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TimeOrderedCursorPagination(CursorPagination):
+    """Keyset pagination without COUNT(*) or OFFSET scans on deep pages"""
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class WorkoutSessionCursorPagination(TimeOrderedCursorPagination):
+    ordering = ("-started_at", "-id")
+
+
+class SetLogCursorPagination(TimeOrderedCursorPagination):
+    # Set logs are created in workout order, so the primary key is their timeline
+    ordering = ("-id",)
+
+
+class WeightLogCursorPagination(TimeOrderedCursorPagination):
+    ordering = ("-date", "-id")
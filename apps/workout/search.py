@@ -0,0 +1,144 @@
+"""Ranked search and facet filtering over the exercise catalog
+
+Exercises are tokenized into ExerciseTerm rows when they are saved: words
+from the name, description and instructions with per-field weights, and the
+normalized comma-separated target muscles and equipment. Queries then run
+as indexed lookups on (kind, term) instead of LIKE scans over free text,
+and behave the same on SQLite and PostgreSQL.
+"""
+
+import re
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from .models import Exercise, ExerciseTerm
+
+FIELD_WEIGHTS = {"name": 4, "description": 2, "instructions": 1}
+
+STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "at",
+    "by",
+    "for",
+    "from",
+    "in",
+    "of",
+    "on",
+    "or",
+    "the",
+    "to",
+    "until",
+    "up",
+    "with",
+    "your",
+}
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+FACET_SEPARATOR_RE = re.compile(r",|\bor\b")
+
+
+def normalize_word(word):
+    """Lowercase a word and strip a plural "s" so squat matches squats"""
+    word = word.lower()
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    return [
+        normalize_word(word)
+        for word in WORD_RE.findall((text or "").lower())
+        if word not in STOP_WORDS
+    ]
+
+
+def split_facet_values(value):
+    """Split free-form "chest, triceps" style values into normalized facets"""
+    values = []
+    for part in FACET_SEPARATOR_RE.split((value or "").lower()):
+        part = " ".join(part.split())
+        if part and part not in values:
+            values.append(part[:100])
+    return values
+
+
+def build_terms(name, description, instructions, target_muscles, equipment):
+    """Return (kind, term, weight) tuples describing one exercise"""
+    weights = {}
+    fields = {"name": name, "description": description, "instructions": instructions}
+    for field, text in fields.items():
+        for word in set(tokenize(text)):
+            key = ("word", word[:100])
+            weights[key] = weights.get(key, 0) + FIELD_WEIGHTS[field]
+    for muscle in split_facet_values(target_muscles):
+        weights[("muscle", muscle)] = 1
+    for item in split_facet_values(equipment):
+        weights[("equipment", item)] = 1
+    return [(kind, term, weight) for (kind, term), weight in weights.items()]
+
+
+def index_exercises(exercises):
+    """Rebuild the search terms of the given exercises in bulk"""
+    exercises = list(exercises)
+    with transaction.atomic():
+        ExerciseTerm.objects.filter(exercise__in=exercises).delete()
+        ExerciseTerm.objects.bulk_create(
+            [
+                ExerciseTerm(exercise=exercise, kind=kind, term=term, weight=weight)
+                for exercise in exercises
+                for kind, term, weight in build_terms(
+                    exercise.name,
+                    exercise.description,
+                    exercise.instructions,
+                    exercise.target_muscles,
+                    exercise.equipment,
+                )
+            ],
+            batch_size=1000,
+        )
+
+
+def search_exercises(query="", muscles=(), equipment=()):
+    """Rank exercises matching every query word and all facet filters
+
+    Returns the ranked queryset and the muscle/equipment facet counts over
+    the whole result set.
+    """
+    exercises = Exercise.objects.all()
+    for kind, values in (("muscle", muscles), ("equipment", equipment)):
+        for value in values:
+            value = " ".join(value.lower().split())
+            exercises = exercises.filter(
+                pk__in=ExerciseTerm.objects.filter(kind=kind, term=value).values(
+                    "exercise"
+                )
+            )
+
+    words = set(tokenize(query))
+    if words:
+        exercises = (
+            exercises.filter(terms__kind="word", terms__term__in=words)
+            .annotate(rank=Sum("terms__weight"), matched=Count("terms"))
+            .filter(matched=len(words))
+            .order_by("-rank", "name")
+        )
+    else:
+        exercises = exercises.order_by("name")
+
+    facet_rows = (
+        ExerciseTerm.objects.filter(
+            kind__in=["muscle", "equipment"], exercise__in=exercises.values("pk")
+        )
+        .values_list("kind", "term")
+        .annotate(count=Count("id"))
+        .order_by("kind", "-count", "term")
+    )
+    facets = {"muscle": [], "equipment": []}
+    for kind, term, count in facet_rows:
+        facets[kind].append({"value": term, "count": count})
+
+    return exercises, facets
@@ -1,7 +1,42 @@
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Prefetch,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce
 from rest_framework import serializers
 from .models import *
 
 
+class EagerLoadingMixin:
+    """Declares the relations a serializer reads so views can preload them"""
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def get_prefetch_related_fields(cls):
+        return list(cls.prefetch_related_fields)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Apply this serializer's select/prefetch plan to a queryset"""
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        prefetch_related_fields = cls.get_prefetch_related_fields()
+        if prefetch_related_fields:
+            queryset = queryset.prefetch_related(*prefetch_related_fields)
+        return queryset
+
+
 class ProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Profile
@@ -21,13 +56,35 @@ class ExerciseSerializer(serializers.ModelSerializer):
             "equipment",
         ]
 
+    def to_representation(self, instance):
+        # Nested in plans and sessions the same exercise repeats many times
+        # per response, so each one is serialized once per serializer tree
+        if self.parent is None:
+            return super().to_representation(instance)
+        representations = self.context.setdefault("exercise_representations", {})
+        if instance.pk not in representations:
+            representations[instance.pk] = super().to_representation(instance)
+        return representations[instance.pk]
+
+
+class ExerciseSearchResultSerializer(ExerciseSerializer):
+    rank = serializers.SerializerMethodField()
 
-class WorkoutExerciseSerializer(serializers.ModelSerializer):
+    class Meta(ExerciseSerializer.Meta):
+        fields = ExerciseSerializer.Meta.fields + ["rank"]
+
+    def get_rank(self, obj):
+        return getattr(obj, "rank", None)
+
+
+class WorkoutExerciseSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     exercise = ExerciseSerializer(read_only=True)
     exercise_id = serializers.PrimaryKeyRelatedField(
         queryset=Exercise.objects.all(), source="exercise", write_only=True
     )
 
+    select_related_fields = ["exercise"]
+
     class Meta:
         model = WorkoutExercise
         fields = [
@@ -42,9 +99,20 @@ class WorkoutExerciseSerializer(serializers.ModelSerializer):
         ]
 
 
-class WorkoutPlanSerializer(serializers.ModelSerializer):
+class WorkoutPlanSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     exercises = WorkoutExerciseSerializer(many=True, read_only=True)
 
+    @classmethod
+    def get_prefetch_related_fields(cls):
+        return [
+            Prefetch(
+                "exercises",
+                queryset=WorkoutExerciseSerializer.setup_eager_loading(
+                    WorkoutExercise.objects.all()
+                ),
+            )
+        ]
+
     class Meta:
         model = WorkoutPlan
         fields = [
@@ -67,6 +135,106 @@ class WeightLogSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "date", "user"]
 
 
+class ExerciseRecordSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    exercise_name = serializers.CharField(source="exercise.name", read_only=True)
+
+    select_related_fields = ["exercise"]
+
+    class Meta:
+        model = ExerciseRecord
+        fields = [
+            "exercise",
+            "exercise_name",
+            "sets",
+            "repetitions",
+            "volume_kg",
+            "max_weight_kg",
+            "max_repetitions",
+            "best_set_volume_kg",
+            "estimated_one_rep_max_kg",
+            "first_performed_at",
+            "last_performed_at",
+        ]
+        read_only_fields = fields
+
+
+class ExerciseWeeklyStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ExerciseWeeklyStats
+        fields = [
+            "week_start",
+            "sets",
+            "repetitions",
+            "volume_kg",
+            "max_weight_kg",
+            "max_repetitions",
+            "best_set_volume_kg",
+            "estimated_one_rep_max_kg",
+        ]
+        read_only_fields = fields
+
+
+class TrainingAggregateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TrainingAggregate
+        fields = [
+            "period_start",
+            "sessions_completed",
+            "sessions_cancelled",
+            "minutes",
+            "sets",
+            "repetitions",
+            "volume_kg",
+            "duration_seconds",
+            "distance_meters",
+        ]
+        read_only_fields = fields
+
+
+class WeightSeriesQuerySerializer(serializers.Serializer):
+    """Query parameters of the weight chart series"""
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    bucket = serializers.ChoiceField(choices=["day", "week", "month"], default="day")
+    points = serializers.IntegerField(min_value=3, max_value=5000, default=500)
+    window = serializers.IntegerField(min_value=1, max_value=365, default=7)
+
+    def validate(self, attrs):
+        if "start" in attrs and "end" in attrs and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError("start must not be after end.")
+        return attrs
+
+
+class WeightSeriesPointSerializer(serializers.Serializer):
+    date = serializers.DateField(source="bucket")
+    average = serializers.FloatField()
+    minimum = serializers.FloatField()
+    maximum = serializers.FloatField()
+    count = serializers.IntegerField()
+    moving_average = serializers.FloatField()
+
+
+class ImportHistorySerializer(serializers.Serializer):
+    """Upload of historical workouts as flat set rows"""
+
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(choices=["csv", "ndjson"], required=False)
+
+    def validate(self, attrs):
+        if "file_format" not in attrs:
+            name = attrs["file"].name.lower()
+            if name.endswith(".csv"):
+                attrs["file_format"] = "csv"
+            elif name.endswith((".ndjson", ".jsonl")):
+                attrs["file_format"] = "ndjson"
+            else:
+                raise serializers.ValidationError(
+                    {"file_format": ["Cannot tell the format from the file name."]}
+                )
+        return attrs
+
+
 class FitnessGoalSerializer(serializers.ModelSerializer):
     class Meta:
         model = FitnessGoal
@@ -76,10 +244,35 @@ class FitnessGoalSerializer(serializers.ModelSerializer):
             "goal_type",
             "target_value",
             "description",
+            "exercise",
+            "metric",
+            "baseline_value",
             "achieved",
+            "achieved_at",
             "created_at",
         ]
-        read_only_fields = ["id", "created_at", "user"]
+        read_only_fields = [
+            "id",
+            "created_at",
+            "user",
+            "baseline_value",
+            "achieved_at",
+        ]
+
+    def validate(self, attrs):
+        goal_type = attrs.get("goal_type", getattr(self.instance, "goal_type", None))
+        exercise = attrs.get("exercise", getattr(self.instance, "exercise", None))
+        metric = attrs.get("metric", getattr(self.instance, "metric", ""))
+
+        if goal_type != "exercise" and (exercise or metric):
+            raise serializers.ValidationError(
+                "Only exercise goals can track an exercise metric."
+            )
+        if bool(exercise) != bool(metric):
+            raise serializers.ValidationError(
+                "Exercise and metric must be given together."
+            )
+        return attrs
 
 
 class SetLogSerializer(serializers.ModelSerializer):
@@ -101,7 +294,7 @@ class SetLogSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "completed_at"]
 
 
-class SessionExerciseSerializer(serializers.ModelSerializer):
+class SessionExerciseSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     exercise_name = serializers.CharField(
         source="workout_exercise.exercise.name", read_only=True
     )
@@ -113,6 +306,9 @@ class SessionExerciseSerializer(serializers.ModelSerializer):
     )
     set_logs = SetLogSerializer(many=True, read_only=True)
 
+    select_related_fields = ["workout_exercise__exercise"]
+    prefetch_related_fields = ["set_logs"]
+
     class Meta:
         model = SessionExercise
         fields = [
@@ -146,12 +342,25 @@ class SessionExerciseDetailSerializer(SessionExerciseSerializer):
         fields = SessionExerciseSerializer.Meta.fields + ["exercise"]
 
 
-class WorkoutSessionSerializer(serializers.ModelSerializer):
+class WorkoutSessionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     workout_plan_title = serializers.CharField(
         source="workout_plan.title", read_only=True
     )
     session_exercises = SessionExerciseSerializer(many=True, read_only=True)
 
+    select_related_fields = ["workout_plan"]
+
+    @classmethod
+    def get_prefetch_related_fields(cls):
+        return [
+            Prefetch(
+                "session_exercises",
+                queryset=SessionExerciseSerializer.setup_eager_loading(
+                    SessionExercise.objects.all()
+                ),
+            )
+        ]
+
     class Meta:
         model = WorkoutSession
         fields = [
@@ -169,6 +378,99 @@ class WorkoutSessionSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "user", "started_at", "completed_at"]
 
 
+class WorkoutSessionSummarySerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    """Per-session totals aggregated in SQL instead of the nested tree"""
+
+    workout_plan_title = serializers.CharField(
+        source="workout_plan.title", read_only=True
+    )
+    exercise_count = serializers.IntegerField(read_only=True)
+    completed_exercise_count = serializers.IntegerField(read_only=True)
+    set_count = serializers.IntegerField(read_only=True)
+    completed_set_count = serializers.IntegerField(read_only=True)
+    total_repetitions = serializers.IntegerField(read_only=True)
+    total_volume_kg = serializers.FloatField(read_only=True)
+    total_duration_seconds = serializers.IntegerField(read_only=True)
+    total_distance_meters = serializers.IntegerField(read_only=True)
+    completion_ratio = serializers.FloatField(read_only=True)
+
+    select_related_fields = ["workout_plan"]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        queryset = super().setup_eager_loading(queryset)
+        completed = Q(session_exercises__set_logs__completed=True)
+        queryset = queryset.annotate(
+            exercise_count=Count("session_exercises", distinct=True),
+            completed_exercise_count=Count(
+                "session_exercises",
+                filter=Q(session_exercises__status="completed"),
+                distinct=True,
+            ),
+            set_count=Count("session_exercises__set_logs"),
+            completed_set_count=Count("session_exercises__set_logs", filter=completed),
+            total_repetitions=Coalesce(
+                Sum("session_exercises__set_logs__repetitions", filter=completed),
+                Value(0),
+                output_field=IntegerField(),
+            ),
+            total_volume_kg=Coalesce(
+                Sum(
+                    F("session_exercises__set_logs__repetitions")
+                    * F("session_exercises__set_logs__weight_kg"),
+                    filter=completed,
+                    output_field=FloatField(),
+                ),
+                Value(0.0),
+                output_field=FloatField(),
+            ),
+            total_duration_seconds=Coalesce(
+                Sum("session_exercises__set_logs__duration_seconds", filter=completed),
+                Value(0),
+                output_field=IntegerField(),
+            ),
+            total_distance_meters=Coalesce(
+                Sum("session_exercises__set_logs__distance_meters", filter=completed),
+                Value(0),
+                output_field=IntegerField(),
+            ),
+        )
+        # Meta.ordering is dropped from aggregate queries, so restate it
+        return queryset.order_by("-started_at").annotate(
+            completion_ratio=Case(
+                When(set_count=0, then=Value(0.0)),
+                default=ExpressionWrapper(
+                    Cast("completed_set_count", FloatField())
+                    / Cast("set_count", FloatField()),
+                    output_field=FloatField(),
+                ),
+                output_field=FloatField(),
+            )
+        )
+
+    class Meta:
+        model = WorkoutSession
+        fields = [
+            "id",
+            "workout_plan",
+            "workout_plan_title",
+            "status",
+            "started_at",
+            "completed_at",
+            "total_duration_minutes",
+            "exercise_count",
+            "completed_exercise_count",
+            "set_count",
+            "completed_set_count",
+            "total_repetitions",
+            "total_volume_kg",
+            "total_duration_seconds",
+            "total_distance_meters",
+            "completion_ratio",
+        ]
+        read_only_fields = fields
+
+
 class StartWorkoutSessionSerializer(serializers.Serializer):
     """Serializer for starting a new workout session"""
 
@@ -184,16 +486,8 @@ class StartWorkoutSessionSerializer(serializers.Serializer):
                 "Workout plan not found or you don't have access."
             )
 
-        # Check if there's already an active session
-        active_session = WorkoutSession.objects.filter(
-            user=user, status="in_progress"
-        ).exists()
-
-        if active_session:
-            raise serializers.ValidationError(
-                "You already have an active workout session."
-            )
-
+        # A second active session is rejected by the database when the
+        # session is created, see unique_active_session_per_user
         return value
 
 
@@ -221,3 +515,50 @@ class CompleteSetSerializer(serializers.Serializer):
     distance_meters = serializers.IntegerField(required=False, allow_null=True)
     rest_seconds = serializers.IntegerField(default=60)
     notes = serializers.CharField(required=False, allow_blank=True)
+
+
+class SyncSetSerializer(CompleteSetSerializer):
+    """A set completion recorded offline"""
+
+    id = serializers.IntegerField()
+    rest_seconds = serializers.IntegerField(required=False)
+    completed_at = serializers.DateTimeField(required=False)
+
+
+class SyncSessionExerciseSerializer(UpdateSessionExerciseSerializer):
+    """A session exercise status change recorded offline"""
+
+    id = serializers.IntegerField()
+
+
+class SyncSessionSerializer(serializers.Serializer):
+    """Serializer for replaying a batch of offline changes to one session
+
+    Items are validated one by one so that a bad item is reported back in the
+    results instead of rejecting the whole batch.
+    """
+
+    sets = serializers.ListField(
+        child=serializers.DictField(), required=False, default=list, max_length=500
+    )
+    exercises = serializers.ListField(
+        child=serializers.DictField(), required=False, default=list, max_length=100
+    )
+
+    def validate_sets(self, items):
+        return [self._validate_item(SyncSetSerializer, item) for item in items]
+
+    def validate_exercises(self, items):
+        return [
+            self._validate_item(SyncSessionExerciseSerializer, item) for item in items
+        ]
+
+    def _validate_item(self, serializer_class, item):
+        serializer = serializer_class(data=item)
+        if serializer.is_valid():
+            return serializer.validated_data
+        pk = item.get("id")
+        return {
+            "id": pk if isinstance(pk, int) else None,
+            "errors": serializer.errors,
+        }
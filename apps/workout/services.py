@@ -0,0 +1,308 @@
+from contextlib import contextmanager
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Case, Count, F, Prefetch, Q, Value, When
+from django.utils import timezone
+
+from .analytics import record_completed_sets, record_finished_session
+from .goals import evaluate_exercise_goals
+from .models import WorkoutSession, SessionExercise, SetLog
+
+
+class ActiveSessionExists(Exception):
+    """The user already has a workout session in progress"""
+
+
+@contextmanager
+def active_session_guard(user):
+    """Raise ActiveSessionExists when a write in the block is rejected by
+    ``unique_active_session_per_user``.
+
+    The block runs in a savepoint so the user's sessions can be checked
+    after a failure; any other integrity error is re-raised unchanged.
+    """
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError:
+        if WorkoutSession.objects.filter(user=user).active().exists():
+            raise ActiveSessionExists
+        raise
+
+
+def start_workout_session(user, workout_plan):
+    """Materialize a workout session with all its exercises and set logs.
+
+    Every row is built in memory and written with one bulk insert per table
+    inside a single transaction, so the number of queries does not depend on
+    the size of the plan. Raises ActiveSessionExists when the database
+    rejects a second in-progress session for the user.
+    """
+    workout_exercises = list(workout_plan.exercises.all().order_by("id"))
+
+    with transaction.atomic():
+        with active_session_guard(user):
+            session = WorkoutSession.objects.create(
+                user=user, workout_plan=workout_plan, status="in_progress"
+            )
+
+        session_exercises = SessionExercise.objects.bulk_create(
+            [
+                SessionExercise(
+                    session=session,
+                    workout_exercise=workout_exercise,
+                    order=index,
+                    planned_sets=workout_exercise.sets,
+                    planned_repetitions=workout_exercise.repetitions,
+                    planned_duration_seconds=workout_exercise.duration_seconds,
+                    planned_distance_meters=workout_exercise.distance_meters,
+                )
+                for index, workout_exercise in enumerate(workout_exercises)
+            ]
+        )
+
+        # Backends that cannot return primary keys from a bulk insert need
+        # the freshly created rows read back before set logs can point at them
+        if not connection.features.can_return_rows_from_bulk_insert:
+            session_exercises = list(session.session_exercises.order_by("order"))
+
+        SetLog.objects.bulk_create(
+            [
+                SetLog(session_exercise=session_exercise, set_number=set_num)
+                for session_exercise in session_exercises
+                for set_num in range(1, session_exercise.planned_sets + 1)
+            ]
+        )
+
+    return (
+        WorkoutSession.objects.select_related("workout_plan")
+        .prefetch_related(
+            Prefetch(
+                "session_exercises",
+                queryset=SessionExercise.objects.select_related(
+                    "workout_exercise__exercise"
+                ).prefetch_related("set_logs"),
+            )
+        )
+        .get(pk=session.pk)
+    )
+
+
+def finish_workout_session(session, status, notes=None):
+    """Complete or cancel an in-progress session.
+
+    The status is flipped with a conditional UPDATE so a session is finished
+    at most once even under concurrent requests, and the session is counted
+    in the user's training aggregates in the same transaction. Completing
+    stores the notes and the duration in minutes. Returns False if the
+    session was no longer in progress.
+    """
+    now = timezone.now()
+    values = {"status": status, "completed_at": now}
+    if status == "completed":
+        values["notes"] = notes or ""
+        duration = (now - session.started_at).total_seconds() / 60
+        values["total_duration_minutes"] = int(duration)
+
+    with transaction.atomic():
+        updated = WorkoutSession.objects.filter(
+            pk=session.pk, status="in_progress"
+        ).update(**values)
+        if not updated:
+            return False
+
+        for field, value in values.items():
+            setattr(session, field, value)
+        record_finished_session(session)
+
+    return True
+
+
+SET_LOG_SYNC_FIELDS = [
+    "repetitions",
+    "weight_kg",
+    "duration_seconds",
+    "distance_meters",
+    "rest_seconds",
+    "notes",
+    "completed",
+    "completed_at",
+]
+
+SESSION_EXERCISE_SYNC_FIELDS = [
+    "status",
+    "notes",
+    "completed_sets",
+    "started_at",
+    "completed_at",
+]
+
+
+def apply_exercise_status(session_exercise, status, notes=None, now=None):
+    """Move a session exercise to a new status, stamping start/end times"""
+    now = now or timezone.now()
+    session_exercise.status = status
+    if notes is not None:
+        session_exercise.notes = notes
+
+    if status == "in_progress" and not session_exercise.started_at:
+        session_exercise.started_at = now
+    elif status in ["completed", "skipped"] and not session_exercise.completed_at:
+        session_exercise.completed_at = now
+
+
+def complete_set_log(set_log, user_id, exercise_id, **values):
+    """Record the actual values of a set and count it on its exercise.
+
+    The set is flipped with a conditional UPDATE, which locks its row and turns
+    a concurrent second completion into a no-op, and the exercise counter is
+    incremented in SQL, so rapid double-taps cannot lose updates. The exercise
+    is marked completed in the same statement once its last planned set is
+    done, the set is folded into the user's exercise records and goals on
+    that exercise are re-checked. ``user_id`` and ``exercise_id`` are the
+    owner of the set's session and the exercise it was planned for. Returns
+    False if the set was already completed.
+    """
+    now = timezone.now()
+    values.update(completed=True, completed_at=now)
+
+    with transaction.atomic():
+        updated = SetLog.objects.filter(pk=set_log.pk, completed=False).update(**values)
+        if not updated:
+            return False
+
+        # UPDATE expressions see the row before the increment
+        finishes_exercise = Q(completed_sets__gte=F("planned_sets") - 1)
+        SessionExercise.objects.filter(pk=set_log.session_exercise_id).update(
+            completed_sets=F("completed_sets") + 1,
+            status=Case(
+                When(finishes_exercise, then=Value("completed")),
+                default=F("status"),
+            ),
+            completed_at=Case(
+                When(finishes_exercise, completed_at__isnull=True, then=Value(now)),
+                default=F("completed_at"),
+            ),
+        )
+
+        for field, value in values.items():
+            setattr(set_log, field, value)
+
+        record_completed_sets([(user_id, exercise_id, set_log)])
+        evaluate_exercise_goals(user_id, [exercise_id])
+
+    return True
+
+
+def sync_session(session, set_items, exercise_items):
+    """Apply a batch of offline set completions and exercise status changes.
+
+    Each item is a validated dict with an ``id`` or, when it failed
+    validation, a dict with ``id`` and ``errors``. All referenced rows are
+    loaded and locked with one query per table, written back with one bulk
+    update per table and ``completed_sets`` is recomputed once per touched
+    exercise, all in a single transaction. Completed sets are folded into
+    the exercise records with one upsert per exercise and week, and goals on
+    the touched exercises are re-checked with one UPDATE. Returns a result per item in
+    request order so partial failures can be reported to the client.
+    """
+    now = timezone.now()
+    set_results = []
+    exercise_results = []
+
+    with transaction.atomic():
+        session_exercises = {
+            session_exercise.pk: session_exercise
+            for session_exercise in session.session_exercises.select_for_update(
+                of=("self",)
+            ).annotate(exercise_id=F("workout_exercise__exercise_id"))
+        }
+        set_logs = SetLog.objects.select_for_update().in_bulk(
+            [item["id"] for item in set_items if "errors" not in item]
+        )
+
+        completed_set_logs = {}
+        for item in set_items:
+            set_log = set_logs.get(item["id"])
+            if "errors" in item:
+                set_results.append(_sync_error(item["id"], item["errors"]))
+            elif (
+                set_log is None or set_log.session_exercise_id not in session_exercises
+            ):
+                set_results.append(_sync_error(item["id"], "Set not found."))
+            elif set_log.completed:
+                set_results.append(_sync_error(item["id"], "Set already completed."))
+            else:
+                for field, value in item.items():
+                    if field != "id":
+                        setattr(set_log, field, value)
+                set_log.completed = True
+                set_log.completed_at = item.get("completed_at") or now
+                completed_set_logs[set_log.pk] = set_log
+                set_results.append(_sync_ok(item["id"]))
+
+        SetLog.objects.bulk_update(
+            completed_set_logs.values(), SET_LOG_SYNC_FIELDS, batch_size=500
+        )
+        if completed_set_logs:
+            entries = [
+                (
+                    session.user_id,
+                    session_exercises[set_log.session_exercise_id].exercise_id,
+                    set_log,
+                )
+                for set_log in completed_set_logs.values()
+            ]
+            record_completed_sets(entries)
+            evaluate_exercise_goals(
+                session.user_id, {exercise_id for _, exercise_id, _ in entries}
+            )
+
+        touched = {}
+        if completed_set_logs:
+            counts = (
+                SetLog.objects.filter(
+                    session_exercise__in={
+                        set_log.session_exercise_id
+                        for set_log in completed_set_logs.values()
+                    },
+                    completed=True,
+                )
+                .values_list("session_exercise")
+                .annotate(completed_sets=Count("id"))
+            )
+            for session_exercise_id, completed_sets in counts:
+                session_exercise = session_exercises[session_exercise_id]
+                session_exercise.completed_sets = completed_sets
+                if completed_sets >= session_exercise.planned_sets:
+                    apply_exercise_status(session_exercise, "completed", now=now)
+                touched[session_exercise_id] = session_exercise
+
+        # Explicit status changes are applied last so they win over the
+        # automatic completion above
+        for item in exercise_items:
+            session_exercise = session_exercises.get(item["id"])
+            if "errors" in item:
+                exercise_results.append(_sync_error(item["id"], item["errors"]))
+            elif session_exercise is None:
+                exercise_results.append(_sync_error(item["id"], "Exercise not found."))
+            else:
+                apply_exercise_status(
+                    session_exercise, item["status"], item.get("notes"), now
+                )
+                touched[session_exercise.pk] = session_exercise
+                exercise_results.append(_sync_ok(item["id"]))
+
+        SessionExercise.objects.bulk_update(
+            touched.values(), SESSION_EXERCISE_SYNC_FIELDS, batch_size=500
+        )
+
+    return {"sets": set_results, "exercises": exercise_results}
+
+
+def _sync_ok(pk):
+    return {"id": pk, "result": "ok"}
+
+
+def _sync_error(pk, errors):
+    return {"id": pk, "result": "error", "errors": errors}
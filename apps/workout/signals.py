@@ -0,0 +1,24 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_catalog
+from .goals import evaluate_weight_goals
+from .models import Exercise, WeightLog
+from .search import index_exercises
+
+
+@receiver(post_save, sender=Exercise)
+def exercise_saved(sender, instance, **kwargs):
+    index_exercises([instance])
+    invalidate_catalog()
+
+
+@receiver(post_delete, sender=Exercise)
+def exercise_deleted(sender, **kwargs):
+    invalidate_catalog()
+
+
+@receiver(post_save, sender=WeightLog)
+def weight_log_saved(sender, instance, created, **kwargs):
+    if created:
+        evaluate_weight_goals(instance)
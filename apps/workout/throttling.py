@@ -0,0 +1,88 @@
+"""Fixed-window request throttling on the shared cache
+
+DRF's rate throttles keep a list of request timestamps per client in the
+cache and rewrite it on every request, so their memory grows with the
+rate and concurrent workers overwrite each other's lists. These throttles
+keep one counter per client and window instead, created with ``add()``
+and bumped with ``incr()``. On Redis that increment is atomic and limits
+hold across all workers; FileBasedCache can lose concurrent increments.
+The trade-off of a fixed window is that a client can make up to twice the
+rate around a window boundary.
+"""
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class FixedWindowRateThrottle(SimpleRateThrottle):
+    """Allow ``num_requests`` per client in each window of ``duration`` seconds"""
+
+    def allow_request(self, request, view):
+        if self.rate is None or not getattr(settings, "THROTTLE_ENABLED", True):
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.window_end = (window + 1) * self.duration
+        key = f"{self.key}:{window}"
+
+        # Does nothing when another request already started this window
+        self.cache.add(key, 0, self.duration)
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # The counter expired between add() and incr()
+            self.cache.set(key, 1, self.duration)
+            count = 1
+
+        if count > self.num_requests:
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        return max(0, self.window_end - self.now)
+
+
+class EndpointRateThrottle(FixedWindowRateThrottle):
+    """Per-user limits with a rate per kind of endpoint.
+
+    The scope is the view's ``action_throttle_scopes`` entry for the
+    current action, else its ``throttle_scope``, else "read" for safe
+    methods and "write" otherwise. Anonymous clients are limited by IP.
+    """
+
+    cache_format = "throttle_%(scope)s_%(ident)s"
+
+    def __init__(self):
+        # The rate depends on the view, so it is resolved per request
+        pass
+
+    def allow_request(self, request, view):
+        self.scope = self.get_scope(request, view)
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_scope(self, request, view):
+        scopes = getattr(view, "action_throttle_scopes", {})
+        scope = scopes.get(getattr(view, "action", None))
+        if scope is None:
+            scope = getattr(view, "throttle_scope", None)
+        if scope is None:
+            scope = "read" if request.method in SAFE_METHODS else "write"
+        return scope
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -0,0 +1,248 @@
+"""Two-tier cache backend: an in-process LRU in front of a shared cache
+
+Reads are served from a small per-process tier first and fall back to
+the shared backend (Redis in production), copying what they find into
+the process for ``LOCAL_TIMEOUT`` seconds. Writes go to both tiers.
+Other workers only notice a changed or deleted key once their local copy
+expires, so data that must change immediately everywhere should be read
+under versioned keys (see ``apps.workout.cache``) whose version lives in
+the shared tier only.
+
+Counters (``add``/``incr``) always use the shared tier. They are atomic
+across workers only on Redis: FileBasedCache implements ``incr`` as a get
+followed by a set, so concurrent increments can be lost, and LocMemCache
+is private to its process.
+
+Configured with::
+
+    "default": {
+        "BACKEND": "apps.workout.tiered_cache.TieredCache",
+        "OPTIONS": {"SHARED": "shared", "MAX_ENTRIES": 1000, "LOCAL_TIMEOUT": 5},
+    }
+"""
+
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from .instrumentation import format_labels, registry
+
+DEFAULT_LOCAL_TIMEOUT = 5
+
+MISSING = object()
+
+# Tiers are shared by the per-thread backend instances of one alias
+_tiers = {}
+_tiers_lock = threading.Lock()
+
+
+class LocalTier:
+    """Size-bounded LRU of pickled values with expiry times, and its stats"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.stats = Counter()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self.entries[key]
+                self.stats["evicted", "expired"] += 1
+                entry = None
+            if entry is None:
+                self.stats["local", "miss"] += 1
+                return MISSING
+            self.entries.move_to_end(key)
+            self.stats["local", "hit"] += 1
+        return pickle.loads(entry[1])
+
+    def set(self, key, value, expires):
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.entries[key] = (expires, pickled)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.stats["evicted", "size"] += 1
+
+    def has_key(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def delete(self, key):
+        with self.lock:
+            return self.entries.pop(key, None) is not None
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def record(self, tier, result):
+        with self.lock:
+            self.stats[tier, result] += 1
+
+
+class TieredCache(BaseCache):
+    """Cache backend reading through a ``LocalTier`` to the ``SHARED`` alias.
+
+    ``LOCATION`` names the in-process tier like it does for LocMemCache,
+    ``MAX_ENTRIES`` bounds it and ``LOCAL_TIMEOUT`` caps how long a copy
+    is served without asking the shared tier.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.name = name or "default"
+        self.shared = caches[options.get("SHARED", "shared")]
+        self.local_timeout = options.get("LOCAL_TIMEOUT", DEFAULT_LOCAL_TIMEOUT)
+        with _tiers_lock:
+            self.local = _tiers.setdefault(self.name, LocalTier(self._max_entries))
+
+    def local_expiry(self, timeout=DEFAULT_TIMEOUT):
+        """Monotonic expiry of a local copy, None if it must not be kept"""
+        local_timeout = self.local_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        if local_timeout <= 0:
+            return None
+        return time.monotonic() + local_timeout
+
+    def keep_local(self, key, value, timeout=DEFAULT_TIMEOUT):
+        expires = self.local_expiry(timeout)
+        if expires is None:
+            self.local.delete(key)
+        else:
+            self.local.set(key, value, expires)
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version)
+        value = self.local.get(local_key)
+        if value is not MISSING:
+            return value
+        value = self.shared.get(key, MISSING, version)
+        if value is MISSING:
+            self.local.record("shared", "miss")
+            return default
+        self.local.record("shared", "hit")
+        self.keep_local(local_key, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remaining = []
+        for key in keys:
+            value = self.local.get(self.make_and_validate_key(key, version))
+            if value is MISSING:
+                remaining.append(key)
+            else:
+                found[key] = value
+        if remaining:
+            shared = self.shared.get_many(remaining, version)
+            for key in remaining:
+                if key in shared:
+                    self.local.record("shared", "hit")
+                    self.keep_local(
+                        self.make_and_validate_key(key, version), shared[key]
+                    )
+                else:
+                    self.local.record("shared", "miss")
+            found.update(shared)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version)
+        self.keep_local(self.make_and_validate_key(key, version), value, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version)
+        for key, value in data.items():
+            local_key = self.make_and_validate_key(key, version)
+            if key in failed:
+                self.local.delete(local_key)
+            else:
+                self.keep_local(local_key, value, timeout)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version)
+        local_key = self.make_and_validate_key(key, version)
+        if added:
+            self.keep_local(local_key, value, timeout)
+        else:
+            self.local.delete(local_key)
+        return added
+
+    def incr(self, key, delta=1, version=None):
+        # Only as atomic as the shared backend's incr, see the module docstring
+        self.local.delete(self.make_and_validate_key(key, version))
+        return self.shared.incr(key, delta, version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version)
+
+    def has_key(self, key, version=None):
+        return self.local.has_key(
+            self.make_and_validate_key(key, version)
+        ) or self.shared.has_key(key, version)
+
+    def delete(self, key, version=None):
+        self.local.delete(self.make_and_validate_key(key, version))
+        return self.shared.delete(key, version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self.local.delete(self.make_and_validate_key(key, version))
+        self.shared.delete_many(keys, version)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+
+def cache_metrics():
+    """Prometheus lines for the lookups and evictions of every tiered cache"""
+    requests = [
+        "# HELP cache_requests_total Cache lookups by tier and result",
+        "# TYPE cache_requests_total counter",
+    ]
+    evictions = [
+        "# HELP cache_evictions_total Entries dropped from the in-process tier",
+        "# TYPE cache_evictions_total counter",
+    ]
+    entries = [
+        "# HELP cache_local_entries Entries held in the in-process tier",
+        "# TYPE cache_local_entries gauge",
+    ]
+    with _tiers_lock:
+        tiers = sorted(_tiers.items())
+    for name, tier in tiers:
+        with tier.lock:
+            stats = dict(tier.stats)
+            size = len(tier.entries)
+        for (kind, result), count in sorted(stats.items()):
+            if kind == "evicted":
+                labels = (("cache", name), ("reason", result))
+                evictions.append(
+                    f"cache_evictions_total{{{format_labels(labels)}}} {count}"
+                )
+            else:
+                labels = (("cache", name), ("tier", kind), ("result", result))
+                requests.append(
+                    f"cache_requests_total{{{format_labels(labels)}}} {count}"
+                )
+        entries.append(
+            f'cache_local_entries{{{format_labels((("cache", name),))}}} {size}'
+        )
+    return requests + evictions + entries
+
+
+registry.register_collector(cache_metrics)
@@ -0,0 +1,84 @@
+from django.db.models import Avg, Count, Max, Min
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+
+BUCKET_TRUNCATIONS = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+
+
+def weight_series(weight_logs, bucket="day", points=None, window=None):
+    """Bucketed weight chart data for a WeightLog queryset.
+
+    Logs are grouped into day, week or month buckets in the database, so a
+    single query returns one row per bucket with its average, min, max and
+    count. A trailing moving average over ``window`` buckets is added and
+    the series is downsampled with LTTB to at most ``points`` rows.
+    """
+    rows = list(
+        weight_logs.annotate(bucket=BUCKET_TRUNCATIONS[bucket]("date"))
+        .values("bucket")
+        .annotate(
+            average=Avg("weight"),
+            minimum=Min("weight"),
+            maximum=Max("weight"),
+            count=Count("id"),
+        )
+        .order_by("bucket")
+    )
+    averages = [row["average"] for row in rows]
+
+    if window:
+        for row, value in zip(rows, moving_average(averages, window)):
+            row["moving_average"] = value
+
+    if points and len(rows) > points:
+        xs = [row["bucket"].toordinal() for row in rows]
+        rows = [rows[index] for index in lttb(xs, averages, points)]
+
+    return rows
+
+
+def moving_average(values, window):
+    """Trailing mean of up to ``window`` values, in a single pass"""
+    averages = []
+    total = 0.0
+    for index, value in enumerate(values):
+        total += value
+        if index >= window:
+            total -= values[index - window]
+        averages.append(total / min(index + 1, window))
+    return averages
+
+
+def lttb(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of ``threshold - 2``
+    equal buckets in between, the point forming the largest triangle with
+    the previously kept point and the average of the next bucket, which
+    preserves the visual shape of the line. Returns the kept indices.
+    """
+    length = len(xs)
+    if threshold >= length or threshold < 3:
+        return list(range(length))
+
+    every = (length - 2) / (threshold - 2)
+    kept = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        next_start = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, length)
+        next_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        next_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        x, y = xs[previous], ys[previous]
+        best_area = -1.0
+        for index in range(start, end):
+            area = abs((x - next_x) * (ys[index] - y) - (x - xs[index]) * (next_y - y))
+            if area > best_area:
+                best_area = area
+                previous = index
+        kept.append(previous)
+
+    kept.append(length - 1)
+    return kept
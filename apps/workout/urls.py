@@ -12,6 +12,10 @@ router.register(r"fitness-goals", FitnessGoalViewSet)
 router.register(r"workout-sessions", WorkoutSessionViewSet)
 router.register(r"session-exercises", SessionExerciseViewSet)
 router.register(r"set-logs", SetLogViewSet)
+router.register(r"analytics/records", ExerciseRecordViewSet)
+router.register(r"analytics/training", TrainingAggregateViewSet)
+router.register(r"export", ExportViewSet, basename="export")
+router.register(r"import", ImportViewSet, basename="import")
 
 urlpatterns = [
     path("", include(router.urls)),
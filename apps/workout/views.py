@@ -1,6 +1,13 @@
+import hashlib
+import io
+from datetime import timedelta
+
 from rest_framework import viewsets, permissions
 from rest_framework.exceptions import ValidationError
 from django.core.exceptions import PermissionDenied
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from .models import (
     Profile,
     Exercise,
@@ -21,6 +28,9 @@ from .serializers import (
 
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework.response import Response
 from django.utils import timezone
 from .models import (
@@ -29,17 +39,122 @@ from .models import (
     SetLog,
     WorkoutPlan,
     WorkoutExercise,
+    ExerciseRecord,
+    ExerciseWeeklyStats,
+    TrainingAggregate,
 )
 from .serializers import *
+from .pagination import (
+    SetLogCursorPagination,
+    WeightLogCursorPagination,
+    WorkoutSessionCursorPagination,
+)
+from .analytics import PERIOD_LENGTHS, PERIOD_TRUNCATIONS, period_starts, week_start
+from .cache import get_catalog_payload, get_catalog_state, set_catalog_payload
+from .export import EXPORT_TABLES, export_csv, export_ndjson
+from .goals import current_weight, mark_reached_goals
+from .importer import READERS, HistoryImporter, ImportAborted
+from .search import search_exercises
+from .timeseries import weight_series
+from .services import (
+    ActiveSessionExists,
+    active_session_guard,
+    apply_exercise_status,
+    complete_set_log,
+    finish_workout_session,
+    start_workout_session,
+    sync_session,
+)
+
+
+ACTIVE_SESSION_ERROR = "You already have an active workout session."
+
+DEFAULT_WEEKLY_STATS_WEEKS = 12
+MAX_WEEKLY_STATS_WEEKS = 104
+
 
+DEFAULT_TRAINING_PERIODS = 12
+MAX_TRAINING_PERIODS = 366
 
-class WorkoutSessionViewSet(viewsets.ModelViewSet):
+
+def bounded_int_param(request, name, default, maximum):
+    """Read a positive integer query parameter, clamped to ``maximum``"""
+    try:
+        value = int(request.query_params.get(name, default))
+    except ValueError:
+        raise ValidationError({name: ["A valid integer is required."]})
+    return min(max(value, 1), maximum)
+
+
+class EagerLoadingViewSetMixin:
+    """Preloads the relations read by the serializer of the current action
+
+    ``action_serializer_classes`` maps action names to the serializer used
+    for their response; the plan is applied to the viewset queryset only when
+    that serializer renders the viewset's own model.
+    """
+
+    action_serializer_classes = {}
+
+    def get_serializer_class(self):
+        return self.action_serializer_classes.get(
+            self.action, super().get_serializer_class()
+        )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+        if model is queryset.model and hasattr(serializer_class, "setup_eager_loading"):
+            queryset = serializer_class.setup_eager_loading(queryset)
+        return queryset
+
+
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "view",
+                OpenApiTypes.STR,
+                enum=["full", "summary"],
+                description="`summary` returns aggregated totals per session "
+                "instead of the nested exercise and set tree",
+            )
+        ]
+    )
+)
+class WorkoutSessionViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     queryset = WorkoutSession.objects.all()
     serializer_class = WorkoutSessionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = WorkoutSessionCursorPagination
+    action_serializer_classes = {
+        "next_exercise": SessionExerciseDetailSerializer,
+        "sync": SyncSessionSerializer,
+    }
+    action_throttle_scopes = {"start_session": "session_start"}
 
     def get_queryset(self):
-        return WorkoutSession.objects.filter(user=self.request.user)
+        return super().get_queryset().filter(user=self.request.user)
+
+    def perform_create(self, serializer):
+        self.save_session(serializer, user=self.request.user)
+
+    def perform_update(self, serializer):
+        self.save_session(serializer)
+
+    def save_session(self, serializer, **kwargs):
+        # Generic writes may set status to in_progress as well
+        try:
+            with active_session_guard(self.request.user):
+                serializer.save(**kwargs)
+        except ActiveSessionExists:
+            raise ValidationError({"status": [ACTIVE_SESSION_ERROR]})
+
+    def get_serializer_class(self):
+        if self.action == "list" and self.request.query_params.get("view") == "summary":
+            return WorkoutSessionSummarySerializer
+        return super().get_serializer_class()
 
     @action(detail=False, methods=["post"], url_path="start")
     def start_session(self, request):
@@ -52,30 +167,10 @@ class WorkoutSessionViewSet(viewsets.ModelViewSet):
         workout_plan_id = serializer.validated_data["workout_plan_id"]
         workout_plan = WorkoutPlan.objects.get(id=workout_plan_id)
 
-        # Create the workout session
-        session = WorkoutSession.objects.create(
-            user=request.user, workout_plan=workout_plan, status="in_progress"
-        )
-
-        # Create session exercises from workout plan
-        workout_exercises = workout_plan.exercises.all().order_by("id")
-        for index, workout_exercise in enumerate(workout_exercises):
-            session_exercise = SessionExercise.objects.create(
-                session=session,
-                workout_exercise=workout_exercise,
-                order=index,
-                planned_sets=workout_exercise.sets,
-                planned_repetitions=workout_exercise.repetitions,
-                planned_duration_seconds=workout_exercise.duration_seconds,
-                planned_distance_meters=workout_exercise.distance_meters,
-            )
-
-            # Create set logs for each planned set
-            for set_num in range(1, workout_exercise.sets + 1):
-                SetLog.objects.create(
-                    session_exercise=session_exercise,
-                    set_number=set_num,
-                )
+        try:
+            session = start_workout_session(request.user, workout_plan)
+        except ActiveSessionExists:
+            raise ValidationError({"workout_plan_id": [ACTIVE_SESSION_ERROR]})
 
         response_serializer = WorkoutSessionSerializer(session)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -94,15 +189,14 @@ class WorkoutSessionViewSet(viewsets.ModelViewSet):
         serializer = CompleteSessionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        session.status = "completed"
-        session.completed_at = timezone.now()
-        session.notes = serializer.validated_data.get("notes", "")
-
-        # Calculate total duration in minutes
-        duration = (session.completed_at - session.started_at).total_seconds() / 60
-        session.total_duration_minutes = int(duration)
-
-        session.save()
+        finished = finish_workout_session(
+            session, "completed", serializer.validated_data.get("notes", "")
+        )
+        if not finished:
+            return Response(
+                {"error": "Session is not in progress"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         response_serializer = WorkoutSessionSerializer(session)
         return Response(response_serializer.data)
@@ -118,9 +212,11 @@ class WorkoutSessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        session.status = "cancelled"
-        session.completed_at = timezone.now()
-        session.save()
+        if not finish_workout_session(session, "cancelled"):
+            return Response(
+                {"error": "Session is not in progress"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         response_serializer = WorkoutSessionSerializer(session)
         return Response(response_serializer.data)
@@ -128,9 +224,7 @@ class WorkoutSessionViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="active")
     def active_session(self, request):
         """Get the current active workout session"""
-        session = WorkoutSession.objects.filter(
-            user=request.user, status="in_progress"
-        ).first()
+        session = self.get_queryset().active().first()
 
         if not session:
             return Response(
@@ -153,9 +247,13 @@ class WorkoutSessionViewSet(viewsets.ModelViewSet):
             )
 
         # Find the next pending or in-progress exercise
-        next_ex = session.session_exercises.filter(
-            status__in=["pending", "in_progress"]
-        ).first()
+        next_ex = (
+            SessionExerciseDetailSerializer.setup_eager_loading(
+                session.session_exercises.all()
+            )
+            .filter(status__in=["pending", "in_progress"])
+            .first()
+        )
 
         if not next_ex:
             return Response(
@@ -165,14 +263,33 @@ class WorkoutSessionViewSet(viewsets.ModelViewSet):
         serializer = SessionExerciseDetailSerializer(next_ex)
         return Response(serializer.data)
 
+    @action(detail=True, methods=["post"], url_path="sync")
+    def sync(self, request, pk=None):
+        """Apply a batch of offline set completions and exercise status changes"""
+        session = self.get_object()
+
+        serializer = SyncSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-class SessionExerciseViewSet(viewsets.ModelViewSet):
+        results = sync_session(
+            session,
+            serializer.validated_data["sets"],
+            serializer.validated_data["exercises"],
+        )
+        return Response(results)
+
+
+class SessionExerciseViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     queryset = SessionExercise.objects.all()
     serializer_class = SessionExerciseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    action_serializer_classes = {
+        "update_status": SessionExerciseDetailSerializer,
+        "next_set": SetLogSerializer,
+    }
 
     def get_queryset(self):
-        return SessionExercise.objects.filter(session__user=self.request.user)
+        return super().get_queryset().filter(session__user=self.request.user)
 
     @action(detail=True, methods=["patch"], url_path="update-status")
     def update_status(self, request, pk=None):
@@ -182,19 +299,11 @@ class SessionExerciseViewSet(viewsets.ModelViewSet):
         serializer = UpdateSessionExerciseSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        new_status = serializer.validated_data["status"]
-        session_exercise.status = new_status
-        session_exercise.notes = serializer.validated_data.get(
-            "notes", session_exercise.notes
+        apply_exercise_status(
+            session_exercise,
+            serializer.validated_data["status"],
+            serializer.validated_data.get("notes"),
         )
-
-        if new_status == "in_progress" and not session_exercise.started_at:
-            session_exercise.started_at = timezone.now()
-        elif (
-            new_status in ["completed", "skipped"] and not session_exercise.completed_at
-        ):
-            session_exercise.completed_at = timezone.now()
-
         session_exercise.save()
 
         response_serializer = SessionExerciseDetailSerializer(session_exercise)
@@ -217,13 +326,21 @@ class SessionExerciseViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class SetLogViewSet(viewsets.ModelViewSet):
+class SetLogViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     queryset = SetLog.objects.all()
     serializer_class = SetLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = SetLogCursorPagination
 
     def get_queryset(self):
-        return SetLog.objects.filter(session_exercise__session__user=self.request.user)
+        queryset = (
+            super()
+            .get_queryset()
+            .filter(session_exercise__session__user=self.request.user)
+        )
+        if self.action == "complete_set":
+            queryset = queryset.select_related("session_exercise__workout_exercise")
+        return queryset
 
     @action(detail=True, methods=["post"], url_path="complete")
     def complete_set(self, request, pk=None):
@@ -238,35 +355,221 @@ class SetLogViewSet(viewsets.ModelViewSet):
         serializer = CompleteSetSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Update the set with actual values
-        set_log.repetitions = serializer.validated_data.get("repetitions")
-        set_log.weight_kg = serializer.validated_data.get("weight_kg")
-        set_log.duration_seconds = serializer.validated_data.get("duration_seconds")
-        set_log.distance_meters = serializer.validated_data.get("distance_meters")
-        set_log.rest_seconds = serializer.validated_data.get("rest_seconds", 60)
-        set_log.notes = serializer.validated_data.get("notes", "")
-        set_log.completed = True
-        set_log.completed_at = timezone.now()
-        set_log.save()
-
-        # Update completed sets count on session exercise
-        session_exercise = set_log.session_exercise
-        session_exercise.completed_sets = session_exercise.set_logs.filter(
-            completed=True
-        ).count()
-
-        # If all sets are complete, mark exercise as completed
-        if session_exercise.completed_sets >= session_exercise.planned_sets:
-            session_exercise.status = "completed"
-            if not session_exercise.completed_at:
-                session_exercise.completed_at = timezone.now()
-
-        session_exercise.save()
+        completed = complete_set_log(
+            set_log,
+            request.user.pk,
+            set_log.session_exercise.workout_exercise.exercise_id,
+            repetitions=serializer.validated_data.get("repetitions"),
+            weight_kg=serializer.validated_data.get("weight_kg"),
+            duration_seconds=serializer.validated_data.get("duration_seconds"),
+            distance_meters=serializer.validated_data.get("distance_meters"),
+            rest_seconds=serializer.validated_data.get("rest_seconds", 60),
+            notes=serializer.validated_data.get("notes", ""),
+        )
+        if not completed:
+            return Response(
+                {"error": "Set already completed"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
         response_serializer = SetLogSerializer(set_log)
         return Response(response_serializer.data)
 
 
+@extend_schema_view(
+    weekly=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "weeks",
+                OpenApiTypes.INT,
+                description="Number of weeks to return, ending with the "
+                f"current one (1-{MAX_WEEKLY_STATS_WEEKS}, default "
+                f"{DEFAULT_WEEKLY_STATS_WEEKS})",
+            )
+        ]
+    )
+)
+class ExerciseRecordViewSet(EagerLoadingViewSetMixin, viewsets.ReadOnlyModelViewSet):
+    """Personal records and weekly progression per exercise"""
+
+    queryset = ExerciseRecord.objects.order_by("exercise__name")
+    serializer_class = ExerciseRecordSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_field = "exercise"
+
+    def get_queryset(self):
+        return super().get_queryset().filter(user=self.request.user)
+
+    @action(detail=True, methods=["get"], url_path="weekly")
+    def weekly(self, request, exercise=None):
+        """Weekly volume and bests for an exercise, oldest week first"""
+        record = self.get_object()
+        weeks = bounded_int_param(
+            request, "weeks", DEFAULT_WEEKLY_STATS_WEEKS, MAX_WEEKLY_STATS_WEEKS
+        )
+
+        current_week = week_start(timezone.now())
+        first_week = current_week - timedelta(weeks=weeks - 1)
+        stats = {
+            row.week_start: row
+            for row in ExerciseWeeklyStats.objects.filter(
+                user=request.user,
+                exercise=record.exercise_id,
+                week_start__gte=first_week,
+            )
+        }
+        # Weeks without training are returned as zeros to keep the series regular
+        series = [
+            stats.get(start) or ExerciseWeeklyStats(week_start=start)
+            for start in (first_week + timedelta(weeks=i) for i in range(weeks))
+        ]
+        serializer = ExerciseWeeklyStatsSerializer(series, many=True)
+        return Response(
+            {
+                "exercise": record.exercise_id,
+                "exercise_name": record.exercise.name,
+                "weeks": serializer.data,
+            }
+        )
+
+
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "period",
+                OpenApiTypes.STR,
+                enum=["day", "week"],
+                description="Bucket size",
+            ),
+            OpenApiParameter(
+                "periods",
+                OpenApiTypes.INT,
+                description="Number of periods to return, ending with the "
+                f"current one (1-{MAX_TRAINING_PERIODS}, default "
+                f"{DEFAULT_TRAINING_PERIODS})",
+            ),
+        ]
+    )
+)
+class TrainingAggregateViewSet(viewsets.GenericViewSet):
+    """Daily or weekly training totals for dashboards"""
+
+    queryset = TrainingAggregate.objects.all()
+    serializer_class = TrainingAggregateSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return super().get_queryset().filter(user=self.request.user)
+
+    def list(self, request):
+        """Training totals per period, oldest first"""
+        period = request.query_params.get("period", "week")
+        if period not in PERIOD_TRUNCATIONS:
+            raise ValidationError({"period": ['Must be "day" or "week".']})
+        periods = bounded_int_param(
+            request, "periods", DEFAULT_TRAINING_PERIODS, MAX_TRAINING_PERIODS
+        )
+
+        length = PERIOD_LENGTHS[period]
+        first_start = period_starts(timezone.now())[period] - length * (periods - 1)
+        aggregates = {
+            row.period_start: row
+            for row in self.get_queryset().filter(
+                period=period, period_start__gte=first_start
+            )
+        }
+        # Periods without training are returned as zeros
+        series = [
+            aggregates.get(start)
+            or TrainingAggregate(period=period, period_start=start)
+            for start in (first_start + length * i for i in range(periods))
+        ]
+        serializer = self.get_serializer(series, many=True)
+        return Response({"period": period, "results": serializer.data})
+
+
+@extend_schema_view(
+    ndjson=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "tables",
+                OpenApiTypes.STR,
+                description="Comma-separated tables to export, all by default: "
+                + ", ".join(EXPORT_TABLES),
+            )
+        ],
+        responses={(200, "application/x-ndjson"): OpenApiTypes.STR},
+    ),
+    csv=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "table", OpenApiTypes.STR, enum=list(EXPORT_TABLES), required=True
+            )
+        ],
+        responses={(200, "text/csv"): OpenApiTypes.STR},
+    ),
+)
+class ExportViewSet(viewsets.ViewSet):
+    """Streaming download of the user's full training history"""
+
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "export"
+
+    @action(detail=False, methods=["get"], url_path="ndjson")
+    def ndjson(self, request):
+        """Every exported table as newline-delimited JSON"""
+        tables = request.query_params.get("tables")
+        tables = tables.split(",") if tables else list(EXPORT_TABLES)
+        self.check_tables(tables)
+        return self.stream(
+            export_ndjson(request.user, tables),
+            "application/x-ndjson",
+            "training-history.ndjson",
+        )
+
+    @action(detail=False, methods=["get"], url_path="csv")
+    def csv(self, request):
+        """One exported table as CSV"""
+        table = request.query_params.get("table", "")
+        self.check_tables([table], param="table")
+        return self.stream(export_csv(request.user, table), "text/csv", f"{table}.csv")
+
+    def check_tables(self, tables, param="tables"):
+        unknown = [table for table in tables if table not in EXPORT_TABLES]
+        if unknown:
+            raise ValidationError(
+                {param: [f"Unknown table: {table}" for table in unknown]}
+            )
+
+    def stream(self, lines, content_type, filename):
+        response = StreamingHttpResponse(lines, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ImportViewSet(viewsets.ViewSet):
+    """Upload of training history exported from other apps"""
+
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = "import"
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(request=ImportHistorySerializer, responses=OpenApiTypes.OBJECT)
+    def create(self, request):
+        """Import CSV or NDJSON set rows and report what was loaded"""
+        serializer = ImportHistorySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+        reader = READERS[serializer.validated_data["file_format"]]
+
+        lines = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        try:
+            report = HistoryImporter(request.user).run(reader(lines))
+        except (ImportAborted, UnicodeDecodeError) as error:
+            raise ValidationError({"file": [str(error)]})
+        return Response(report)
+
+
 class ProfileViewSet(viewsets.ModelViewSet):
     queryset = Profile.objects.all()
     serializer_class = ProfileSerializer
@@ -287,24 +590,93 @@ class ProfileViewSet(viewsets.ModelViewSet):
 
 
 class ExerciseViewSet(viewsets.ModelViewSet):
-    queryset = Exercise.objects.all()
+    # Cached pages need a stable order
+    queryset = Exercise.objects.order_by("id")
     serializer_class = ExerciseSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def list(self, request, *args, **kwargs):
+        return self.catalog_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.catalog_response(request, super().retrieve, *args, **kwargs)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("q", OpenApiTypes.STR, description="Search words"),
+            OpenApiParameter(
+                "muscle", OpenApiTypes.STR, many=True, description="Target muscle"
+            ),
+            OpenApiParameter(
+                "equipment", OpenApiTypes.STR, many=True, description="Equipment"
+            ),
+        ],
+        responses=ExerciseSearchResultSerializer(many=True),
+    )
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """Ranked search over exercises with muscle and equipment facets"""
+        return self.catalog_response(request, self.search_catalog)
+
+    def search_catalog(self, request):
+        exercises, facets = search_exercises(
+            request.query_params.get("q", ""),
+            request.query_params.getlist("muscle"),
+            request.query_params.getlist("equipment"),
+        )
+        page = self.paginate_queryset(exercises)
+        serializer = ExerciseSearchResultSerializer(page, many=True)
+        response = self.get_paginated_response(serializer.data)
+        response.data["facets"] = facets
+        return response
+
+    def catalog_response(self, request, fetch, *args, **kwargs):
+        """Serve a catalog read from the versioned cache with ETag support
+
+        Payloads are keyed by catalog version and absolute URL, so a warm
+        read touches neither the database nor the serializers, and clients
+        revalidating with If-None-Match or If-Modified-Since get a 304.
+        """
+        state = get_catalog_state()
+        key = request.build_absolute_uri()
+        etag = quote_etag(
+            f"{state['version']}-{hashlib.md5(key.encode()).hexdigest()[:16]}"
+        )
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=state["last_modified"]
+        )
+        if not_modified is not None:
+            return not_modified
+
+        data = get_catalog_payload(state["version"], key)
+        if data is None:
+            response = fetch(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            data = response.data
+            set_catalog_payload(state["version"], key, data)
+
+        response = Response(data)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(state["last_modified"])
+        patch_cache_control(response, no_cache=True)
+        return response
+
 
-class WorkoutPlanViewSet(viewsets.ModelViewSet):
+class WorkoutPlanViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     queryset = WorkoutPlan.objects.all()
     serializer_class = WorkoutPlanSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return WorkoutPlan.objects.filter(user=self.request.user)
+        return super().get_queryset().filter(user=self.request.user)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class WorkoutExerciseViewSet(viewsets.ModelViewSet):
+class WorkoutExerciseViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     queryset = WorkoutExercise.objects.all()
     serializer_class = WorkoutExerciseSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -314,6 +686,7 @@ class WeightLogViewSet(viewsets.ModelViewSet):
     queryset = WeightLog.objects.all()
     serializer_class = WeightLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = WeightLogCursorPagination
 
     def get_queryset(self):
         return WeightLog.objects.filter(user=self.request.user)
@@ -321,6 +694,29 @@ class WeightLogViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @extend_schema(
+        parameters=[WeightSeriesQuerySerializer],
+        responses=WeightSeriesPointSerializer(many=True),
+    )
+    @action(detail=False, methods=["get"], url_path="series")
+    def series(self, request):
+        """Bucketed and downsampled weight history for charts"""
+        params = WeightSeriesQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        options = params.validated_data
+
+        weight_logs = self.get_queryset()
+        if "start" in options:
+            weight_logs = weight_logs.filter(date__gte=options["start"])
+        if "end" in options:
+            weight_logs = weight_logs.filter(date__lte=options["end"])
+
+        rows = weight_series(
+            weight_logs, options["bucket"], options["points"], options["window"]
+        )
+        serializer = WeightSeriesPointSerializer(rows, many=True)
+        return Response({"bucket": options["bucket"], "results": serializer.data})
+
 
 class FitnessGoalViewSet(viewsets.ModelViewSet):
     queryset = FitnessGoal.objects.all()
@@ -331,4 +727,16 @@ class FitnessGoalViewSet(viewsets.ModelViewSet):
         return FitnessGoal.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        baseline_value = None
+        if serializer.validated_data["goal_type"] == "weight":
+            baseline_value = current_weight(self.request.user)
+        goal = serializer.save(user=self.request.user, baseline_value=baseline_value)
+        self.evaluate(goal)
+
+    def perform_update(self, serializer):
+        self.evaluate(serializer.save())
+
+    def evaluate(self, goal):
+        """Mark the goal achieved right away if existing data already meets it"""
+        if mark_reached_goals(FitnessGoal.objects.filter(pk=goal.pk)):
+            goal.refresh_from_db(fields=["achieved", "achieved_at"])
@@ -43,13 +43,13 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "rest_framework_simplejwt",
-    "rest_framework_simplejwt.token_blacklist",
     "drf_spectacular",
     "apps.authentication",
     "apps.workout",
 ]
 
 MIDDLEWARE = [
+    "apps.workout.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -113,6 +113,26 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Login by email first, username logins (admin) fall through to ModelBackend
+AUTHENTICATION_BACKENDS = [
+    "apps.authentication.backends.EmailBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
+# The first hasher hashes new passwords; the rest verify older hashes
+PASSWORD_HASHERS = [
+    "apps.authentication.hashers.ConfigurablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# PBKDF2 work factor, Django's default when unset; stored hashes are
+# upgraded to a changed value on the next successful login
+PASSWORD_HASHER_ITERATIONS = int(os.getenv("PASSWORD_HASHER_ITERATIONS", 0)) or None
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -138,19 +158,74 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.authentication.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.workout.instrumentation.TimedJSONRenderer",
+        "apps.workout.instrumentation.TimedBrowsableAPIRenderer",
+    ],
     "PAGE_SIZE": 20,
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.UserRateThrottle",
+        "apps.workout.throttling.EndpointRateThrottle",
     ],
-    "DEFAULT_THROTTLE_RATES": {"user": "1000/day"},
+    # Per user, or per IP for anonymous clients
+    "DEFAULT_THROTTLE_RATES": {
+        "read": "1000/hour",
+        "write": "1000/day",
+        "session_start": "50/day",
+        "import": "20/day",
+        "export": "50/day",
+        "auth": "30/minute",
+    },
 }
 
+# Switched off by benchmark_api unless --throttle is given
+THROTTLE_ENABLED = True
+
+# In-process LRU tier in front of a cache shared by all workers: Redis
+# with REDIS_URL, files in CACHE_DIR, else memory of this process only
+CACHES = {
+    "default": {
+        "BACKEND": "apps.workout.tiered_cache.TieredCache",
+        "OPTIONS": {
+            "SHARED": "shared",
+            "MAX_ENTRIES": int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", 1000)),
+            "LOCAL_TIMEOUT": int(os.getenv("CACHE_LOCAL_TIMEOUT", 5)),
+        },
+    },
+}
+if os.getenv("REDIS_URL"):
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL"),
+    }
+elif os.getenv("CACHE_DIR"):
+    # Shares cached payloads between workers on one host, but its incr is
+    # not atomic, so throttle limits are only approximate across workers
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("CACHE_DIR"),
+    }
+else:
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+
+# Requests making more queries than this are logged as warnings
+REQUEST_QUERY_BUDGET = int(os.getenv("REQUEST_QUERY_BUDGET", 50))
+
+# Bearer token required to scrape /metrics/, which is DEBUG-only without one
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_BLACKLIST_SERIALIZER": "apps.authentication.serializers.LogoutSerializer",
 }
+
+# Seconds a worker keeps user rows loaded for views needing more than the
+# access token claims
+USER_CACHE_TIMEOUT = int(os.getenv("USER_CACHE_TIMEOUT", 60))
@@ -2,3 +2,8 @@ from .base import *
 
 DEBUG = True
 ALLOWED_HOSTS = ["*"]
+
+# Report serializers and views repeating a query per row
+MIDDLEWARE = MIDDLEWARE + ["apps.workout.nplusone.NPlusOneMiddleware"]
+N_PLUS_ONE_ACTION = "warn"
+N_PLUS_ONE_THRESHOLD = 5
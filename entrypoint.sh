@@ -20,9 +20,9 @@ python manage.py migrate --noinput
 echo "Collecting static files..."
 python manage.py collectstatic --noinput --clear || true
 
-# Seed exercises if they don't exist
+# Seed or update the exercise catalog (idempotent)
 echo "Seeding exercises..."
-python manage.py seed_exercises || true
+python manage.py seed_exercises
 
 # Create superuser if it doesn't exist
 echo "Creating superuser..."
@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from apps.authentication.blacklist import revoked_cache
+from apps.authentication.cache import user_cache
+from apps.workout.instrumentation import request_measured
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "max_queries(limit): fail if any API request in the test makes more "
+        "than limit queries",
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached state such as catalog payloads from leaking between tests"""
+    cache.clear()
+    user_cache.clear()
+    revoked_cache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing():
+    """Hash test passwords with a low work factor"""
+    with override_settings(PASSWORD_HASHER_ITERATIONS=1000):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reject_n_plus_one():
+    """Turn N+1 query warnings into errors while testing"""
+    with override_settings(N_PLUS_ONE_ACTION="raise"):
+        yield
+
+
+@contextmanager
+def request_query_budget(limit):
+    """Fail if a request made inside the block runs more than limit queries"""
+    measured = []
+
+    def collect(sender, request, metrics, **kwargs):
+        measured.append((request.method, request.get_full_path(), metrics.queries))
+
+    request_measured.connect(collect)
+    try:
+        yield measured
+    finally:
+        request_measured.disconnect(collect)
+
+    over = [
+        f"{method} {path}: {queries} queries"
+        for method, path, queries in measured
+        if queries > limit
+    ]
+    if over:
+        pytest.fail(f"Requests over the budget of {limit} queries: " + "; ".join(over))
+
+
+@pytest.fixture
+def max_queries():
+    """Context manager factory asserting a per-request query budget"""
+    return request_query_budget
+
+
+@pytest.fixture(autouse=True)
+def max_queries_marker(request):
+    """Apply the max_queries marker to every request the test makes"""
+    marker = request.node.get_closest_marker("max_queries")
+    if marker is None:
+        yield
+        return
+    with request_query_budget(marker.args[0]):
+        yield
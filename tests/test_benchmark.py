@@ -0,0 +1,111 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from apps.workout.benchmark import SCENARIOS, compare_reports
+from apps.workout.loadgen import LoadDataGenerator
+from apps.workout.models import (
+    ExerciseRecord,
+    SetLog,
+    TrainingAggregate,
+    WeightLog,
+    WorkoutSession,
+)
+
+
+class LoadDataTests(TestCase):
+    def test_generate_load_data(self):
+        """Test generating users with sessions, sets, weight logs and summaries"""
+        out = StringIO()
+        call_command(
+            "generate_load_data", users=3, years=0.25, sessions_per_week=2, stdout=out
+        )
+
+        self.assertIn("Generated 3 users", out.getvalue())
+        self.assertEqual(User.objects.count(), 3)
+        user = User.objects.get(username="loadtest-user-0")
+        self.assertTrue(user.check_password("LoadTest123!"))
+        self.assertEqual(WorkoutSession.objects.filter(user=user).count(), 26)
+        self.assertFalse(SetLog.objects.filter(completed=False).exists())
+        self.assertEqual(
+            len(set(WeightLog.objects.filter(user=user).values_list("date"))),
+            WeightLog.objects.filter(user=user).count(),
+        )
+        self.assertTrue(ExerciseRecord.objects.filter(user=user).exists())
+        self.assertTrue(TrainingAggregate.objects.filter(user=user).exists())
+
+    def test_seed_is_deterministic(self):
+        """Test that the same seed generates the same history"""
+        LoadDataGenerator(users=1, years=0.1, seed=7).run()
+        first = list(SetLog.objects.order_by("pk").values_list("weight_kg"))
+        User.objects.all().delete()
+
+        LoadDataGenerator(users=1, years=0.1, seed=7).run()
+
+        self.assertEqual(
+            list(SetLog.objects.order_by("pk").values_list("weight_kg")), first
+        )
+
+
+class BenchmarkTests(TestCase):
+    def setUp(self):
+        LoadDataGenerator(users=2, years=0.1, sessions_per_week=3).run()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.report_path = Path(self.directory.name) / "report.json"
+
+    def benchmark(self, *args):
+        call_command(
+            "benchmark_api",
+            "--iterations=2",
+            "--warmup=0",
+            f"--output={self.report_path}",
+            *args,
+            stdout=StringIO(),
+        )
+        return json.loads(self.report_path.read_text())
+
+    def test_benchmark_every_endpoint(self):
+        """Test that every scenario succeeds and is reported with its queries"""
+        sessions = WorkoutSession.objects.count()
+
+        report = self.benchmark()
+
+        self.assertEqual(set(report["results"]), set(SCENARIOS))
+        for name, result in report["results"].items():
+            self.assertEqual(result["errors"], 0, name)
+            self.assertEqual(len(result["statuses"]), 1, name)
+            self.assertGreaterEqual(result["queries"]["max"], 1, name)
+        self.assertEqual(report["iterations"], 2)
+        self.assertEqual(report["dataset"]["sessions"], sessions)
+        # The benchmark leaves the dataset untouched
+        self.assertEqual(WorkoutSession.objects.count(), sessions)
+
+    def test_compare_with_baseline(self):
+        """Test comparing a run with a baseline report"""
+        baseline = self.benchmark("--scenario=auth.login")
+        baseline["results"]["auth.login"]["queries"]["max"] -= 1
+        baseline_path = Path(self.directory.name) / "baseline.json"
+        baseline_path.write_text(json.dumps(baseline))
+
+        rows = compare_reports(baseline, baseline)
+        self.assertEqual([row["change"] for row in rows], [0.0])
+
+        with self.assertRaisesMessage(CommandError, "auth.login"):
+            self.benchmark(
+                "--scenario=auth.login",
+                f"--compare={baseline_path}",
+                "--max-regression=1000",
+            )
+
+    def test_requires_load_data(self):
+        """Test that the benchmark refuses to run without generated users"""
+        User.objects.all().delete()
+
+        with self.assertRaises(CommandError):
+            call_command("benchmark_api", stdout=StringIO())
@@ -128,3 +128,65 @@ class ExerciseTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Note: This assumes search is configured in the viewset
         # If not configured, this test will need to be adjusted
+
+    def test_list_exercises_sends_validators(self):
+        """Test that catalog responses carry ETag and Last-Modified headers"""
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_list_exercises_not_modified(self):
+        """Test that a matching If-None-Match gets a 304"""
+        etag = self.client.get(self.url, format="json")["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_exercise_not_modified_since(self):
+        """Test that an unchanged exercise honours If-Modified-Since"""
+        url = reverse("exercise-detail", kwargs={"pk": self.exercise.pk})
+        last_modified = self.client.get(url, format="json")["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_warm_catalog_reads_skip_database(self):
+        """Test that cached catalog reads do not query the database"""
+        detail_url = reverse("exercise-detail", kwargs={"pk": self.exercise.pk})
+        self.client.get(self.url, format="json")
+        self.client.get(detail_url, format="json")
+
+        with self.assertNumQueries(0):
+            list_response = self.client.get(self.url, format="json")
+            detail_response = self.client.get(detail_url, format="json")
+
+        self.assertEqual(list_response.data["results"][0]["name"], "Push Ups")
+        self.assertEqual(detail_response.data["name"], "Push Ups")
+
+    def test_catalog_cache_invalidated_on_change(self):
+        """Test that saving or deleting an exercise refreshes the catalog"""
+        first = self.client.get(self.url, format="json")
+
+        self.exercise.name = "Wide Push Ups"
+        self.exercise.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.data["results"][0]["name"], "Wide Push Ups")
+
+        self.exercise.delete()
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(len(response.data["results"]), 0)
+
+    def test_retrieve_missing_exercise(self):
+        """Test that unknown exercises still return 404"""
+        url = reverse("exercise-detail", kwargs={"pk": 999999})
+        response = self.client.get(url, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,168 @@
+from datetime import timedelta
+from io import StringIO
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from apps.workout.analytics import week_start
+from apps.workout.models import (
+    WorkoutPlan,
+    Exercise,
+    WorkoutExercise,
+    WorkoutSession,
+    SessionExercise,
+    SetLog,
+    ExerciseRecord,
+    ExerciseWeeklyStats,
+)
+
+
+class ExerciseRecordTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.bench = Exercise.objects.create(
+            name="Bench Press",
+            description="Chest exercise",
+            instructions="Press the bar",
+            target_muscles="chest, triceps",
+            equipment="barbell",
+        )
+        workout_plan = WorkoutPlan.objects.create(user=self.user, title="Push Day")
+        workout_exercise = WorkoutExercise.objects.create(
+            workout_plan=workout_plan, exercise=self.bench, sets=3, repetitions=5
+        )
+        self.session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=workout_plan, status="in_progress"
+        )
+        self.session_exercise = SessionExercise.objects.create(
+            session=self.session, workout_exercise=workout_exercise, planned_sets=3
+        )
+        self.sets = [
+            SetLog.objects.create(
+                session_exercise=self.session_exercise, set_number=set_number
+            )
+            for set_number in range(1, 4)
+        ]
+        self.detail_url = reverse(
+            "exerciserecord-detail", kwargs={"exercise": self.bench.pk}
+        )
+        self.weekly_url = reverse(
+            "exerciserecord-weekly", kwargs={"exercise": self.bench.pk}
+        )
+
+    def complete(self, set_log, **data):
+        url = reverse("setlog-complete-set", kwargs={"pk": set_log.pk})
+        return self.client.post(url, data, format="json")
+
+    def test_completing_sets_updates_records(self):
+        """Test that each completed set is folded into the exercise record"""
+        self.complete(self.sets[0], repetitions=5, weight_kg=100.0)
+        self.complete(self.sets[1], repetitions=1, weight_kg=110.0)
+        self.complete(self.sets[2], repetitions=12, weight_kg=60.0)
+
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["exercise_name"], "Bench Press")
+        self.assertEqual(response.data["sets"], 3)
+        self.assertEqual(response.data["repetitions"], 18)
+        self.assertAlmostEqual(response.data["volume_kg"], 500 + 110 + 720)
+        self.assertEqual(response.data["max_weight_kg"], 110.0)
+        self.assertEqual(response.data["max_repetitions"], 12)
+        self.assertAlmostEqual(response.data["best_set_volume_kg"], 720.0)
+        # Epley: 100 * (1 + 5 / 30) beats 110 for a single and 60 * 1.4
+        self.assertAlmostEqual(response.data["estimated_one_rep_max_kg"], 116.6667, 3)
+
+    def test_double_completion_counted_once(self):
+        """Test that a rejected second completion does not touch records"""
+        self.complete(self.sets[0], repetitions=5, weight_kg=100.0)
+        response = self.complete(self.sets[0], repetitions=5, weight_kg=100.0)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ExerciseRecord.objects.get().sets, 1)
+
+    def test_weekly_series(self):
+        """Test the weekly series fills weeks without training with zeros"""
+        self.complete(self.sets[0], repetitions=5, weight_kg=100.0)
+        self.complete(self.sets[1], repetitions=5, weight_kg=80.0)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.weekly_url, {"weeks": 4})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        weeks = response.data["weeks"]
+        self.assertEqual(len(weeks), 4)
+        self.assertEqual(
+            weeks[-1]["week_start"], week_start(timezone.now()).isoformat()
+        )
+        self.assertEqual(weeks[-1]["sets"], 2)
+        self.assertAlmostEqual(weeks[-1]["volume_kg"], 900.0)
+        self.assertEqual([week["sets"] for week in weeks[:-1]], [0, 0, 0])
+
+    def test_sync_updates_records(self):
+        """Test that sets completed through a batch sync are recorded per week"""
+        last_week = timezone.now() - timedelta(days=7)
+        url = reverse("workoutsession-sync", kwargs={"pk": self.session.pk})
+        self.client.post(
+            url,
+            {
+                "sets": [
+                    {"id": self.sets[0].pk, "repetitions": 8, "weight_kg": 50.0},
+                    {
+                        "id": self.sets[1].pk,
+                        "repetitions": 10,
+                        "weight_kg": 40.0,
+                        "completed_at": last_week.isoformat(),
+                    },
+                ]
+            },
+            format="json",
+        )
+
+        record = ExerciseRecord.objects.get(user=self.user, exercise=self.bench)
+        self.assertEqual(record.sets, 2)
+        self.assertAlmostEqual(record.volume_kg, 800.0)
+        self.assertEqual(record.first_performed_at, last_week)
+        self.assertEqual(
+            sorted(ExerciseWeeklyStats.objects.values_list("week_start", "sets")),
+            [(week_start(last_week), 1), (week_start(timezone.now()), 1)],
+        )
+
+    def test_rebuild_matches_incremental_records(self):
+        """Test that rebuilding from history reproduces the live records"""
+        self.complete(self.sets[0], repetitions=5, weight_kg=100.0)
+        self.complete(self.sets[1], repetitions=1, weight_kg=110.0)
+        self.complete(self.sets[2])
+        fields = ["sets", "repetitions", "volume_kg", "estimated_one_rep_max_kg"]
+        live_record = list(ExerciseRecord.objects.values(*fields))
+        live_weeks = list(ExerciseWeeklyStats.objects.values("week_start", *fields))
+
+        out = StringIO()
+        call_command("rebuild_exercise_records", batch_size=1, stdout=out)
+
+        self.assertIn("Rebuilt 1 exercise records and 1 weeks", out.getvalue())
+        self.assertEqual(list(ExerciseRecord.objects.values(*fields)), live_record)
+        self.assertEqual(
+            list(ExerciseWeeklyStats.objects.values("week_start", *fields)),
+            live_weeks,
+        )
+
+    def test_records_are_private(self):
+        """Test that users only see their own records"""
+        self.complete(self.sets[0], repetitions=5, weight_kg=100.0)
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=other_user)
+
+        response = self.client.get(reverse("exerciserecord-list"))
+        self.assertEqual(response.data["results"], [])
+        response = self.client.get(self.weekly_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
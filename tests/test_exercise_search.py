@@ -0,0 +1,87 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from apps.workout.models import Exercise, ExerciseTerm
+
+
+class ExerciseSearchTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("exercise-search")
+        Exercise.objects.create(
+            name="Push Ups",
+            description="A basic bodyweight exercise for chest and triceps.",
+            instructions="Keep your body straight, lower and push up.",
+            target_muscles="chest, triceps, shoulders",
+            equipment="bodyweight",
+        )
+        Exercise.objects.create(
+            name="Bench Press",
+            description="Chest strength exercise with barbell.",
+            instructions="Lower bar to chest, push back up until arms extended.",
+            target_muscles="chest, triceps, shoulders",
+            equipment="barbell, bench",
+        )
+        Exercise.objects.create(
+            name="Squats",
+            description="Compound leg exercise.",
+            instructions="Feet shoulder-width apart, squat until thighs parallel.",
+            target_muscles="quadriceps, glutes, hamstrings",
+            equipment="bodyweight or barbell",
+        )
+
+    def names(self, response):
+        return [result["name"] for result in response.data["results"]]
+
+    def test_search_ranks_name_matches_first(self):
+        """Test that words in the name outrank words in the description"""
+        response = self.client.get(self.url, {"q": "push"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.names(response), ["Push Ups", "Bench Press"])
+        ranks = [result["rank"] for result in response.data["results"]]
+        self.assertGreater(ranks[0], ranks[1])
+
+    def test_search_matches_all_words_and_plurals(self):
+        """Test that every query word must match, singular or plural"""
+        response = self.client.get(self.url, {"q": "squat thighs"})
+        self.assertEqual(self.names(response), ["Squats"])
+
+        response = self.client.get(self.url, {"q": "squat chest"})
+        self.assertEqual(self.names(response), [])
+
+    def test_filter_by_muscle_and_equipment(self):
+        """Test facet filters on normalized muscles and equipment"""
+        response = self.client.get(self.url, {"muscle": "Chest"})
+        self.assertEqual(self.names(response), ["Bench Press", "Push Ups"])
+
+        response = self.client.get(
+            self.url, {"muscle": "chest", "equipment": "barbell"}
+        )
+        self.assertEqual(self.names(response), ["Bench Press"])
+
+        response = self.client.get(self.url, {"equipment": "barbell"})
+        self.assertEqual(self.names(response), ["Bench Press", "Squats"])
+
+    def test_search_returns_facet_counts(self):
+        """Test facet counts over the matching exercises"""
+        response = self.client.get(self.url, {"q": "exercise"})
+
+        facets = response.data["facets"]
+        self.assertIn({"value": "chest", "count": 2}, facets["muscle"])
+        self.assertIn({"value": "glutes", "count": 1}, facets["muscle"])
+        self.assertEqual(facets["equipment"][0], {"value": "barbell", "count": 2})
+
+    def test_index_follows_exercise_changes(self):
+        """Test that saving an exercise refreshes its search terms"""
+        squats = Exercise.objects.get(name="Squats")
+        squats.name = "Goblet Squats"
+        squats.equipment = "kettlebell"
+        squats.save()
+
+        response = self.client.get(self.url, {"q": "goblet"})
+        self.assertEqual(self.names(response), ["Goblet Squats"])
+        response = self.client.get(self.url, {"equipment": "bodyweight"})
+        self.assertEqual(self.names(response), ["Push Ups"])
+
+        squats.delete()
+        self.assertFalse(ExerciseTerm.objects.filter(exercise_id=squats.pk).exists())
@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.models import (
+    WorkoutPlan,
+    Exercise,
+    WorkoutExercise,
+    WeightLog,
+    FitnessGoal,
+)
+
+
+class ExportTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+
+        exercise = Exercise.objects.create(
+            name="Push Ups",
+            description="Chest exercise",
+            instructions="Lower and push",
+            target_muscles="chest",
+            equipment="bodyweight",
+        )
+        for user in (self.user, self.other_user):
+            workout_plan = WorkoutPlan.objects.create(user=user, title="Plan")
+            WorkoutExercise.objects.create(
+                workout_plan=workout_plan, exercise=exercise, sets=3
+            )
+            self.client.force_authenticate(user=user)
+            self.client.post(
+                reverse("workoutsession-start-session"),
+                {"workout_plan_id": workout_plan.pk},
+                format="json",
+            )
+            WeightLog.objects.create(user=user, weight=80.0)
+            FitnessGoal.objects.create(
+                user=user, goal_type="weight", target_value=75.0, description="Cut"
+            )
+        self.client.force_authenticate(user=self.user)
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_export(self):
+        """Test that every table is streamed as one JSON object per line"""
+        response = self.client.get(reverse("export-ndjson"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in self.read(response).splitlines()]
+        tables = [record["table"] for record in records]
+        self.assertEqual(
+            tables,
+            ["sessions", "session_exercises"]
+            + ["set_logs"] * 3
+            + ["weight_logs", "fitness_goals"],
+        )
+        self.assertEqual(records[0]["workout_plan_title"], "Plan")
+        self.assertEqual(records[1]["exercise_name"], "Push Ups")
+        self.assertEqual(records[-2]["weight"], 80.0)
+
+    def test_ndjson_export_selected_tables(self):
+        """Test restricting the export to some tables"""
+        response = self.client.get(
+            reverse("export-ndjson"), {"tables": "weight_logs,fitness_goals"}
+        )
+
+        tables = [
+            json.loads(line)["table"] for line in self.read(response).splitlines()
+        ]
+        self.assertEqual(tables, ["weight_logs", "fitness_goals"])
+
+    def test_csv_export(self):
+        """Test that a single table is streamed as CSV with a header"""
+        response = self.client.get(reverse("export-csv"), {"table": "set_logs"})
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="set_logs.csv"', response["Content-Disposition"])
+        rows = list(csv.reader(io.StringIO(self.read(response))))
+        self.assertEqual(rows[0][:3], ["id", "session_exercise_id", "set_number"])
+        self.assertEqual([row[2] for row in rows[1:]], ["1", "2", "3"])
+
+    def test_unknown_table_rejected(self):
+        """Test that unknown tables are rejected before streaming"""
+        response = self.client.get(reverse("export-csv"), {"table": "users"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["table"], ["Unknown table: users"])
+
+        response = self.client.get(reverse("export-ndjson"), {"tables": "sessions,x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["tables"], ["Unknown table: x"])
+
+    def test_export_requires_authentication(self):
+        """Test that anonymous users cannot export"""
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get(reverse("export-ndjson"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_export_command(self):
+        """Test the management command writes the same stream"""
+        out = io.StringIO()
+        call_command("export_history", "testuser", "--table", "weight_logs", stdout=out)
+
+        record = json.loads(out.getvalue())
+        self.assertEqual(record["table"], "weight_logs")
+        self.assertEqual(record["weight"], 80.0)
@@ -0,0 +1,229 @@
+from io import StringIO
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from apps.workout.models import (
+    WorkoutPlan,
+    Exercise,
+    WorkoutExercise,
+    WorkoutSession,
+    SessionExercise,
+    SetLog,
+    ExerciseRecord,
+    FitnessGoal,
+    WeightLog,
+)
+
+
+class GoalEvaluationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.goals_url = reverse("fitnessgoal-list")
+        self.weight_url = reverse("weightlog-list")
+
+        self.bench = Exercise.objects.create(
+            name="Bench Press",
+            description="Chest exercise",
+            instructions="Press the bar",
+            target_muscles="chest",
+            equipment="barbell",
+        )
+        self.squat = Exercise.objects.create(
+            name="Squats",
+            description="Leg exercise",
+            instructions="Squat down",
+            target_muscles="quadriceps",
+            equipment="barbell",
+        )
+
+    def create_goal(self, **data):
+        data.setdefault("description", "Goal")
+        response = self.client.post(self.goals_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return FitnessGoal.objects.get(pk=response.data["id"])
+
+    def log_weight(self, weight):
+        self.client.post(self.weight_url, {"weight": weight}, format="json")
+
+    def complete_set(self, exercise, **data):
+        workout_plan = WorkoutPlan.objects.create(user=self.user, title="Plan")
+        session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=workout_plan, status="completed"
+        )
+        session_exercise = SessionExercise.objects.create(
+            session=session,
+            workout_exercise=WorkoutExercise.objects.create(
+                workout_plan=workout_plan, exercise=exercise, sets=1
+            ),
+            planned_sets=1,
+        )
+        set_log = SetLog.objects.create(session_exercise=session_exercise, set_number=1)
+        url = reverse("setlog-complete-set", kwargs={"pk": set_log.pk})
+        self.client.post(url, data, format="json")
+
+    def test_weight_loss_goal_achieved(self):
+        """Test that a weight log at or below a loss target achieves the goal"""
+        self.log_weight(80.0)
+        goal = self.create_goal(goal_type="weight", target_value=75.0)
+        self.assertEqual(goal.baseline_value, 80.0)
+
+        self.log_weight(77.0)
+        goal.refresh_from_db()
+        self.assertFalse(goal.achieved)
+
+        self.log_weight(74.5)
+        goal.refresh_from_db()
+        self.assertTrue(goal.achieved)
+        self.assertIsNotNone(goal.achieved_at)
+
+    def test_weight_gain_goal_achieved(self):
+        """Test that gain goals are met from below and not by losing weight"""
+        self.log_weight(60.0)
+        gain = self.create_goal(goal_type="weight", target_value=65.0)
+        loss = self.create_goal(goal_type="weight", target_value=55.0)
+
+        self.log_weight(66.0)
+
+        gain.refresh_from_db()
+        loss.refresh_from_db()
+        self.assertTrue(gain.achieved)
+        self.assertFalse(loss.achieved)
+
+    def test_first_weigh_in_sets_baseline(self):
+        """Test that goals set before any weigh-in take the first log as baseline"""
+        goal = self.create_goal(goal_type="weight", target_value=70.0)
+        self.assertIsNone(goal.baseline_value)
+
+        self.log_weight(72.0)
+        goal.refresh_from_db()
+        self.assertEqual(goal.baseline_value, 72.0)
+        self.assertFalse(goal.achieved)
+
+        self.log_weight(70.0)
+        goal.refresh_from_db()
+        self.assertTrue(goal.achieved)
+
+    def test_exercise_goal_achieved_on_set_completion(self):
+        """Test that completing a set checks goals on that exercise only"""
+        bench_goal = self.create_goal(
+            goal_type="exercise",
+            target_value=100.0,
+            exercise=self.bench.pk,
+            metric="max_weight_kg",
+        )
+        squat_goal = self.create_goal(
+            goal_type="exercise",
+            target_value=5.0,
+            exercise=self.squat.pk,
+            metric="max_repetitions",
+        )
+
+        self.complete_set(self.bench, repetitions=5, weight_kg=90.0)
+        bench_goal.refresh_from_db()
+        self.assertFalse(bench_goal.achieved)
+
+        self.complete_set(self.bench, repetitions=2, weight_kg=100.0)
+        bench_goal.refresh_from_db()
+        squat_goal.refresh_from_db()
+        self.assertTrue(bench_goal.achieved)
+        self.assertFalse(squat_goal.achieved)
+
+    def test_goal_already_met_on_creation(self):
+        """Test that a goal met by existing records is achieved immediately"""
+        self.complete_set(self.squat, repetitions=12, weight_kg=60.0)
+
+        response = self.client.post(
+            self.goals_url,
+            {
+                "goal_type": "exercise",
+                "target_value": 10,
+                "description": "Ten squats with load",
+                "exercise": self.squat.pk,
+                "metric": "max_repetitions",
+            },
+            format="json",
+        )
+
+        self.assertTrue(response.data["achieved"])
+        self.assertIsNotNone(response.data["achieved_at"])
+
+    def test_metric_requires_exercise_goal(self):
+        """Test that metrics are only accepted together with an exercise"""
+        response = self.client.post(
+            self.goals_url,
+            {
+                "goal_type": "exercise",
+                "target_value": 10,
+                "description": "No exercise",
+                "metric": "max_repetitions",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.goals_url,
+            {
+                "goal_type": "weight",
+                "target_value": 70,
+                "description": "Weight with exercise",
+                "exercise": self.bench.pk,
+                "metric": "max_weight_kg",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_reevaluate_command(self):
+        """Test bulk re-evaluation of goals written outside the API"""
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="TestPass123!"
+        )
+        WeightLog.objects.bulk_create([WeightLog(user=other_user, weight=68.0)])
+        ExerciseRecord.objects.create(
+            user=self.user,
+            exercise=self.bench,
+            max_weight_kg=120.0,
+            first_performed_at=timezone.now(),
+            last_performed_at=timezone.now(),
+        )
+        FitnessGoal.objects.bulk_create(
+            [
+                FitnessGoal(
+                    user=self.user,
+                    goal_type="exercise",
+                    target_value=110.0,
+                    description="Bench 110",
+                    exercise=self.bench,
+                    metric="max_weight_kg",
+                ),
+                FitnessGoal(
+                    user=other_user,
+                    goal_type="weight",
+                    target_value=70.0,
+                    baseline_value=75.0,
+                    description="Reach 70kg",
+                ),
+                FitnessGoal(
+                    user=other_user,
+                    goal_type="weight",
+                    target_value=60.0,
+                    description="Reach 60kg",
+                ),
+            ]
+        )
+
+        out = StringIO()
+        call_command("reevaluate_goals", batch_size=1, stdout=out)
+
+        self.assertIn("Marked 2 goals achieved", out.getvalue())
+        open_goal = FitnessGoal.objects.get(achieved=False)
+        self.assertEqual(open_goal.description, "Reach 60kg")
+        self.assertEqual(open_goal.baseline_value, 68.0)
@@ -0,0 +1,166 @@
+import json
+import tempfile
+from io import StringIO
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.importer import HistoryImporter, read_csv
+from apps.workout.models import (
+    Exercise,
+    WorkoutPlan,
+    WorkoutSession,
+    SessionExercise,
+    SetLog,
+    ExerciseRecord,
+    TrainingAggregate,
+)
+
+CSV_HISTORY = """session,plan,started_at,completed_at,exercise,repetitions,weight_kg
+a,Push Day,2023-03-06T18:00:00Z,2023-03-06T19:00:00Z,Bench Press,5,80
+a,Push Day,2023-03-06T18:00:00Z,2023-03-06T19:00:00Z,Bench Press,5,85
+a,Push Day,2023-03-06T18:00:00Z,2023-03-06T19:00:00Z,push ups,20,
+b,Push Day,2023-03-09T18:00:00Z,,Bench Press,3,90
+"""
+
+
+class ImportHistoryTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("import-list")
+        for name in ("Bench Press", "Push Ups"):
+            Exercise.objects.create(
+                name=name,
+                description="Chest exercise",
+                instructions="Push",
+                target_muscles="chest",
+                equipment="bodyweight",
+            )
+
+    def upload(self, name, content, **data):
+        data["file"] = SimpleUploadedFile(name, content.encode())
+        return self.client.post(self.url, data, format="multipart")
+
+    def test_import_csv(self):
+        """Test importing sessions, exercises and sets from CSV rows"""
+        response = self.upload("history.csv", CSV_HISTORY)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["sessions"], 2)
+        self.assertEqual(response.data["sets"], 4)
+        self.assertEqual(response.data["error_count"], 0)
+
+        self.assertEqual(WorkoutPlan.objects.get(user=self.user).title, "Push Day")
+        first, second = WorkoutSession.objects.order_by("started_at")
+        self.assertEqual(first.started_at.isoformat(), "2023-03-06T18:00:00+00:00")
+        self.assertEqual(first.status, "completed")
+        self.assertEqual(first.total_duration_minutes, 60)
+        self.assertEqual(second.completed_at, second.started_at)
+
+        bench = SessionExercise.objects.get(session=first, order=0)
+        self.assertEqual((bench.planned_sets, bench.completed_sets), (2, 2))
+        self.assertEqual(
+            list(bench.set_logs.values_list("set_number", "weight_kg")),
+            [(1, 80.0), (2, 85.0)],
+        )
+        self.assertFalse(SetLog.objects.filter(completed=False).exists())
+
+        # Summaries are rebuilt for the imported history
+        record = ExerciseRecord.objects.get(exercise__name="Bench Press")
+        self.assertEqual(record.sets, 3)
+        self.assertEqual(record.max_weight_kg, 90.0)
+        self.assertEqual(
+            TrainingAggregate.objects.get(period="week").sessions_completed, 2
+        )
+
+    def test_import_ndjson_reports_bad_rows(self):
+        """Test that invalid rows are skipped and reported by row number"""
+        rows = [
+            {"session": "a", "started_at": "2023-01-02", "exercise": "Bench Press"},
+            {"session": "a", "started_at": "2023-01-02", "exercise": "Curl"},
+            {"session": "b", "started_at": "2023-01-03", "exercise": "Push Ups"},
+            {"session": "a", "started_at": "2023-01-02", "exercise": "Push Ups"},
+            {"session": "c", "started_at": "yesterday", "exercise": "Push Ups"},
+            {
+                "session": "c",
+                "started_at": "2023-01-04",
+                "exercise": "Push Ups",
+                "repetitions": "-3",
+            },
+        ]
+        content = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+
+        response = self.upload("history.ndjson", content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["sets"], 2)
+        self.assertEqual(
+            [error["row"] for error in response.data["errors"]], [2, 4, 5, 6, 7]
+        )
+        self.assertIn("Unknown exercise", response.data["errors"][0]["error"])
+        self.assertIn("not contiguous", response.data["errors"][1]["error"])
+
+    def test_import_ndjson_rejects_malformed_values(self):
+        """Test that wrongly typed and out of range values are row errors"""
+        base = {"session": "a", "started_at": "2023-01-02", "exercise": "Push Ups"}
+        rows = [
+            {**base, "exercise": 5},
+            {**base, "plan": 7},
+            {**base, "repetitions": 1e400},
+            {**base, "repetitions": 99999999999999},
+            {**base, "weight_kg": "inf"},
+            {**base, "weight_kg": "nan"},
+            {**base, "repetitions": 2.5},
+            {**base, "plan": "x" * 300},
+            {**base, "repetitions": 10, "weight_kg": 20.5},
+        ]
+        content = "\n".join(json.dumps(row) for row in rows) + "\n"
+
+        response = self.upload("history.ndjson", content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["sets"], 1)
+        self.assertEqual(
+            [error["row"] for error in response.data["errors"]], list(range(1, 9))
+        )
+        self.assertIn("Invalid exercise", response.data["errors"][0]["error"])
+        self.assertIn("too large", response.data["errors"][3]["error"])
+
+    def test_import_in_chunks_with_progress(self):
+        """Test that rows are flushed in chunks at session boundaries"""
+        progress = []
+        importer = HistoryImporter(
+            self.user, chunk_size=2, progress=lambda *counts: progress.append(counts)
+        )
+
+        report = importer.run(read_csv(StringIO(CSV_HISTORY)))
+
+        self.assertEqual(report["sets"], 4)
+        self.assertEqual(progress, [(4, 1, 3), (4, 2, 4)])
+
+    def test_rejects_unknown_format(self):
+        """Test that files of an unknown type or without a header are rejected"""
+        response = self.upload("history.xlsx", CSV_HISTORY)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.upload("history.csv", "a,b\n1,2\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(WorkoutSession.objects.exists())
+
+    def test_import_command(self):
+        """Test the management command imports a file and reports progress"""
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as history:
+            history.write(CSV_HISTORY)
+            history.flush()
+            out = StringIO()
+            call_command("import_history", "testuser", history.name, stdout=out)
+
+        self.assertIn("4 rows read, 2 sessions, 4 sets", out.getvalue())
+        self.assertIn("Imported 4 sets in 2 sessions", out.getvalue())
+        self.assertEqual(SetLog.objects.count(), 4)
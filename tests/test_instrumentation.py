@@ -0,0 +1,83 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.test import override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.instrumentation import registry
+from apps.workout.models import WeightLog
+
+
+class RequestMetricsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+        for index in range(3):
+            WeightLog.objects.create(user=self.user, weight=80 + index)
+        registry.reset()
+
+    def server_timing(self, response):
+        return dict(
+            entry.split(";", 1) for entry in response["Server-Timing"].split(", ")
+        )
+
+    def test_server_timing_header(self):
+        """Test that responses report query count and time per phase"""
+        with self.assertNumQueries(1) as queries:
+            response = self.client.get(reverse("weightlog-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        timing = self.server_timing(response)
+        self.assertEqual(set(timing), {"db", "app", "render", "total"})
+        self.assertIn(f'desc="{len(queries)} queries"', timing["db"])
+
+    @override_settings(DEBUG=True)
+    def test_metrics_endpoint(self):
+        """Test that requests are aggregated into per-route histograms"""
+        self.client.get(reverse("weightlog-list"))
+        self.client.get(reverse("weightlog-list"))
+        self.client.get(reverse("weightlog-detail", args=[0]))
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        self.assertIn(
+            'http_requests_total{route="weightlog-list",method="GET",'
+            'status="200"} 2',
+            body,
+        )
+        self.assertIn('route="weightlog-detail",method="GET",status="404"} 1', body)
+        self.assertIn(
+            'http_request_queries_bucket{route="weightlog-list",method="GET",'
+            'le="1"} 2',
+            body,
+        )
+        self.assertIn("# TYPE http_request_duration_seconds histogram", body)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_metrics_token(self):
+        """Test that a configured token is required to scrape metrics"""
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(DEBUG=False, METRICS_TOKEN=None)
+    def test_metrics_hidden_without_token(self):
+        """Test that metrics are not served in production without a token"""
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(REQUEST_QUERY_BUDGET=0)
+    def test_query_budget_logged(self):
+        """Test that requests over the query budget are logged"""
+        with self.assertLogs("apps.workout.instrumentation", "WARNING") as logs:
+            self.client.get(reverse("weightlog-list"))
+
+        self.assertIn("/api/workout/weight-logs/", logs.output[0])
+        self.assertIn("(budget 0)", logs.output[0])
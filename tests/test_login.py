@@ -1,7 +1,15 @@
+from io import StringIO
+from unittest import mock
+
 from rest_framework.test import APITestCase
 from rest_framework import status
+from django.contrib.auth import authenticate
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from apps.authentication.hashers import ConfigurablePBKDF2PasswordHasher
 
 
 class LoginTests(APITestCase):
@@ -29,3 +37,58 @@ class LoginTests(APITestCase):
         response = self.client.post(self.url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["detail"][0], "Invalid email or password.")
+
+
+class EmailBackendTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("login")
+        self.user = User.objects.create_user(
+            username="admin", email="admin@gmail.com", password="Qwerty1234@"
+        )
+
+    def test_login_ignores_email_case(self):
+        """Test that the email matches regardless of case and whitespace"""
+        data = {"email": " Admin@Gmail.COM", "password": "Qwerty1234@"}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_unknown_email_runs_hasher(self):
+        """Test that unknown emails cost one password hash like known ones"""
+        with mock.patch.object(
+            ConfigurablePBKDF2PasswordHasher, "encode", autospec=True
+        ) as encode:
+            encode.return_value = "pbkdf2_sha256$1$salt$hash"
+            user = authenticate(None, email="nobody@gmail.com", password="x")
+
+        self.assertIsNone(user)
+        encode.assert_called_once()
+
+    def test_rehash_on_login(self):
+        """Test that a changed work factor is applied on the next login"""
+        with override_settings(PASSWORD_HASHER_ITERATIONS=1500):
+            data = {"email": "admin@gmail.com", "password": "Qwerty1234@"}
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1500$"))
+        self.assertTrue(self.user.check_password("Qwerty1234@"))
+
+    def test_email_unique_ignoring_case(self):
+        """Test that the database rejects an email differing only in case"""
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(username="other", email="ADMIN@gmail.com")
+
+        User.objects.create_user(username="blank1", email="")
+        User.objects.create_user(username="blank2", email="")
+
+    def test_benchmark_login(self):
+        """Test that the login benchmark reports both cases and rolls back"""
+        out = StringIO()
+        call_command("benchmark_login", count=2, iterations=1000, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("known email", output)
+        self.assertIn("unknown email", output)
+        self.assertIn("pbkdf2_sha256 with 1000 iterations", output)
+        self.assertFalse(User.objects.filter(username="benchmark-login").exists())
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from io import StringIO
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from apps.authentication.blacklist import revoked_cache
+from apps.authentication.models import RevokedToken
+
+
+class LogoutTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+
+    def login(self):
+        response = self.client.post(
+            reverse("login"),
+            {"email": "test@example.com", "password": "TestPass123!"},
+            format="json",
+        )
+        return response.data["refresh"]
+
+    def logout(self, refresh):
+        return self.client.post(reverse("logout"), {"refresh": refresh}, format="json")
+
+    def test_login_stores_nothing(self):
+        """Test that issuing tokens writes no token rows"""
+        with self.assertNumQueries(1):
+            self.login()
+
+        self.assertFalse(RevokedToken.objects.exists())
+
+    def test_logout_revokes_token(self):
+        """Test that a logged out refresh token cannot be used again"""
+        refresh = self.login()
+
+        response = self.logout(refresh)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(RevokedToken.objects.count(), 1)
+
+        response = self.logout(refresh)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_revoked_token_checked_in_database(self):
+        """Test that revocations by other workers are seen, then remembered"""
+        refresh = self.login()
+        self.logout(refresh)
+        revoked_cache.clear()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.logout(refresh).status_code, 401)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.logout(refresh).status_code, 401)
+
+    def test_purge_expired(self):
+        """Test that only expired revocations are purged, in batches"""
+        now = timezone.now()
+        RevokedToken.objects.bulk_create(
+            [
+                RevokedToken(jti=f"expired-{index}", expires_at=now - timedelta(1))
+                for index in range(5)
+            ]
+            + [RevokedToken(jti="live", expires_at=now + timedelta(1))]
+        )
+
+        out = StringIO()
+        with self.assertNumQueries(6):
+            call_command("purge_revoked_tokens", batch_size=2, stdout=out)
+
+        self.assertIn("Purged 5 expired revoked tokens", out.getvalue())
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["live"]
+        )
+
+    def test_drop_token_blacklist(self):
+        """Test that legacy blacklist tables are dropped after copying live tokens"""
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE token_blacklist_outstandingtoken "
+                "(id integer PRIMARY KEY, jti varchar(255), expires_at datetime)"
+            )
+            cursor.execute(
+                "CREATE TABLE token_blacklist_blacklistedtoken "
+                "(id integer PRIMARY KEY, token_id integer)"
+            )
+            cursor.executemany(
+                "INSERT INTO token_blacklist_outstandingtoken VALUES (%s, %s, %s)",
+                [
+                    (1, "live", now + timedelta(1)),
+                    (2, "expired", now - timedelta(1)),
+                    (3, "not-revoked", now + timedelta(1)),
+                ],
+            )
+            cursor.executemany(
+                "INSERT INTO token_blacklist_blacklistedtoken VALUES (%s, %s)",
+                [(1, 1), (2, 2)],
+            )
+
+        out = StringIO()
+        call_command("drop_token_blacklist", stdout=out)
+
+        self.assertIn("Copied 1 revoked tokens", out.getvalue())
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["live"]
+        )
+        self.assertNotIn(
+            "token_blacklist_outstandingtoken", connection.introspection.table_names()
+        )
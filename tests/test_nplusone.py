@@ -0,0 +1,107 @@
+import pytest
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.models import Exercise, WorkoutExercise, WorkoutPlan
+from apps.workout.nplusone import NPlusOneError, QueryShapeTracker, query_shape
+from apps.workout.serializers import WorkoutExerciseSerializer
+from tests.conftest import request_query_budget
+
+
+def create_plans(user, plans=6, exercises=3):
+    exercise_objects = [
+        Exercise.objects.create(
+            name=f"Exercise {index}",
+            description="Test",
+            instructions="Test",
+            target_muscles="chest",
+        )
+        for index in range(exercises)
+    ]
+    for index in range(plans):
+        plan = WorkoutPlan.objects.create(user=user, title=f"Plan {index}")
+        for exercise in exercise_objects:
+            WorkoutExercise.objects.create(workout_plan=plan, exercise=exercise)
+
+
+class NPlusOneDetectionTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+        create_plans(self.user)
+
+    def test_reports_serializer_field_path(self):
+        """Test that a query repeated per row names the serializer field"""
+        tracker = QueryShapeTracker(threshold=3, action="raise", label="test")
+
+        with self.assertRaises(NPlusOneError) as error:
+            with connection.execute_wrapper(tracker):
+                WorkoutExerciseSerializer(WorkoutExercise.objects.all(), many=True).data
+
+        message = str(error.exception)
+        self.assertIn("field WorkoutExerciseSerializer.exercise", message)
+        self.assertIn("tests/test_nplusone.py", message)
+        self.assertIn('FROM "workout_exercise"', message)
+
+    @override_settings(N_PLUS_ONE_ACTION="warn", N_PLUS_ONE_THRESHOLD=1)
+    def test_middleware_warns(self):
+        """Test that the middleware logs repeated queries in warn mode"""
+        with self.assertLogs("apps.workout.nplusone", "WARNING") as logs:
+            response = self.client.get(reverse("workoutplan-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("GET /api/workout/workout-plans/", logs.output[0])
+
+    @override_settings(N_PLUS_ONE_THRESHOLD=1)
+    def test_middleware_raises(self):
+        """Test that the middleware rejects repeated queries in raise mode"""
+        with self.assertRaises(NPlusOneError):
+            self.client.get(reverse("workoutplan-list"))
+
+    @pytest.mark.max_queries(3)
+    def test_plan_list_is_preloaded(self):
+        """Test that plans with exercises are listed with a fixed number of queries"""
+        response = self.client.get(reverse("workoutplan-list"))
+
+        self.assertEqual(response.data["count"], 6)
+        self.assertEqual(
+            response.data["results"][0]["exercises"][0]["exercise"]["name"],
+            "Exercise 0",
+        )
+
+    def test_query_budget_fails_over_limit(self):
+        """Test that requests over the budget fail the test"""
+        with self.assertRaises(pytest.fail.Exception) as error:
+            with request_query_budget(1):
+                self.client.get(reverse("workoutplan-list"))
+
+        self.assertIn(
+            "GET /api/workout/workout-plans/: 3 queries", str(error.exception)
+        )
+
+    def test_query_shape(self):
+        """Test that placeholder lists of any length share one shape"""
+        self.assertEqual(
+            query_shape('SELECT "a" FROM "t" WHERE "id" IN (%s, %s, %s)'),
+            query_shape('SELECT "a" FROM "t"\n WHERE "id" IN (%s)'),
+        )
+
+
+@pytest.mark.django_db
+def test_max_queries_fixture(max_queries):
+    """Test the per-request query budget fixture in pytest-style tests"""
+    user = User.objects.create_user(username="fixtureuser", password="TestPass123!")
+    create_plans(user, plans=2)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with max_queries(3) as requests:
+        client.get(reverse("workoutplan-list"))
+        client.get(reverse("workoutexercise-list"))
+
+    assert [queries for _, _, queries in requests] == [3, 2]
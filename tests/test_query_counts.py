@@ -0,0 +1,145 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from apps.workout.analytics import period_starts, week_start
+from apps.workout.models import (
+    WorkoutPlan,
+    Exercise,
+    WorkoutExercise,
+    WorkoutSession,
+    SessionExercise,
+    SetLog,
+    ExerciseRecord,
+    ExerciseWeeklyStats,
+    TrainingAggregate,
+)
+
+
+class SessionQueryCountTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.workout_plan = WorkoutPlan.objects.create(
+            user=self.user, title="Test Workout"
+        )
+        workout_exercises = []
+        for index in range(3):
+            exercise = Exercise.objects.create(
+                name=f"Exercise {index}",
+                description="Description",
+                instructions="Instructions",
+                target_muscles="full body",
+            )
+            workout_exercises.append(
+                WorkoutExercise.objects.create(
+                    workout_plan=self.workout_plan, exercise=exercise, sets=3
+                )
+            )
+
+        for _ in range(5):
+            session = WorkoutSession.objects.create(
+                user=self.user, workout_plan=self.workout_plan, status="completed"
+            )
+            for order, workout_exercise in enumerate(workout_exercises):
+                session_exercise = SessionExercise.objects.create(
+                    session=session,
+                    workout_exercise=workout_exercise,
+                    order=order,
+                    planned_sets=3,
+                )
+                for set_number in range(1, 4):
+                    SetLog.objects.create(
+                        session_exercise=session_exercise, set_number=set_number
+                    )
+
+        self.session = session
+        self.session_exercise = session_exercise
+
+    def test_list_sessions_query_count(self):
+        """Test that listing sessions runs a fixed number of queries"""
+        # sessions with plans, session exercises with exercises, set logs
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("workoutsession-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 5)
+
+    def test_list_session_summaries_query_count(self):
+        """Test that session summaries are aggregated in a single query"""
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("workoutsession-list"), {"view": "summary"}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(response.data["results"][0]["set_count"], 9)
+
+    def test_retrieve_session_query_count(self):
+        """Test that a session detail runs a fixed number of queries"""
+        url = reverse("workoutsession-detail", kwargs={"pk": self.session.pk})
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["session_exercises"]), 3)
+
+    def test_list_session_exercises_query_count(self):
+        """Test that listing session exercises runs a fixed number of queries"""
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("sessionexercise-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 15)
+
+    def test_retrieve_session_exercise_query_count(self):
+        """Test that a session exercise detail runs a fixed number of queries"""
+        url = reverse("sessionexercise-detail", kwargs={"pk": self.session_exercise.pk})
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["set_logs"]), 3)
+
+    def test_list_set_logs_query_count(self):
+        """Test that listing set logs runs a fixed number of queries"""
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("setlog-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 20)
+
+    def test_complete_set_query_count(self):
+        """Test that completing a set runs a fixed number of queries"""
+        set_log = SetLog.objects.filter(session_exercise=self.session_exercise).first()
+        url = reverse("setlog-complete-set", kwargs={"pk": set_log.pk})
+
+        ExerciseRecord.objects.create(
+            user=self.user,
+            exercise=self.session_exercise.workout_exercise.exercise,
+            first_performed_at=timezone.now(),
+            last_performed_at=timezone.now(),
+        )
+        ExerciseWeeklyStats.objects.create(
+            user=self.user,
+            exercise=self.session_exercise.workout_exercise.exercise,
+            week_start=week_start(timezone.now()),
+        )
+        for period, start in period_starts(timezone.now()).items():
+            TrainingAggregate.objects.create(
+                user=self.user, period=period, period_start=start
+            )
+
+        # set lookup with its exercise, savepoint, set update, exercise
+        # counter update, record, weekly stats, day and week aggregate
+        # upserts, goal evaluation, release
+        with self.assertNumQueries(10):
+            response = self.client.post(url, {"repetitions": 10}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["completed"])
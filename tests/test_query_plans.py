@@ -0,0 +1,49 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from apps.workout.management.commands.check_query_plans import (
+    SEQUENTIAL_SCAN_PATTERNS,
+)
+from apps.workout.models import WorkoutSession
+
+
+class CheckQueryPlansTests(TestCase):
+    def test_hot_queries_use_indexes(self):
+        """Test that every hot query is answered from an index"""
+        out = StringIO()
+        call_command("check_query_plans", seed_users=5, sessions_per_user=3, stdout=out)
+
+        self.assertIn("All hot queries use an index", out.getvalue())
+        self.assertNotIn("sequential scan", out.getvalue())
+
+    def test_seeded_data_is_rolled_back(self):
+        """Test that the synthetic dataset is discarded by default"""
+        call_command(
+            "check_query_plans", seed_users=2, sessions_per_user=2, stdout=StringIO()
+        )
+
+        self.assertFalse(WorkoutSession.objects.exists())
+
+    def test_requires_data(self):
+        """Test that the command refuses to run against an empty database"""
+        with self.assertRaises(CommandError):
+            call_command("check_query_plans", stdout=StringIO())
+
+    def test_detects_sequential_scans(self):
+        """Test recognising sequential scans in query plans"""
+        sqlite = SEQUENTIAL_SCAN_PATTERNS["sqlite"]
+        postgresql = SEQUENTIAL_SCAN_PATTERNS["postgresql"]
+
+        self.assertEqual(
+            sqlite.findall("2 0 0 SCAN workout_setlog"), ["workout_setlog"]
+        )
+        self.assertEqual(
+            sqlite.findall("2 0 0 SCAN workout_setlog USING INDEX setlog_next_set_idx"),
+            [],
+        )
+        self.assertEqual(
+            postgresql.findall("Seq Scan on workout_setlog  (cost=0.00..1.01)"),
+            ["workout_setlog"],
+        )
@@ -68,3 +68,17 @@ class SimpleRegisterTests(APITestCase):
         response = self.client.post(self.url, self.exist_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("email", response.data)
+
+    def test_register_duplicate_email_other_case(self):
+        data = self.valid_data.copy()
+        data["email"] = "Admin@Gmail.com"
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["email"][0], "Email already exists")
+
+    def test_register_stores_lowercase_email(self):
+        data = self.valid_data.copy()
+        data["email"] = "Sergo@Example.COM"
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.filter(email="sergo@example.com").exists())
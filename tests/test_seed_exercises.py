@@ -0,0 +1,113 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from apps.workout.catalog import DEFAULT_CATALOG, load_catalog, seed_exercises
+from apps.workout.models import Exercise, ExerciseTerm
+
+
+class SeedExercisesTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, content):
+        path = Path(self.directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def seed(self, *paths):
+        out = StringIO()
+        call_command("seed_exercises", *paths, stdout=out)
+        return out.getvalue()
+
+    def test_seed_bundled_catalog(self):
+        """Test seeding the bundled catalog and that re-runs write nothing"""
+        output = self.seed()
+
+        self.assertIn("20 created, 0 updated, 0 unchanged", output)
+        self.assertEqual(Exercise.objects.count(), 20)
+        self.assertTrue(ExerciseTerm.objects.filter(exercise__name="Push Ups").exists())
+
+        # One query reads the existing rows, nothing else is written
+        with self.assertNumQueries(1):
+            counts = seed_exercises(load_catalog(DEFAULT_CATALOG))
+        self.assertEqual(counts, {"created": 0, "updated": 0, "unchanged": 20})
+
+    def test_yaml_catalog_updates_changed_rows(self):
+        """Test that a YAML catalog updates changed exercises and adds new ones"""
+        Exercise.objects.create(
+            name="Plank",
+            description="Old",
+            instructions="Hold",
+            target_muscles="core",
+        )
+        Exercise.objects.create(
+            name="Squats",
+            description="Legs",
+            instructions="Squat",
+            target_muscles="legs",
+            equipment="barbell",
+        )
+        path = self.write(
+            "catalog.yaml",
+            "exercises:\n"
+            "  - name: Plank\n"
+            "    description: Core hold\n"
+            "    instructions: Hold\n"
+            "    target_muscles: core\n"
+            "  - name: Squats\n"
+            "    description: Legs\n"
+            "    instructions: Squat\n"
+            "    target_muscles: legs\n"
+            "    equipment: barbell\n"
+            "  - name: Burpees\n"
+            "    description: Cardio\n"
+            "    instructions: Drop and jump\n"
+            "    target_muscles: full body\n",
+        )
+
+        output = self.seed(path)
+
+        self.assertIn("1 created, 1 updated, 1 unchanged", output)
+        plank = Exercise.objects.get(name="Plank")
+        self.assertEqual(plank.description, "Core hold")
+        self.assertIsNone(plank.equipment)
+        self.assertEqual(Exercise.objects.count(), 3)
+        self.assertTrue(
+            ExerciseTerm.objects.filter(
+                exercise__name="Burpees", term="cardio"
+            ).exists()
+        )
+
+    def test_later_entries_override_earlier(self):
+        """Test that entries repeating a name across files are merged"""
+        entry = {
+            "name": "Dips",
+            "description": "Triceps",
+            "instructions": "Lower and press",
+            "target_muscles": "triceps",
+        }
+        first = self.write("first.json", json.dumps([entry]))
+        second = self.write("second.json", json.dumps([{**entry, "equipment": "bars"}]))
+
+        output = self.seed(first, second)
+
+        self.assertIn("1 created", output)
+        self.assertEqual(Exercise.objects.get(name="Dips").equipment, "bars")
+
+    def test_invalid_catalog_rejected(self):
+        """Test that invalid files and entries abort before writing"""
+        missing = self.write("missing.json", json.dumps([{"name": "Dips"}]))
+        with self.assertRaisesMessage(CommandError, "missing description"):
+            self.seed(missing)
+
+        broken = self.write("broken.json", "{")
+        with self.assertRaises(CommandError):
+            self.seed(broken)
+
+        self.assertFalse(Exercise.objects.exists())
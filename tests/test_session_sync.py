@@ -0,0 +1,202 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from apps.workout.analytics import period_starts, week_start
+from apps.workout.models import (
+    WorkoutPlan,
+    Exercise,
+    WorkoutExercise,
+    WorkoutSession,
+    SessionExercise,
+    SetLog,
+    ExerciseRecord,
+    ExerciseWeeklyStats,
+    TrainingAggregate,
+)
+
+
+class SessionSyncTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+
+        exercise = Exercise.objects.create(
+            name="Push Ups",
+            description="Chest exercise",
+            instructions="Lower and push",
+            target_muscles="chest, triceps",
+            equipment="bodyweight",
+        )
+        self.workout_plan = WorkoutPlan.objects.create(
+            user=self.user, title="Test Workout"
+        )
+        workout_exercise = WorkoutExercise.objects.create(
+            workout_plan=self.workout_plan, exercise=exercise, sets=2, repetitions=10
+        )
+        self.session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="in_progress"
+        )
+        self.session_ex1 = SessionExercise.objects.create(
+            session=self.session,
+            workout_exercise=workout_exercise,
+            order=0,
+            planned_sets=2,
+        )
+        self.session_ex2 = SessionExercise.objects.create(
+            session=self.session,
+            workout_exercise=workout_exercise,
+            order=1,
+            planned_sets=2,
+        )
+        self.set1 = SetLog.objects.create(
+            session_exercise=self.session_ex1, set_number=1
+        )
+        self.set2 = SetLog.objects.create(
+            session_exercise=self.session_ex1, set_number=2
+        )
+        self.set3 = SetLog.objects.create(
+            session_exercise=self.session_ex2, set_number=1
+        )
+        self.url = reverse("workoutsession-sync", kwargs={"pk": self.session.pk})
+
+    def test_sync_completes_sets_and_exercises(self):
+        """Test applying a batch of offline set completions"""
+        data = {
+            "sets": [
+                {"id": self.set1.pk, "repetitions": 10, "weight_kg": 20.0},
+                {
+                    "id": self.set2.pk,
+                    "repetitions": 8,
+                    "completed_at": "2026-01-05T18:30:00Z",
+                },
+                {"id": self.set3.pk, "repetitions": 12},
+            ],
+            "exercises": [{"id": self.session_ex2.pk, "status": "in_progress"}],
+        }
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["result"] for item in response.data["sets"]], ["ok", "ok", "ok"]
+        )
+        self.assertEqual(response.data["exercises"][0]["result"], "ok")
+
+        self.set2.refresh_from_db()
+        self.assertTrue(self.set2.completed)
+        self.assertEqual(self.set2.repetitions, 8)
+        self.assertEqual(
+            self.set2.completed_at.isoformat(), "2026-01-05T18:30:00+00:00"
+        )
+
+        self.session_ex1.refresh_from_db()
+        self.assertEqual(self.session_ex1.completed_sets, 2)
+        self.assertEqual(self.session_ex1.status, "completed")
+        self.assertIsNotNone(self.session_ex1.completed_at)
+
+        self.session_ex2.refresh_from_db()
+        self.assertEqual(self.session_ex2.completed_sets, 1)
+        self.assertEqual(self.session_ex2.status, "in_progress")
+        self.assertIsNotNone(self.session_ex2.started_at)
+
+    def test_sync_reports_partial_failures(self):
+        """Test that invalid items are reported without rejecting the batch"""
+        self.set2.completed = True
+        self.set2.save()
+        other_session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="completed"
+        )
+        foreign_set = SetLog.objects.create(
+            session_exercise=SessionExercise.objects.create(
+                session=other_session,
+                workout_exercise=self.session_ex1.workout_exercise,
+                planned_sets=1,
+            ),
+            set_number=1,
+        )
+
+        data = {
+            "sets": [
+                {"id": self.set1.pk, "repetitions": 10},
+                {"id": self.set2.pk, "repetitions": 10},
+                {"id": foreign_set.pk, "repetitions": 10},
+                {"id": self.set3.pk, "repetitions": "many"},
+                {"id": self.set1.pk, "repetitions": 11},
+            ],
+            "exercises": [
+                {"id": self.session_ex2.pk, "status": "resting"},
+                {"id": 999999, "status": "skipped"},
+            ],
+        }
+        response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["result"] for item in response.data["sets"]],
+            ["ok", "error", "error", "error", "error"],
+        )
+        self.assertIn("repetitions", response.data["sets"][3]["errors"])
+        self.assertEqual(
+            [item["result"] for item in response.data["exercises"]],
+            ["error", "error"],
+        )
+
+        self.set1.refresh_from_db()
+        self.assertEqual(self.set1.repetitions, 10)
+        foreign_set.refresh_from_db()
+        self.assertFalse(foreign_set.completed)
+        self.session_ex1.refresh_from_db()
+        self.assertEqual(self.session_ex1.completed_sets, 2)
+
+    def test_sync_query_count_independent_of_batch_size(self):
+        """Test that a sync runs a fixed number of queries"""
+        for set_number in range(2, 12):
+            SetLog.objects.create(
+                session_exercise=self.session_ex2, set_number=set_number
+            )
+        set_ids = list(SetLog.objects.values_list("id", flat=True))
+        exercise = self.session_ex1.workout_exercise.exercise
+        ExerciseRecord.objects.create(
+            user=self.user,
+            exercise=exercise,
+            first_performed_at=timezone.now(),
+            last_performed_at=timezone.now(),
+        )
+        ExerciseWeeklyStats.objects.create(
+            user=self.user, exercise=exercise, week_start=week_start(timezone.now())
+        )
+        for period, start in period_starts(timezone.now()).items():
+            TrainingAggregate.objects.create(
+                user=self.user, period=period, period_start=start
+            )
+
+        # session, savepoint, exercises, sets, set update, record, weekly
+        # stats, day and week aggregate upserts, goal evaluation, counts,
+        # exercise update, release
+        with self.assertNumQueries(13):
+            response = self.client.post(
+                self.url,
+                {"sets": [{"id": pk, "repetitions": 5} for pk in set_ids]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(SetLog.objects.filter(completed=True).count(), 13)
+
+    def test_cannot_sync_other_users_session(self):
+        """Test that a user cannot sync someone else's session"""
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=other_user)
+
+        response = self.client.post(
+            self.url, {"sets": [{"id": self.set1.pk}]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.set1.refresh_from_db()
+        self.assertFalse(self.set1.completed)
@@ -0,0 +1,89 @@
+from unittest import mock
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.models import WorkoutPlan
+from apps.workout.throttling import EndpointRateThrottle
+
+RATES = {
+    "read": "3/minute",
+    "write": "3/minute",
+    "session_start": "1/minute",
+    "import": "1/day",
+    "export": "1/day",
+    "auth": "2/minute",
+}
+
+
+@mock.patch.object(EndpointRateThrottle, "THROTTLE_RATES", RATES)
+class EndpointRateThrottleTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_reads_limited_per_window(self):
+        """Test that reads over the rate are rejected until the window ends"""
+        url = reverse("weightlog-list")
+        with mock.patch.object(EndpointRateThrottle, "timer", return_value=600.0):
+            for _ in range(3):
+                self.assertEqual(self.client.get(url).status_code, 200)
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "60")
+
+        with mock.patch.object(EndpointRateThrottle, "timer", return_value=660.0):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_counter_per_user_and_window(self):
+        """Test that each user and window keeps a single counter"""
+        with mock.patch.object(EndpointRateThrottle, "timer", return_value=600.0):
+            self.client.get(reverse("weightlog-list"))
+            self.client.get(reverse("fitnessgoal-list"))
+
+        key = f"throttle_read_{self.user.pk}:10"
+        self.assertEqual(cache.get(key), 2)
+
+    def test_session_start_scope(self):
+        """Test that starting sessions has its own, stricter limit"""
+        plan = WorkoutPlan.objects.create(user=self.user, title="Plan")
+        url = reverse("workoutsession-start-session")
+
+        response = self.client.post(url, {"workout_plan_id": plan.pk}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post(url, {"workout_plan_id": plan.pk}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.post(
+            reverse("weightlog-list"), {"weight": 80}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_anonymous_limited_by_ip(self):
+        """Test that anonymous login attempts are limited per client address"""
+        self.client.force_authenticate(user=None)
+        data = {"email": "test@example.com", "password": "wrong"}
+
+        for _ in range(2):
+            response = self.client.post(reverse("login"), data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(reverse("login"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.post(
+            reverse("login"), data, format="json", REMOTE_ADDR="10.0.0.2"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(THROTTLE_ENABLED=False)
+    def test_throttling_can_be_disabled(self):
+        """Test that no request is throttled while throttling is switched off"""
+        url = reverse("weightlog-list")
+        for _ in range(5):
+            self.assertEqual(self.client.get(url).status_code, 200)
@@ -0,0 +1,98 @@
+from unittest import mock
+
+from rest_framework.test import APITestCase
+from django.core.cache import cache, caches
+from django.test import override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.cache import invalidate_user_cache, user_cache_key
+from apps.workout.instrumentation import registry
+from apps.workout.tiered_cache import TieredCache, _tiers
+
+
+class TieredCacheTests(APITestCase):
+    def setUp(self):
+        self.stats = cache.local.stats
+        self.stats.clear()
+
+    def test_reads_served_from_local_tier(self):
+        """Test that values found in the shared tier are kept in the process"""
+        caches["shared"].set("greeting", {"text": "hello"})
+
+        self.assertEqual(cache.get("greeting"), {"text": "hello"})
+        with mock.patch.object(caches["shared"], "get") as shared_get:
+            value = cache.get("greeting")
+        value["text"] = "changed"
+
+        shared_get.assert_not_called()
+        self.assertEqual(cache.get("greeting"), {"text": "hello"})
+        self.assertEqual(self.stats["shared", "hit"], 1)
+        self.assertEqual(self.stats["local", "hit"], 2)
+
+    def test_local_copies_expire(self):
+        """Test that local copies are refreshed from the shared tier"""
+        cache.set("answer", 1)
+        caches["shared"].set("answer", 2)
+        self.assertEqual(cache.get("answer"), 1)
+
+        with mock.patch("apps.workout.tiered_cache.time.monotonic") as monotonic:
+            monotonic.return_value = 10**9
+            self.assertEqual(cache.get("answer"), 2)
+
+        self.assertEqual(self.stats["evicted", "expired"], 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entries leave a full local tier"""
+        tiered = TieredCache(
+            "test-lru", {"OPTIONS": {"MAX_ENTRIES": 2, "SHARED": "shared"}}
+        )
+        self.addCleanup(_tiers.pop, "test-lru", None)
+        tiered.set("a", 1)
+        tiered.set("b", 2)
+        tiered.get("a")
+        tiered.set("c", 3)
+
+        self.assertEqual(list(tiered.local.entries), [":1:a", ":1:c"])
+        self.assertEqual(tiered.local.stats["evicted", "size"], 1)
+        self.assertEqual(tiered.get("b"), 2)
+
+    def test_counters_use_shared_tier(self):
+        """Test that counters are incremented in the shared tier"""
+        self.assertTrue(cache.add("counter", 0))
+        self.assertFalse(cache.add("counter", 5))
+        self.assertEqual(cache.incr("counter"), 1)
+        self.assertEqual(caches["shared"].incr("counter"), 2)
+
+        self.assertEqual(cache.get("counter"), 2)
+
+    def test_user_cache_keys(self):
+        """Test that invalidating a user changes only that user's keys"""
+        key = user_cache_key(1, "stats")
+        self.assertEqual(user_cache_key(1, "stats"), key)
+        other = user_cache_key(2, "stats")
+
+        invalidate_user_cache(1)
+
+        self.assertNotEqual(user_cache_key(1, "stats"), key)
+        self.assertEqual(user_cache_key(2, "stats"), other)
+
+    @override_settings(DEBUG=True)
+    def test_metrics_exposed(self):
+        """Test that hits, misses and evictions are served with the metrics"""
+        cache.get("missing")
+        user = User.objects.create_user(username="testuser", password="x")
+        self.client.force_authenticate(user=user)
+        registry.reset()
+
+        body = self.client.get(reverse("metrics")).content.decode()
+
+        self.assertIn(
+            'cache_requests_total{cache="default",tier="shared",result="miss"} 1',
+            body,
+        )
+        self.assertIn("# TYPE cache_evictions_total counter", body)
+        self.assertIn('cache_local_entries{cache="default"}', body)
+
+    def test_lru_tier_removed_after_test(self):
+        """Test that tiers made by other tests do not linger in the metrics"""
+        self.assertNotIn("test-lru", _tiers)
@@ -0,0 +1,81 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.authentication.models import ClaimsUser
+from apps.workout.models import WeightLog
+
+
+class ClaimsAuthenticationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        WeightLog.objects.create(user=self.user, weight=80)
+
+    def login(self):
+        response = self.client.post(
+            reverse("login"),
+            {"email": "test@example.com", "password": "TestPass123!"},
+            format="json",
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_no_user_query(self):
+        """Test that authenticated requests do not load the user"""
+        self.login()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("weightlog-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_create_with_claims_user(self):
+        """Test that the claims user can be assigned as the owner of new rows"""
+        self.login()
+
+        response = self.client.post(
+            reverse("weightlog-list"), {"weight": 79.5}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(WeightLog.objects.filter(user=self.user).count(), 2)
+
+    def test_inactive_claim_rejected(self):
+        """Test that tokens issued to inactive users are refused"""
+        token = RefreshToken.for_user(self.user)
+        token["username"] = self.user.username
+        token["is_active"] = False
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token.access_token}")
+
+        response = self.client.get(reverse("weightlog-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_without_claims_uses_cache(self):
+        """Test that tokens without user claims load the user once per worker"""
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        with self.assertNumQueries(2):
+            self.client.get(reverse("weightlog-list"))
+        with self.assertNumQueries(1):
+            self.client.get(reverse("weightlog-list"))
+
+        self.user.delete()
+        response = self.client.get(reverse("weightlog-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_full_user_loaded_on_demand(self):
+        """Test that reading a field missing from the claims loads the row once"""
+        user = ClaimsUser.from_claims(
+            self.user.pk, {"username": "testuser", "is_active": True}
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "test@example.com")
+            self.assertTrue(user.check_password("TestPass123!"))
+            self.assertEqual(user.get_deferred_fields(), set())
+        self.assertEqual(user, self.user)
@@ -0,0 +1,155 @@
+from datetime import timedelta
+from io import StringIO
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+from apps.workout.analytics import period_starts
+from apps.workout.models import (
+    WorkoutPlan,
+    Exercise,
+    WorkoutExercise,
+    WorkoutSession,
+    SessionExercise,
+    SetLog,
+    TrainingAggregate,
+)
+from apps.workout.services import finish_workout_session
+
+
+class TrainingAggregateTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+
+        exercise = Exercise.objects.create(
+            name="Rowing",
+            description="Rowing machine",
+            instructions="Pull",
+            target_muscles="back",
+            equipment="rower",
+        )
+        workout_plan = WorkoutPlan.objects.create(user=self.user, title="Cardio")
+        workout_exercise = WorkoutExercise.objects.create(
+            workout_plan=workout_plan, exercise=exercise, sets=2
+        )
+        self.session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=workout_plan, status="in_progress"
+        )
+        WorkoutSession.objects.filter(pk=self.session.pk).update(
+            started_at=timezone.now() - timedelta(minutes=45)
+        )
+        self.session.refresh_from_db()
+        session_exercise = SessionExercise.objects.create(
+            session=self.session, workout_exercise=workout_exercise, planned_sets=2
+        )
+        self.sets = [
+            SetLog.objects.create(session_exercise=session_exercise, set_number=n)
+            for n in (1, 2)
+        ]
+        self.url = reverse("trainingaggregate-list")
+        self.starts = period_starts(timezone.now())
+
+    def aggregate(self, period):
+        return TrainingAggregate.objects.get(
+            user=self.user, period=period, period_start=self.starts[period]
+        )
+
+    def test_completed_sets_and_session_are_aggregated(self):
+        """Test that sets and the finished session land in day and week rows"""
+        for set_log in self.sets:
+            self.client.post(
+                reverse("setlog-complete-set", kwargs={"pk": set_log.pk}),
+                {"repetitions": 10, "weight_kg": 20.0, "distance_meters": 500},
+                format="json",
+            )
+        self.client.post(
+            reverse("workoutsession-complete-session", kwargs={"pk": self.session.pk})
+        )
+
+        for period in ("day", "week"):
+            aggregate = self.aggregate(period)
+            self.assertEqual(aggregate.sessions_completed, 1)
+            self.assertEqual(aggregate.minutes, 45)
+            self.assertEqual(aggregate.sets, 2)
+            self.assertEqual(aggregate.repetitions, 20)
+            self.assertAlmostEqual(aggregate.volume_kg, 400.0)
+            self.assertEqual(aggregate.distance_meters, 1000)
+
+    def test_cancelled_session_is_aggregated(self):
+        """Test that cancelling counts the session as cancelled"""
+        response = self.client.post(
+            reverse("workoutsession-cancel-session", kwargs={"pk": self.session.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.aggregate("week").sessions_cancelled, 1)
+        self.assertEqual(self.aggregate("week").sessions_completed, 0)
+
+    def test_session_finished_once(self):
+        """Test that a racing second finish is rejected and not counted"""
+        stale = WorkoutSession.objects.get(pk=self.session.pk)
+
+        self.assertTrue(finish_workout_session(self.session, "completed"))
+        self.assertFalse(finish_workout_session(stale, "cancelled"))
+
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, "completed")
+        self.assertEqual(self.aggregate("day").sessions_completed, 1)
+        self.assertEqual(self.aggregate("day").sessions_cancelled, 0)
+
+    def test_list_returns_regular_series(self):
+        """Test that the endpoint zero-fills periods without training"""
+        finish_workout_session(self.session, "completed")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"period": "day", "periods": 7})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(len(results), 7)
+        self.assertEqual(results[-1]["period_start"], self.starts["day"].isoformat())
+        self.assertEqual(results[-1]["sessions_completed"], 1)
+        self.assertEqual(
+            [result["sessions_completed"] for result in results[:-1]], [0] * 6
+        )
+
+    def test_list_rejects_unknown_period(self):
+        """Test that only day and week buckets are accepted"""
+        response = self.client.get(self.url, {"period": "month"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_matches_incremental_aggregates(self):
+        """Test that rebuilding from history reproduces the live aggregates"""
+        for set_log in self.sets:
+            self.client.post(
+                reverse("setlog-complete-set", kwargs={"pk": set_log.pk}),
+                {"repetitions": 8, "weight_kg": 30.0, "duration_seconds": 40},
+                format="json",
+            )
+        finish_workout_session(self.session, "completed", "Done")
+        fields = [
+            "period",
+            "period_start",
+            "sessions_completed",
+            "minutes",
+            "sets",
+            "repetitions",
+            "volume_kg",
+            "duration_seconds",
+        ]
+        live = list(TrainingAggregate.objects.order_by("period").values(*fields))
+
+        out = StringIO()
+        call_command("rebuild_training_aggregates", batch_size=1, stdout=out)
+
+        self.assertIn("Rebuilt 2 training aggregates", out.getvalue())
+        self.assertEqual(
+            list(TrainingAggregate.objects.order_by("period").values(*fields)), live
+        )
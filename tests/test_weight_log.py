@@ -28,3 +28,24 @@ class WeightLogTests(APITestCase):
         self.assertEqual(log.user, self.user)
         self.assertEqual(log.weight, 75.5)
         self.assertEqual(log.date, date.today())
+
+    def test_list_weight_logs_with_cursor(self):
+        """Test paging through weight logs with a cursor instead of a count"""
+        WeightLog.objects.bulk_create(
+            [WeightLog(user=self.user, weight=70 + index) for index in range(25)]
+        )
+        WeightLog.objects.create(user=self.other_user, weight=90)
+
+        response = self.client.get(self.url, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertEqual(response.data["results"][0]["weight"], 94)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"], format="json")
+
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(response.data["results"][-1]["weight"], 70)
+        self.assertIsNone(response.data["next"])
@@ -0,0 +1,120 @@
+from datetime import date, timedelta
+
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from apps.workout.models import WeightLog
+from apps.workout.timeseries import lttb, moving_average
+
+
+class WeightSeriesTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="TestPass123!"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("weightlog-series")
+
+    def log(self, day, weight, user=None):
+        weight_log = WeightLog.objects.create(user=user or self.user, weight=weight)
+        # date is auto_now_add, so backdate it explicitly
+        WeightLog.objects.filter(pk=weight_log.pk).update(date=day)
+
+    def test_daily_buckets(self):
+        """Test that logs on the same day are averaged with min and max"""
+        self.log(date(2026, 1, 5), 80.0)
+        self.log(date(2026, 1, 5), 81.0)
+        self.log(date(2026, 1, 6), 79.0)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"window": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first, second = response.data["results"]
+        self.assertEqual(first["date"], "2026-01-05")
+        self.assertEqual(first["average"], 80.5)
+        self.assertEqual((first["minimum"], first["maximum"]), (80.0, 81.0))
+        self.assertEqual(first["count"], 2)
+        self.assertEqual(second["moving_average"], (80.5 + 79.0) / 2)
+
+    def test_weekly_and_monthly_buckets(self):
+        """Test coarser buckets start on Monday and on the first of the month"""
+        self.log(date(2026, 1, 7), 80.0)
+        self.log(date(2026, 1, 9), 78.0)
+        self.log(date(2026, 2, 3), 77.0)
+
+        response = self.client.get(self.url, {"bucket": "week"})
+        self.assertEqual(
+            [(point["date"], point["average"]) for point in response.data["results"]],
+            [("2026-01-05", 79.0), ("2026-02-02", 77.0)],
+        )
+
+        response = self.client.get(self.url, {"bucket": "month"})
+        self.assertEqual(
+            [point["date"] for point in response.data["results"]],
+            ["2026-01-01", "2026-02-01"],
+        )
+
+    def test_range_filter_and_privacy(self):
+        """Test start/end filters and that other users' logs are excluded"""
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="TestPass123!"
+        )
+        for offset in range(10):
+            self.log(date(2026, 3, 1) + timedelta(days=offset), 70.0 + offset)
+        self.log(date(2026, 3, 4), 100.0, user=other_user)
+
+        response = self.client.get(
+            self.url, {"start": "2026-03-03", "end": "2026-03-05"}
+        )
+
+        self.assertEqual(
+            [point["average"] for point in response.data["results"]],
+            [72.0, 73.0, 74.0],
+        )
+
+    def test_downsampled_to_points(self):
+        """Test that long histories are reduced to the requested point count"""
+        start = date(2024, 1, 1)
+        for offset in range(60):
+            weight = 90.0 if offset == 30 else 80.0 - offset * 0.1
+            self.log(start + timedelta(days=offset), weight)
+
+        response = self.client.get(self.url, {"points": 10})
+
+        results = response.data["results"]
+        self.assertEqual(len(results), 10)
+        self.assertEqual(results[0]["date"], "2024-01-01")
+        self.assertEqual(results[-1]["date"], "2024-02-29")
+        self.assertIn(90.0, [point["average"] for point in results])
+
+    def test_invalid_parameters(self):
+        """Test that unknown buckets and inverted ranges are rejected"""
+        response = self.client.get(self.url, {"bucket": "hour"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(
+            self.url, {"start": "2026-02-01", "end": "2026-01-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TimeSeriesHelperTests(SimpleTestCase):
+    def test_moving_average(self):
+        """Test the trailing moving average over a short window"""
+        self.assertEqual(moving_average([1, 2, 3, 4], 2), [1.0, 1.5, 2.5, 3.5])
+
+    def test_lttb_keeps_extremes(self):
+        """Test that LTTB keeps endpoints and the visually important spike"""
+        xs = list(range(100))
+        ys = [0.0] * 100
+        ys[42] = 10.0
+
+        kept = lttb(xs, ys, 5)
+
+        self.assertEqual(len(kept), 5)
+        self.assertEqual((kept[0], kept[-1]), (0, 99))
+        self.assertIn(42, kept)
+        self.assertEqual(lttb(xs[:4], ys[:4], 5), [0, 1, 2, 3])
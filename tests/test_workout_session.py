@@ -2,6 +2,9 @@ from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from apps.workout.services import active_session_guard, complete_set_log
 from apps.workout.models import (
     WorkoutPlan,
     Exercise,
@@ -76,6 +79,35 @@ class WorkoutSessionTests(APITestCase):
         for session_ex in session.session_exercises.all():
             self.assertEqual(session_ex.set_logs.count(), session_ex.planned_sets)
 
+    def test_start_session_query_count_independent_of_plan_size(self):
+        """Test that starting a session costs the same queries for any plan size"""
+        url = reverse("workoutsession-start-session")
+        data = {"workout_plan_id": self.workout_plan.id}
+
+        with CaptureQueriesContext(connection) as small_plan:
+            response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        WorkoutSession.objects.all().delete()
+
+        for index in range(8):
+            exercise = Exercise.objects.create(
+                name=f"Exercise {index}",
+                description="Extra exercise",
+                instructions="Repeat",
+                target_muscles="full body",
+            )
+            WorkoutExercise.objects.create(
+                workout_plan=self.workout_plan, exercise=exercise, sets=5
+            )
+
+        with CaptureQueriesContext(connection) as large_plan:
+            response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["session_exercises"]), 10)
+        self.assertEqual(SetLog.objects.count(), 3 + 4 + 8 * 5)
+        self.assertEqual(len(small_plan), len(large_plan))
+
     def test_cannot_start_multiple_sessions(self):
         """Test that user cannot have multiple active sessions"""
         url = reverse("workoutsession-start-session")
@@ -88,7 +120,47 @@ class WorkoutSessionTests(APITestCase):
         response = self.client.post(url, data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("workout_plan_id", response.data)
         self.assertEqual(WorkoutSession.objects.count(), 1)
+        self.assertEqual(SessionExercise.objects.count(), 2)
+
+    def test_database_rejects_second_active_session(self):
+        """Test that the database allows only one active session per user"""
+        WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="in_progress"
+        )
+        WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="completed"
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            WorkoutSession.objects.create(
+                user=self.user, workout_plan=self.workout_plan, status="in_progress"
+            )
+
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="TestPass123!"
+        )
+        other_plan = WorkoutPlan.objects.create(user=other_user, title="Other")
+        WorkoutSession.objects.create(
+            user=other_user, workout_plan=other_plan, status="in_progress"
+        )
+        self.assertEqual(WorkoutSession.objects.active().count(), 2)
+
+    def test_can_start_session_after_completing_previous(self):
+        """Test that completing a session frees the active session slot"""
+        url = reverse("workoutsession-start-session")
+        data = {"workout_plan_id": self.workout_plan.id}
+        response = self.client.post(url, data, format="json")
+        complete_url = reverse(
+            "workoutsession-complete-session", kwargs={"pk": response.data["id"]}
+        )
+        self.client.post(complete_url, {}, format="json")
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(WorkoutSession.objects.active().count(), 1)
 
     def test_get_active_session(self):
         """Test retrieving the active workout session"""
@@ -161,6 +233,34 @@ class WorkoutSessionTests(APITestCase):
         self.assertEqual(set_log.weight_kg, 20.0)
         self.assertIsNotNone(set_log.completed_at)
 
+    def test_concurrent_completion_counts_set_once(self):
+        """Test that a stale second completion of a set is a no-op"""
+        session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="in_progress"
+        )
+        session_ex = SessionExercise.objects.create(
+            session=session,
+            workout_exercise=self.workout_ex1,
+            order=0,
+            planned_sets=1,
+        )
+        SetLog.objects.create(session_exercise=session_ex, set_number=1)
+        first_tap = SetLog.objects.get(session_exercise=session_ex)
+        second_tap = SetLog.objects.get(session_exercise=session_ex)
+
+        exercise_id = self.workout_ex1.exercise_id
+        self.assertTrue(
+            complete_set_log(first_tap, self.user.pk, exercise_id, repetitions=10)
+        )
+        self.assertFalse(
+            complete_set_log(second_tap, self.user.pk, exercise_id, repetitions=12)
+        )
+
+        session_ex.refresh_from_db()
+        self.assertEqual(session_ex.completed_sets, 1)
+        self.assertEqual(session_ex.status, "completed")
+        self.assertEqual(SetLog.objects.get().repetitions, 10)
+
     def test_cannot_complete_set_twice(self):
         """Test that a set cannot be completed twice"""
         session = WorkoutSession.objects.create(
@@ -264,6 +364,77 @@ class WorkoutSessionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 2)
 
+    def test_list_session_summaries(self):
+        """Test listing sessions as aggregated summaries"""
+        session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="completed"
+        )
+        session_ex = SessionExercise.objects.create(
+            session=session,
+            workout_exercise=self.workout_ex1,
+            order=0,
+            planned_sets=3,
+            status="completed",
+        )
+        SessionExercise.objects.create(
+            session=session,
+            workout_exercise=self.workout_ex2,
+            order=1,
+            planned_sets=1,
+        )
+        SetLog.objects.create(
+            session_exercise=session_ex,
+            set_number=1,
+            repetitions=10,
+            weight_kg=20.0,
+            completed=True,
+        )
+        SetLog.objects.create(
+            session_exercise=session_ex,
+            set_number=2,
+            repetitions=8,
+            weight_kg=25.0,
+            completed=True,
+        )
+        SetLog.objects.create(session_exercise=session_ex, set_number=3)
+        SetLog.objects.create(
+            session_exercise=session.session_exercises.get(order=1), set_number=1
+        )
+
+        response = self.client.get(self.session_url, {"view": "summary"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        summary = response.data["results"][0]
+        self.assertNotIn("session_exercises", summary)
+        self.assertEqual(summary["workout_plan_title"], "Test Workout")
+        self.assertEqual(summary["exercise_count"], 2)
+        self.assertEqual(summary["completed_exercise_count"], 1)
+        self.assertEqual(summary["set_count"], 4)
+        self.assertEqual(summary["completed_set_count"], 2)
+        self.assertEqual(summary["total_repetitions"], 18)
+        self.assertEqual(summary["total_volume_kg"], 400.0)
+        self.assertEqual(summary["completion_ratio"], 0.5)
+
+    def test_session_summary_without_completed_sets(self):
+        """Test that a session without completed sets has zero totals"""
+        session = WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan
+        )
+        session_ex = SessionExercise.objects.create(
+            session=session, workout_exercise=self.workout_ex1, order=0, planned_sets=3
+        )
+        SetLog.objects.create(session_exercise=session_ex, set_number=1)
+
+        response = self.client.get(self.session_url, {"view": "summary"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        summary = response.data["results"][0]
+        self.assertEqual(summary["completed_set_count"], 0)
+        self.assertEqual(summary["total_repetitions"], 0)
+        self.assertEqual(summary["total_volume_kg"], 0.0)
+        self.assertEqual(summary["total_duration_seconds"], 0)
+        self.assertEqual(summary["total_distance_meters"], 0)
+
     def test_unauthenticated_cannot_start_session(self):
         """Test that unauthenticated users cannot start sessions"""
         self.client.force_authenticate(user=None)
@@ -362,3 +533,39 @@ class WorkoutSessionTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["exercise_name"], "Push Ups")
+
+    def test_create_second_active_session_rejected(self):
+        """Test that creating an in-progress session beside an active one is a 400"""
+        WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="in_progress"
+        )
+        data = {"workout_plan": self.workout_plan.id, "status": "in_progress"}
+        response = self.client.post(self.session_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["status"][0], "You already have an active workout session."
+        )
+
+    def test_reopen_session_beside_active_one_rejected(self):
+        """Test that reopening a finished session beside an active one is a 400"""
+        WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="in_progress"
+        )
+        finished = WorkoutSession.objects.create(
+            user=self.user, workout_plan=self.workout_plan, status="completed"
+        )
+        url = reverse("workoutsession-detail", kwargs={"pk": finished.pk})
+        response = self.client.patch(url, {"status": "in_progress"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        finished.refresh_from_db()
+        self.assertEqual(finished.status, "completed")
+
+    def test_other_integrity_errors_not_reported_as_active_session(self):
+        """Test that only the active session constraint maps to ActiveSessionExists"""
+        with self.assertRaises(IntegrityError):
+            with active_session_guard(self.user):
+                WorkoutSession.objects.create(
+                    user=self.user, workout_plan=None, status="in_progress"
+                )